@@ -5,14 +5,12 @@ from datetime import timedelta
 
 import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import (
-    aiohttp_client,
-    config_entry_oauth2_flow,
-)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_entry_oauth2_flow
 
 from . import api, config_flow
+from .backfill_checkpoints import BackfillCheckpoints
 from .const import (
     BATTERY,
     BATTERY_CHARTS,
@@ -45,12 +43,17 @@ from .coordinators.electricity_data_coordinator import ElectricityDataUpdateCoor
 from .coordinators.electricity_home_consumption_data_coordinator import (
     ElectricityHomeConsumptionDataUpdateCoordinator,
 )
-from .coordinators.electricity_prices_data_coordinator import ElectricityPricesDataUpdateCoordinator
 from .coordinators.gas_data_coordinator import GasDataUpdateCoordinator
-from .coordinators.gas_prices_data_coordinator import GasPricesDataUpdateCoordinator
 from .coordinators.pv_data_coordinator import PvDataUpdateCoordinator
+from .coordinators.statistics import StatisticBaselines
 from .coordinators.summary_data_coordinator import SummaryDataUpdateCoordinator
-from .services import async_setup_fetch_statistics_service
+from .response_cache import ResponseCache
+from .services import (
+    async_setup_fetch_statistics_service,
+    async_setup_find_price_windows_service,
+    async_setup_get_price_forecast_service,
+    async_setup_manage_statistics_backfill_service,
+)
 
 PLATFORMS = [
     Platform.SENSOR,
@@ -73,22 +76,40 @@ async def async_setup(
     """Set up the Zonneplan component."""
     hass.data.setdefault(DOMAIN, {})
 
-    config_flow.ZonneplanLoginFlowHandler.async_register_implementation(
-        hass,
-        api.ZonneplanOAuth2Implementation(api.AsyncConfigEntryAuth(aiohttp_client.async_get_clientsession(hass))),
-    )
+    _async_register_implementation(hass)
 
     async_setup_fetch_statistics_service(hass)
+    async_setup_manage_statistics_backfill_service(hass)
+    async_setup_find_price_windows_service(hass)
+    async_setup_get_price_forecast_service(hass)
 
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) -> bool:  # noqa: PLR0912 PLR0915
     """Set up Zonneplan from a config entry."""
+    client_session = api.async_acquire_client_session(hass)
+    # Also released when the setup fails, the session is closed once no entry uses it anymore
+    entry.async_on_unload(lambda: api.async_release_client_session(hass))
+
+    # (Re)register so token refreshes use the current shared client session
+    _async_register_implementation(hass)
     implementation = await config_entry_oauth2_flow.async_get_config_entry_implementation(hass, entry)
 
     session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
-    zonneplan_api = api.AsyncConfigEntryAuth(aiohttp_client.async_get_clientsession(hass), session)
+
+    response_cache = ResponseCache(hass, entry.entry_id)
+    await response_cache.async_load()
+    # Usage times of the cached responses are only kept in memory until the entry unloads or Home Assistant stops
+    entry.async_on_unload(response_cache.async_save)
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, response_cache.async_save))
+
+    backfill_checkpoints = BackfillCheckpoints(hass, entry.entry_id)
+    await backfill_checkpoints.async_load()
+    # Written before a reload loads them again, the backfills are stopped by async_unload_entry first
+    entry.async_on_unload(backfill_checkpoints.async_save)
+
+    zonneplan_api = api.AsyncConfigEntryAuth(client_session, session, response_cache)
 
     account_coordinator = AccountDataUpdateCoordinator(hass, zonneplan_api)
     await account_coordinator.async_config_entry_first_refresh()
@@ -116,16 +137,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) ->
                 contracts[contract["type"]].append(contract)
 
             if ELECTRICITY in contracts:
+                account_coordinator.add_contract(connection["uuid"], ELECTRICITY, contracts[ELECTRICITY][0])
                 account_coordinator.add_coordinator(
                     connection["uuid"],
                     ELECTRICITY_PRICES,
-                    ElectricityPricesDataUpdateCoordinator(
-                        hass,
-                        zonneplan_api,
-                        address_group["uuid"],
-                        connection["uuid"],
-                        contracts[ELECTRICITY][0],
-                    ),
+                    account_coordinator.electricity_prices,
                 )
                 account_coordinator.add_coordinator(
                     connection["uuid"],
@@ -140,16 +156,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) ->
                 )
 
             if GAS in contracts:
+                account_coordinator.add_contract(connection["uuid"], GAS, contracts[GAS][0])
                 account_coordinator.add_coordinator(
                     connection["uuid"],
                     GAS_PRICES,
-                    GasPricesDataUpdateCoordinator(
-                        hass,
-                        zonneplan_api,
-                        address_group["uuid"],
-                        connection["uuid"],
-                        contracts[GAS][0],
-                    ),
+                    account_coordinator.gas_prices,
                 )
 
             if PV_INSTALL in contracts:
@@ -166,6 +177,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) ->
                 )
 
             if P1_INSTALL in contracts:
+                # Electricity and gas statistics of a connection load their baselines together
+                statistic_baselines = StatisticBaselines(hass)
                 account_coordinator.add_coordinator(
                     connection["uuid"],
                     P1_ELECTRICITY,
@@ -175,6 +188,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) ->
                         address_group["uuid"],
                         connection["uuid"],
                         contracts[P1_INSTALL],
+                        backfill_checkpoints,
+                        statistic_baselines,
                     ),
                 )
 
@@ -203,6 +218,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) ->
                             address_group["uuid"],
                             connection["uuid"],
                             contracts[P1_INSTALL],
+                            backfill_checkpoints,
+                            statistic_baselines,
                         ),
                     )
 
@@ -267,6 +284,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) ->
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Continue statistics backfills that were interrupted by a restart or gave up
+    for connection_coordinators in account_coordinator.coordinators.values():
+        for p1_coordinator in (connection_coordinators.p1_electricity, connection_coordinators.p1_gas):
+            if p1_coordinator is not None:
+                entry.async_create_background_task(
+                    hass,
+                    p1_coordinator.statistics_service.async_resume_backfill(include_paused=False),
+                    f"{DOMAIN} resume statistics backfill {p1_coordinator.connection_uuid}",
+                )
+
     return True
 
 
@@ -274,6 +301,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) -
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        # Stop running backfills, so a reload doesn't resume a backfill that is still running
+        for connection_coordinators in entry.runtime_data.coordinators.values():
+            for p1_coordinator in (connection_coordinators.p1_electricity, connection_coordinators.p1_gas):
+                if p1_coordinator is not None:
+                    await p1_coordinator.statistics_service.async_interrupt_backfill()
         entry.runtime_data.coordinators.clear()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ZonneplanConfigEntry) -> None:
+    """Remove persisted data of a removed config entry."""
+    await ResponseCache(hass, entry.entry_id).async_remove()
+    await BackfillCheckpoints(hass, entry.entry_id).async_remove()
+
+
+@callback
+def _async_register_implementation(hass: HomeAssistant) -> None:
+    config_flow.ZonneplanLoginFlowHandler.async_register_implementation(
+        hass,
+        api.ZonneplanOAuth2Implementation(api.AsyncConfigEntryAuth(api.async_get_client_session(hass))),
+    )
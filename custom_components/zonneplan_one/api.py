@@ -1,19 +1,46 @@
 """API for Zonneplan bound to Home Assistant OAuth."""
 
+import asyncio
+import copy
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import date
+from functools import partial
 from http import HTTPStatus
 from typing import Any
 
-from aiohttp import ClientResponseError, ClientSession
+from aiohttp import ClientResponse, ClientResponseError, ClientSession, ClientTimeout, TCPConnector
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import get_default_context
 
 from .const import DOMAIN
+from .response_cache import ResponseCache
+from .response_diagnostics import ResponseDiagnostics
 from .zonneplan_api.api import ZonneplanApi
+from .zonneplan_api.rate_limiter import RateLimiter, parse_int_header
 from .zonneplan_api.types import ZonneplanAccountsData
 
 _LOGGER = logging.getLogger(__name__)
 
+_DATA_CLIENT_SESSION = "client_session"
+_DATA_CLIENT_SESSION_USERS = "client_session_users"
+_DATA_CLIENT_SESSION_CLOSE_LISTENER = "client_session_close_listener"
+
+# All calls go to a single host, keep a small pool of warm connections to it
+_CONNECTOR_LIMIT_PER_HOST = 4
+_CONNECTOR_KEEPALIVE_TIMEOUT = 60
+_CONNECTOR_DNS_CACHE_TTL = 300
+
+# Statistics fetch a dated chart per day, for diagnostics the last two days (today and yesterday) are enough
+_DIAGNOSTICS_ENDPOINT_LIMITS = {
+    "/electricity-delivered/charts/hours": 2,
+    "/gas/charts/hours": 2,
+}
+
 
 class ZonneplanApiError(Exception):
     """Exception to indicate a general API error."""
@@ -28,30 +55,91 @@ class ZonneplanRateLimitError(ClientResponseError):
         self.retry_after = retry_after
 
 
-def _parse_retry_after(value: str | None) -> int | None:
-    """Parse Retry-After header value as seconds."""
-    if value is None:
-        return None
-    try:
-        return int(value)
-    except ValueError:
-        return None
+@callback
+def async_get_client_session(hass: HomeAssistant) -> ClientSession:
+    """
+    Return the client session shared by all Zonneplan API calls.
+
+    The session is created on first use and reuses its connections for the data
+    requests and the login and token calls, so polls and token refreshes don't
+    need a new TLS handshake.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: ClientSession | None = domain_data.get(_DATA_CLIENT_SESSION)
+    if session is not None and not session.closed:
+        return session
+
+    connector = TCPConnector(
+        ssl=get_default_context(),
+        limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+        keepalive_timeout=_CONNECTOR_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=_CONNECTOR_DNS_CACHE_TTL,
+        enable_cleanup_closed=True,
+    )
+    session = ClientSession(connector=connector, timeout=ClientTimeout(total=30))
+    domain_data[_DATA_CLIENT_SESSION] = session
+
+    if _DATA_CLIENT_SESSION_CLOSE_LISTENER not in domain_data:
+
+        @callback
+        def _async_close_session(_: Event) -> None:
+            current: ClientSession | None = domain_data.pop(_DATA_CLIENT_SESSION, None)
+            if current is not None and not current.closed:
+                hass.async_create_task(current.close())
+
+        domain_data[_DATA_CLIENT_SESSION_CLOSE_LISTENER] = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+
+    return session
+
+
+@callback
+def async_acquire_client_session(hass: HomeAssistant) -> ClientSession:
+    """Return the shared client session and count the config entry that uses it."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[_DATA_CLIENT_SESSION_USERS] = domain_data.get(_DATA_CLIENT_SESSION_USERS, 0) + 1
+    return async_get_client_session(hass)
+
+
+async def async_release_client_session(hass: HomeAssistant) -> None:
+    """
+    Stop counting a config entry as user of the shared client session.
+
+    The session is closed when the last config entry released it, a new one is created on next use.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    users = max(domain_data.get(_DATA_CLIENT_SESSION_USERS, 0) - 1, 0)
+    domain_data[_DATA_CLIENT_SESSION_USERS] = users
+    if users:
+        return
+
+    session: ClientSession | None = domain_data.pop(_DATA_CLIENT_SESSION, None)
+    if session is not None and not session.closed:
+        await session.close()
 
 
 class AsyncConfigEntryAuth(ZonneplanApi):
-    diagnostics: dict[str, Any]
+    diagnostics: ResponseDiagnostics
 
     def __init__(
         self,
         websession: ClientSession,
         oauth_session: config_entry_oauth2_flow.OAuth2Session = None,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         """Initialize Zonneplan auth."""
         super().__init__(websession)
         self._oauth_session = oauth_session
+        self._response_cache = response_cache
+
+        self.diagnostics = ResponseDiagnostics(endpoint_limits=_DIAGNOSTICS_ENDPOINT_LIMITS)
+        # In-flight requests by path and ignore_etag
+        self._pending_requests: dict[tuple[str, bool], asyncio.Task[dict | None]] = {}
+        self._rate_limiter = RateLimiter()
 
-        self.diagnostics = {}
-        self._etags = {}
+    @property
+    def rate_limit_tokens(self) -> float:
+        """Return the number of requests that can be made right away within the rate limit."""
+        return self._rate_limiter.tokens
 
     async def async_get_access_token(self) -> str:
         """Return a valid access token."""
@@ -95,58 +183,110 @@ class AsyncConfigEntryAuth(ZonneplanApi):
         return await self._async_get(f"api/consumer-prices/charts/{chart_name}")
 
     async def _async_get(self, path: str, *, ignore_etag: bool = False) -> dict | None:
-        _LOGGER.info("fetch: %s", path)
-
-        headers = dict(self._request_headers)
-        url = "https://app-api.zonneplan.nl/" + path
-
-        if not ignore_etag and self._etags.get(url):
-            headers["If-None-Match"] = self._etags[url]
-
+        """
+        Get the data of an API endpoint.
+
+        When the API responds with 304 Not Modified the cached data of the previous response is returned,
+        None is only returned when there is no cached response. With ignore_etag the cache is bypassed.
+
+        Concurrent calls for the same path and ignore_etag share one request, the calls that joined it
+        receive a copy of the data. A call that bypasses the cache never joins a request that may be
+        answered from it.
+        """
+        key = (path, ignore_etag)
+        joined = (pending := self._pending_requests.get(key)) is not None
+        if joined:
+            _LOGGER.debug("fetch: %s (joined in-flight request)", path)
+        else:
+            pending = asyncio.get_running_loop().create_task(
+                self._async_fetch(path, ignore_etag=ignore_etag),
+                name=f"{DOMAIN} fetch {path}",
+            )
+            self._pending_requests[key] = pending
+            pending.add_done_callback(partial(self._request_done, key))
+
+        # Shielded, so a cancelled caller doesn't cancel the request for the other callers
+        result = await asyncio.shield(pending)
+        return copy.deepcopy(result) if joined else result
+
+    def _request_done(self, key: tuple[str, bool], task: asyncio.Task[dict | None]) -> None:
+        if self._pending_requests.get(key) is task:
+            del self._pending_requests[key]
+        if not task.cancelled():
+            # Mark as retrieved, it is raised to the callers that still wait
+            task.exception()
+
+    @asynccontextmanager
+    async def _async_request(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[ClientResponse]:
+        """
+        Send an authorized request over the pooled client session, within the rate limit.
+
+        The response is released when the context exits, so its connection returns to the pool.
+        """
+        headers = {**self._request_headers, **kwargs.pop("headers", {})}
         _LOGGER.debug("ZonneplanAPI request header: %s", headers)
-        response = await self._oauth_session.async_request(
-            "GET",
-            url,
-            headers=headers,
-        )
+        headers["authorization"] = f"Bearer {await self.async_get_access_token()}"
 
-        _LOGGER.debug("ZonneplanAPI response header: %s", response.headers)
+        await self._rate_limiter.acquire()
+        async with self._session.request(method, url, headers=headers, **kwargs) as response:
+            self._rate_limiter.update(response.status, response.headers)
+            _LOGGER.debug("ZonneplanAPI response header: %s", response.headers)
+            yield response
 
-        ratelimit_remaining = response.headers.get("x-ratelimit-remaining")
-        if ratelimit_remaining is not None:
-            _LOGGER.info("ZonneplanAPI response status: %s (ratelimit-remaining=%s) for %s", response.status, ratelimit_remaining, path)
+    async def _async_fetch(self, path: str, *, ignore_etag: bool) -> dict | None:
+        _LOGGER.info("fetch: %s", path)
 
-            if int(ratelimit_remaining) == 0:
-                _LOGGER.warning(
-                    "ZonneplanAPI ratelimit, retry in: %s seconds",
-                    _parse_retry_after(response.headers.get("Retry-After")),
+        headers = {}
+        url = "https://app-api.zonneplan.nl/" + path
+
+        use_cache = not ignore_etag and self._response_cache is not None
+        cached = self._response_cache.get(url) if use_cache else None
+        if cached:
+            headers["If-None-Match"] = cached.etag
+
+        async with self._async_request("GET", url, headers=headers) as response:
+            ratelimit_remaining = response.headers.get("x-ratelimit-remaining")
+            if ratelimit_remaining is not None:
+                _LOGGER.info("ZonneplanAPI response status: %s (ratelimit-remaining=%s) for %s", response.status, ratelimit_remaining, path)
+
+                if int(ratelimit_remaining) == 0:
+                    _LOGGER.warning(
+                        "ZonneplanAPI ratelimit, retry in: %s seconds",
+                        parse_int_header(response.headers.get("Retry-After")),
+                    )
+
+            else:
+                _LOGGER.info("ZonneplanAPI response status: %s for %s", response.status, path)
+
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                if not cached:
+                    return None
+                self._response_cache.async_touch(url)
+                return cached.data()
+
+            if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                raise ZonneplanRateLimitError(
+                    request_info=response.request_info,
+                    history=response.history,
+                    status=response.status,
+                    message="Rate limit exceeded",
+                    headers=response.headers,
+                    retry_after=parse_int_header(response.headers.get("Retry-After")),
                 )
 
-        else:
-            _LOGGER.info("ZonneplanAPI response status: %s for %s", response.status, path)
-
-        if response.status == HTTPStatus.NOT_MODIFIED:
-            return None
-
-        if response.status == HTTPStatus.TOO_MANY_REQUESTS:
-            raise ZonneplanRateLimitError(
-                request_info=response.request_info,
-                history=response.history,
-                status=response.status,
-                message="Rate limit exceeded",
-                headers=response.headers,
-                retry_after=_parse_retry_after(response.headers.get("Retry-After")),
-            )
+            response.raise_for_status()
 
-        response.raise_for_status()
+            # Read the raw body once, it is decoded with orjson and stored as-is for diagnostics
+            body = await response.read()
 
-        response_json = await response.json()
+        response_json = json_loads(body)
 
-        _LOGGER.debug("ZonneplanAPI response body: %s", response_json)
+        _LOGGER.debug("ZonneplanAPI response body: %s", body)
 
-        self.diagnostics[path] = response_json
+        self.diagnostics.add(path, body)
 
-        self._etags[url] = response.headers.get("ETag")
+        if use_cache:
+            self._response_cache.async_set(url, response.headers.get("ETag"), response_json["data"])
 
         return response_json["data"]
 
@@ -155,33 +295,27 @@ class AsyncConfigEntryAuth(ZonneplanApi):
             params = {}
         _LOGGER.info("POST: %s?%s", path, params)
 
-        response = await self._oauth_session.async_request(
-            "POST",
-            "https://app-api.zonneplan.nl/connections/" + connection_uuid + path,
-            json=params,
-            headers=dict(self._request_headers),
-        )
-
-        _LOGGER.debug("ZonneplanAPI response header: %s", response.headers)
-        _LOGGER.debug("ZonneplanAPI response status: %s", response.status)
-
-        if response.status == HTTPStatus.TOO_MANY_REQUESTS:
-            raise ZonneplanRateLimitError(
-                request_info=response.request_info,
-                history=response.history,
-                status=response.status,
-                message="Rate limit exceeded",
-                headers=response.headers,
-                retry_after=_parse_retry_after(response.headers.get("Retry-After")),
-            )
+        url = "https://app-api.zonneplan.nl/connections/" + connection_uuid + path
+        async with self._async_request("POST", url, json=params) as response:
+            _LOGGER.debug("ZonneplanAPI response status: %s", response.status)
+
+            if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                raise ZonneplanRateLimitError(
+                    request_info=response.request_info,
+                    history=response.history,
+                    status=response.status,
+                    message="Rate limit exceeded",
+                    headers=response.headers,
+                    retry_after=parse_int_header(response.headers.get("Retry-After")),
+                )
 
-        response.raise_for_status()
+            response.raise_for_status()
 
-        # 204 No Content successful response
-        if response.status == HTTPStatus.NO_CONTENT:
-            return {"ok": True}
+            # 204 No Content successful response
+            if response.status == HTTPStatus.NO_CONTENT:
+                return {"ok": True}
 
-        response_json = await response.json()
+            response_json = await response.json()
 
         _LOGGER.debug("ZonneplanAPI response body: %s", response_json)
 
@@ -0,0 +1,121 @@
+"""Persistent progress of statistics backfills."""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+_SAVE_DELAY = 5
+
+BACKFILL_RUNNING = "running"
+BACKFILL_PAUSED = "paused"
+BACKFILL_FAILED = "failed"
+
+
+@dataclass
+class ChannelCheckpoint:
+    last_time: datetime
+    total_sum: float
+    last_state_value: float | None
+
+
+@dataclass
+class BackfillCheckpoint:
+    start_date: datetime
+    # First day that still has to be ingested
+    next_day: datetime
+    status: str = BACKFILL_RUNNING
+    channels: dict[str, ChannelCheckpoint] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BackfillCheckpoint":
+        return cls(
+            start_date=dt_util.parse_datetime(data["start_date"]),
+            next_day=dt_util.parse_datetime(data["next_day"]),
+            status=data.get("status", BACKFILL_RUNNING),
+            channels={
+                key: ChannelCheckpoint(
+                    last_time=dt_util.parse_datetime(channel["last_time"]),
+                    total_sum=channel["total_sum"],
+                    last_state_value=channel["last_state_value"],
+                )
+                for key, channel in data.get("channels", {}).items()
+            },
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "start_date": self.start_date.isoformat(),
+            "next_day": self.next_day.isoformat(),
+            "status": self.status,
+            "channels": {
+                key: {
+                    "last_time": channel.last_time.isoformat(),
+                    "total_sum": channel.total_sum,
+                    "last_state_value": channel.last_state_value,
+                }
+                for key, channel in self.channels.items()
+            },
+        }
+
+
+class BackfillCheckpoints:
+    """
+    Checkpoints of the statistics backfills of a config entry, persisted between restarts.
+
+    A checkpoint is saved after every batch of days written to the recorder and removed when
+    the backfill completed or was cancelled, so an interrupted backfill can continue where it stopped.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.backfill_checkpoints")
+        self._checkpoints: dict[str, BackfillCheckpoint] = {}
+
+    async def async_load(self) -> None:
+        """Load the checkpoints, dropping the ones that can't be parsed."""
+        stored = await self._store.async_load() or {}
+
+        for backfill_id, item in stored.items():
+            try:
+                self._checkpoints[backfill_id] = BackfillCheckpoint.from_dict(item)
+            except (KeyError, TypeError, AttributeError):
+                _LOGGER.warning("Dropping invalid backfill checkpoint for %s: %s", backfill_id, item)
+
+        _LOGGER.debug("Loaded %s backfill checkpoints", len(self._checkpoints))
+
+    async def async_remove(self) -> None:
+        """Remove the persisted checkpoints."""
+        self._checkpoints.clear()
+        await self._store.async_remove()
+
+    async def async_save(self) -> None:
+        """Write the checkpoints now instead of after the save delay."""
+        await self._store.async_save(self._data_to_save())
+
+    def get(self, backfill_id: str) -> BackfillCheckpoint | None:
+        return self._checkpoints.get(backfill_id)
+
+    @callback
+    def async_set(self, backfill_id: str, checkpoint: BackfillCheckpoint) -> None:
+        """Store the checkpoint of a backfill."""
+        self._checkpoints[backfill_id] = checkpoint
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    @callback
+    def async_delete(self, backfill_id: str) -> None:
+        """Remove the checkpoint of a completed or cancelled backfill."""
+        if self._checkpoints.pop(backfill_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        return {backfill_id: checkpoint.as_dict() for backfill_id, checkpoint in self._checkpoints.items()}
@@ -24,6 +24,7 @@ from .coordinators.account_data_coordinator import ZonneplanConfigEntry
 from .coordinators.battery_data_coordinator import BatteryDataUpdateCoordinator
 from .coordinators.charge_point_data_coordinator import ChargePointDataUpdateCoordinator
 from .coordinators.pv_data_coordinator import PvDataUpdateCoordinator
+from .coordinators.value_path import compile_value_path
 from .coordinators.zonneplan_data_update_coordinator import (
     ZonneplanDataUpdateCoordinator,
 )
@@ -105,6 +106,13 @@ class ZonneplanBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._install_index = install_index
         self.entity_description = description
 
+        self._value_path = compile_value_path(description.key.format(install_index=install_index))
+        self._attribute_paths = [
+            (attribute.label, compile_value_path(attribute.key.format(install_index=install_index)))
+            for attribute in description.attributes or []
+        ]
+        self.coordinator_context = frozenset((self._value_path, *(value_path for _, value_path in self._attribute_paths)))
+
     @property
     def install_uuid(self) -> str:
         """Return install ID."""
@@ -128,25 +136,21 @@ class ZonneplanBinarySensor(CoordinatorEntity, BinarySensorEntity):
         super()._handle_coordinator_update()
 
     def _value_from_coordinator(self) -> bool:
-        is_on = self.coordinator.get_data_value(
-            self.entity_description.key.format(install_index=self._install_index),
-        )
+        is_on = self.coordinator.get_data_value(self._value_path)
 
         _LOGGER.debug("update binary sensor %s [%s]", self.unique_id, is_on)
         return bool(is_on)
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        if not self.entity_description.attributes:
+        if not self._attribute_paths:
             return None
 
         attrs = {}
-        for attribute in self.entity_description.attributes:
-            value = self.coordinator.get_data_value(
-                attribute.key.format(install_index=self._install_index),
-            )
-            _LOGGER.debug("Update %s.attribute[%s]: %s", self.unique_id, attribute.label, value)
-            attrs[attribute.label] = value
+        for label, value_path in self._attribute_paths:
+            value = self.coordinator.get_data_value(value_path)
+            _LOGGER.debug("Update %s.attribute[%s]: %s", self.unique_id, label, value)
+            attrs[label] = value
 
         return attrs
 
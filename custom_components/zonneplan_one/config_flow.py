@@ -7,10 +7,11 @@ from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL
-from homeassistant.helpers import aiohttp_client, config_entry_oauth2_flow
+from homeassistant.core import callback
+from homeassistant.helpers import config_entry_oauth2_flow
 
-from .api import AsyncConfigEntryAuth, ZonneplanOAuth2Implementation
-from .const import DOMAIN
+from .api import AsyncConfigEntryAuth, ZonneplanOAuth2Implementation, async_get_client_session
+from .const import CONF_FORECAST_ATTRIBUTES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +35,12 @@ class ZonneplanLoginFlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowHandl
         """Return logger."""
         return logging.getLogger(__name__)
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> "ZonneplanOptionsFlowHandler":  # noqa: ARG004
+        """Get the options flow for this handler."""
+        return ZonneplanOptionsFlowHandler()
+
     async def async_step_reauth(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
         """Perform reauth upon an API authentication error."""
         _LOGGER.debug("reauth %s", user_input)
@@ -55,7 +62,7 @@ class ZonneplanLoginFlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowHandl
 
         self.async_register_implementation(
             self.hass,
-            ZonneplanOAuth2Implementation(AsyncConfigEntryAuth(aiohttp_client.async_get_clientsession(self.hass))),
+            ZonneplanOAuth2Implementation(AsyncConfigEntryAuth(async_get_client_session(self.hass))),
         )
 
         return await super().async_step_user(user_input)
@@ -126,3 +133,24 @@ class ZonneplanLoginFlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowHandl
 
         self.logger.info("Create entry: %s", data["email"])
         return self.async_create_entry(title=data["email"], data=data)
+
+
+class ZonneplanOptionsFlowHandler(config_entries.OptionsFlowWithReload):
+    """Options flow for Zonneplan."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_FORECAST_ATTRIBUTES,
+                        default=self.config_entry.options.get(CONF_FORECAST_ATTRIBUTES, True),
+                    ): bool,
+                }
+            ),
+        )
@@ -3,10 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
 
-import homeassistant.util.dt as dt_util
 from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
@@ -29,9 +26,6 @@ from homeassistant.const import (
     UnitOfVolume,
 )
 
-if TYPE_CHECKING:
-    from collections.abc import Callable
-
 DOMAIN = "zonneplan_one"
 
 GAS = "gas"
@@ -51,6 +45,9 @@ BATTERY_CHARTS = "battery_charts"
 NONE_IS_ZERO = "none-is-zero"
 NONE_USE_PREVIOUS = "none-is-previous"
 GAS_NEXT_PRICE_HOUR = 6
+# Hours past price slots are kept after they ended
+PRICE_RETENTION_HOURS = 24
+CONF_FORECAST_ATTRIBUTES = "forecast_attributes"
 VERSION = "2026.7.2"
 
 
@@ -70,7 +67,13 @@ class ZonneplanSensorEntityDescription(SensorEntityDescription):
     attributes: None | list[Attribute] = None
     last_reset_key: None | str = None
     has_entity_name: bool = True
-    key_lambda: Callable[[], str] | None = None
+    # Read `key` from the current slot of this timeline in the price view, or `timeline_offset` slots later
+    timeline: str | None = None
+    timeline_offset: int = 0
+    # Read `key` from the analytics of the slot (rank, percentile, ...) instead of from the slot
+    timeline_analytics: bool = False
+    # Add the analytics of the slot as attributes
+    analytics_attributes: bool = False
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -106,20 +109,6 @@ class ZonneplanSelectEntityDescription(SelectEntityDescription):
     has_entity_name: bool = True
 
 
-def get_gas_hour(param: str) -> str:
-    """Get gas date_hour key."""
-    zonneplan_api_time_zone = dt_util.get_time_zone("Europe/Amsterdam")
-    now = dt_util.now(zonneplan_api_time_zone)
-    start = (
-        now.replace(hour=GAS_NEXT_PRICE_HOUR)
-        if now.hour >= GAS_NEXT_PRICE_HOUR
-        else (now - timedelta(days=1)).replace(hour=GAS_NEXT_PRICE_HOUR)
-    )
-    if param == "next":
-        return (start + timedelta(days=1)).strftime("%Y-%m-%d %H")
-    return start.strftime("%Y-%m-%d %H")
-
-
 """Available sensors"""
 SENSOR_TYPES: dict[
     str,
@@ -157,14 +146,8 @@ SENSOR_TYPES: dict[
     },
     ELECTRICITY_PRICES: {
         "sustainability_score": ZonneplanSensorEntityDescription(
-            key="usage.sustainability_score",
-            key_lambda=lambda: (
-                f"price_per_date_and_quarter_hour.{
-                    datetime.now(UTC)
-                    .replace(minute=(datetime.now(UTC).minute // 15) * 15, second=0, microsecond=0)
-                    .strftime('%Y-%m-%d %H:%M')
-                }.sustainability_score.permille"
-            ),
+            key="sustainability_score",
+            timeline="quarter_hourly",
             name="Sustainability score",
             translation_key="sustainability_score",
             icon="mdi:leaf-circle-outline",
@@ -174,14 +157,14 @@ SENSOR_TYPES: dict[
             native_unit_of_measurement=UnitOfRatio.PERCENTAGE,
         ),
         "current_tariff_group": ZonneplanSensorEntityDescription(
-            key="current_tariff_group",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
             name="Current tariff group",
             translation_key="current_tariff_group",
         ),
         "current_electricity_tariff": ZonneplanSensorEntityDescription(
-            key="current_tariff",
-            key_lambda=lambda: f"price_per_date_and_hour.{datetime.now(UTC).strftime('%Y-%m-%d %H')}.electricity_price",
+            key="price_tax_included",
+            timeline="hourly",
             name="Current electricity tariff",
             translation_key="current_electricity_tariff",
             icon="mdi:cash",
@@ -197,14 +180,8 @@ SENSOR_TYPES: dict[
             ],
         ),
         "current_quarter_hourly_electricity_tariff": ZonneplanSensorEntityDescription(
-            key="quarter_hourly_electricity_price",
-            key_lambda=lambda: (
-                f"price_per_date_and_quarter_hour.{
-                    datetime.now(UTC)
-                    .replace(minute=(datetime.now(UTC).minute // 15) * 15, second=0, microsecond=0)
-                    .strftime('%Y-%m-%d %H:%M')
-                }.price_tax_included.amount"
-            ),
+            key="price_tax_included",
+            timeline="quarter_hourly",
             name="Current quarter hourly electricity tariff",
             translation_key="current_quarter_hourly_electricity_tariff",
             icon="mdi:cash",
@@ -213,6 +190,7 @@ SENSOR_TYPES: dict[
             suggested_display_precision=4,
             state_class=SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default=True,
+            analytics_attributes=True,
             attributes=[
                 Attribute(
                     key="price_per_quarter_hour",
@@ -221,8 +199,8 @@ SENSOR_TYPES: dict[
             ],
         ),
         "current_hourly_electricity_tariff": ZonneplanSensorEntityDescription(
-            key="hourly_electricity_price",
-            key_lambda=lambda: f"price_per_date_and_hour.{datetime.now(UTC).strftime('%Y-%m-%d %H')}.electricity_price",
+            key="price_tax_included",
+            timeline="hourly",
             name="Current hourly electricity tariff",
             translation_key="current_hourly_electricity_tariff",
             icon="mdi:cash",
@@ -230,6 +208,7 @@ SENSOR_TYPES: dict[
             native_unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
             suggested_display_precision=4,
             state_class=SensorStateClass.MEASUREMENT,
+            analytics_attributes=True,
             attributes=[
                 Attribute(
                     key="price_per_hour",
@@ -238,10 +217,9 @@ SENSOR_TYPES: dict[
             ],
         ),
         "forecast_tariff_1": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_1",
-            key_lambda=lambda: (
-                f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=1)).strftime('%Y-%m-%d %H')}.electricity_price"
-            ),
+            key="price_tax_included",
+            timeline="hourly",
+            timeline_offset=1,
             name="Forecast tariff hour 1",
             translation_key="forecast_tariff_hour_1",
             icon="mdi:cash",
@@ -250,10 +228,9 @@ SENSOR_TYPES: dict[
             suggested_display_precision=2,
         ),
         "forecast_tariff_2": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_2",
-            key_lambda=lambda: (
-                f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=2)).strftime('%Y-%m-%d %H')}.electricity_price"
-            ),
+            key="price_tax_included",
+            timeline="hourly",
+            timeline_offset=2,
             name="Forecast tariff hour 2",
             translation_key="forecast_tariff_hour_2",
             icon="mdi:cash",
@@ -262,10 +239,9 @@ SENSOR_TYPES: dict[
             suggested_display_precision=2,
         ),
         "forecast_tariff_3": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_3",
-            key_lambda=lambda: (
-                f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=3)).strftime('%Y-%m-%d %H')}.electricity_price"
-            ),
+            key="price_tax_included",
+            timeline="hourly",
+            timeline_offset=3,
             name="Forecast tariff hour 3",
             translation_key="forecast_tariff_hour_3",
             icon="mdi:cash",
@@ -274,10 +250,9 @@ SENSOR_TYPES: dict[
             suggested_display_precision=2,
         ),
         "forecast_tariff_4": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_4",
-            key_lambda=lambda: (
-                f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=4)).strftime('%Y-%m-%d %H')}.electricity_price"
-            ),
+            key="price_tax_included",
+            timeline="hourly",
+            timeline_offset=4,
             name="Forecast tariff hour 4",
             translation_key="forecast_tariff_hour_4",
             icon="mdi:cash",
@@ -286,10 +261,9 @@ SENSOR_TYPES: dict[
             suggested_display_precision=2,
         ),
         "forecast_tariff_5": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_5",
-            key_lambda=lambda: (
-                f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=5)).strftime('%Y-%m-%d %H')}.electricity_price"
-            ),
+            key="price_tax_included",
+            timeline="hourly",
+            timeline_offset=5,
             name="Forecast tariff hour 5",
             translation_key="forecast_tariff_hour_5",
             icon="mdi:cash",
@@ -298,10 +272,9 @@ SENSOR_TYPES: dict[
             suggested_display_precision=2,
         ),
         "forecast_tariff_6": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_6",
-            key_lambda=lambda: (
-                f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=6)).strftime('%Y-%m-%d %H')}.electricity_price"
-            ),
+            key="price_tax_included",
+            timeline="hourly",
+            timeline_offset=6,
             name="Forecast tariff hour 6",
             translation_key="forecast_tariff_hour_6",
             icon="mdi:cash",
@@ -310,10 +283,9 @@ SENSOR_TYPES: dict[
             suggested_display_precision=2,
         ),
         "forecast_tariff_7": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_7",
-            key_lambda=lambda: (
-                f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=7)).strftime('%Y-%m-%d %H')}.electricity_price"
-            ),
+            key="price_tax_included",
+            timeline="hourly",
+            timeline_offset=7,
             name="Forecast tariff hour 7",
             translation_key="forecast_tariff_hour_7",
             icon="mdi:cash",
@@ -322,10 +294,9 @@ SENSOR_TYPES: dict[
             suggested_display_precision=2,
         ),
         "forecast_tariff_8": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_8",
-            key_lambda=lambda: (
-                f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=8)).strftime('%Y-%m-%d %H')}.electricity_price"
-            ),
+            key="price_tax_included",
+            timeline="hourly",
+            timeline_offset=8,
             name="Forecast tariff hour 8",
             translation_key="forecast_tariff_hour_8",
             icon="mdi:cash",
@@ -334,59 +305,132 @@ SENSOR_TYPES: dict[
             suggested_display_precision=2,
         ),
         "forecast_tariff_group_1": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_group_1",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=1)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
+            timeline_offset=1,
             name="Forecast tariff group hour 1",
             translation_key="forecast_tariff_group_hour_1",
             icon="mdi:cash",
         ),
         "forecast_tariff_group_2": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_group_2",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=2)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
+            timeline_offset=2,
             name="Forecast tariff group hour 2",
             translation_key="forecast_tariff_group_hour_2",
         ),
         "forecast_tariff_group_3": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_group_3",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=3)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
+            timeline_offset=3,
             name="Forecast tariff group hour 3",
             translation_key="forecast_tariff_group_hour_3",
         ),
         "forecast_tariff_group_4": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_group_4",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=4)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
+            timeline_offset=4,
             name="Forecast tariff group hour 4",
             translation_key="forecast_tariff_group_hour_4",
         ),
         "forecast_tariff_group_5": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_group_5",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=5)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
+            timeline_offset=5,
             name="Forecast tariff group hour 5",
             translation_key="forecast_tariff_group_hour_5",
         ),
         "forecast_tariff_group_6": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_group_6",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=6)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
+            timeline_offset=6,
             name="Forecast tariff group hour 6",
             translation_key="forecast_tariff_group_hour_6",
         ),
         "forecast_tariff_group_7": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_group_7",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=7)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
+            timeline_offset=7,
             name="Forecast tariff group hour 7",
             translation_key="forecast_tariff_group_hour_7",
         ),
         "forecast_tariff_group_8": ZonneplanSensorEntityDescription(
-            key="forecast_tariff_group_8",
-            key_lambda=lambda: f"price_per_date_and_hour.{(datetime.now(UTC) + timedelta(hours=8)).strftime('%Y-%m-%d %H')}.tariff_group",
+            key="tariff_group",
+            timeline="hourly",
+            timeline_offset=8,
             name="Forecast tariff group hour 8",
             translation_key="forecast_tariff_group_hour_8",
         ),
+        "current_hourly_price_rank": ZonneplanSensorEntityDescription(
+            key="rank",
+            timeline="hourly",
+            timeline_analytics=True,
+            name="Current hour price rank",
+            translation_key="current_hourly_price_rank",
+            icon="mdi:sort-numeric-ascending",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "current_hourly_price_percentile": ZonneplanSensorEntityDescription(
+            key="percentile",
+            timeline="hourly",
+            timeline_analytics=True,
+            name="Current hour price percentile",
+            translation_key="current_hourly_price_percentile",
+            icon="mdi:percent-outline",
+            native_unit_of_measurement=UnitOfRatio.PERCENTAGE,
+            suggested_display_precision=0,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "current_hourly_price_deviation": ZonneplanSensorEntityDescription(
+            key="deviation",
+            timeline="hourly",
+            timeline_analytics=True,
+            name="Current hour price deviation from daily average",
+            translation_key="current_hourly_price_deviation",
+            icon="mdi:plus-minus-variant",
+            value_factor=0.0000001,
+            native_unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
+            suggested_display_precision=4,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "electricity_price_today_min": ZonneplanSensorEntityDescription(
+            key="day_min_price",
+            timeline="hourly",
+            timeline_analytics=True,
+            name="Lowest hourly electricity tariff today",
+            translation_key="electricity_price_today_min",
+            icon="mdi:cash-minus",
+            value_factor=0.0000001,
+            native_unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
+            suggested_display_precision=4,
+        ),
+        "electricity_price_today_max": ZonneplanSensorEntityDescription(
+            key="day_max_price",
+            timeline="hourly",
+            timeline_analytics=True,
+            name="Highest hourly electricity tariff today",
+            translation_key="electricity_price_today_max",
+            icon="mdi:cash-plus",
+            value_factor=0.0000001,
+            native_unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
+            suggested_display_precision=4,
+        ),
+        "electricity_price_today_average": ZonneplanSensorEntityDescription(
+            key="day_average_price",
+            timeline="hourly",
+            timeline_analytics=True,
+            name="Average hourly electricity tariff today",
+            translation_key="electricity_price_today_average",
+            icon="mdi:cash",
+            value_factor=0.0000001,
+            native_unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
+            suggested_display_precision=4,
+        ),
     },
     GAS_PRICES: {
         "current_tariff_gas": ZonneplanSensorEntityDescription(
-            key="gas_price",
-            key_lambda=lambda: f"gas_prices.{get_gas_hour('current')}.price_tax_included.amount",
+            key="price_tax_included",
+            timeline="daily",
             name="Current gas tariff",
             translation_key="current_gas_tariff",
             icon="mdi:cash",
@@ -404,8 +448,9 @@ SENSOR_TYPES: dict[
             ],
         ),
         "next_tariff_gas": ZonneplanSensorEntityDescription(
-            key="gas_price_next",
-            key_lambda=lambda: f"gas_prices.{get_gas_hour('next')}.price_tax_included.amount",
+            key="price_tax_included",
+            timeline="daily",
+            timeline_offset=1,
             name="Next gas tariff",
             translation_key="next_gas_tariff",
             icon="mdi:cash",
@@ -1,7 +1,7 @@
 """Zonneplan account DataUpdateCoordinator."""
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from http import HTTPStatus
 
@@ -14,7 +14,7 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from ..api import AsyncConfigEntryAuth
 from ..const import DOMAIN
-from ..zonneplan_api.types import ZonneplanAddressGroup
+from ..zonneplan_api.types import ZonneplanAddressGroup, ZonneplanContract
 from .battery_charts_data_coordinator import BatteryChartsDataUpdateCoordinator
 from .battery_control_data_coordinator import BatteryControlDataUpdateCoordinator
 from .battery_data_coordinator import BatteryDataUpdateCoordinator
@@ -49,6 +49,7 @@ class ConnectionCoordinators:
     home_battery_installation: BatteryDataUpdateCoordinator | None = None
     battery_control: BatteryControlDataUpdateCoordinator | None = None
     battery_charts: BatteryChartsDataUpdateCoordinator | None = None
+    contracts: dict[str, ZonneplanContract] = field(default_factory=dict)
 
 
 class AccountDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
@@ -70,6 +71,8 @@ class AccountDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         self.update_interval = timedelta(minutes=60)
         self.api: AsyncConfigEntryAuth = api
         self.coordinators = {}
+        self._electricity_prices: ElectricityPricesDataUpdateCoordinator | None = None
+        self._gas_prices: GasPricesDataUpdateCoordinator | None = None
 
     async def _async_update_data(self) -> list[ZonneplanAddressGroup]:
         """Fetch the latest account status."""
@@ -92,6 +95,26 @@ class AccountDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
     def address_groups(self) -> list[ZonneplanAddressGroup]:
         return self.data
 
+    @property
+    def electricity_prices(self) -> ElectricityPricesDataUpdateCoordinator:
+        """Return the electricity prices coordinator, prices are the same for all connections."""
+        if self._electricity_prices is None:
+            self._electricity_prices = ElectricityPricesDataUpdateCoordinator(self.hass, self.api)
+        return self._electricity_prices
+
+    @property
+    def gas_prices(self) -> GasPricesDataUpdateCoordinator:
+        """Return the gas prices coordinator, prices are the same for all connections."""
+        if self._gas_prices is None:
+            self._gas_prices = GasPricesDataUpdateCoordinator(self.hass, self.api)
+        return self._gas_prices
+
+    def add_contract(self, uuid: str, contract_type: str, contract: ZonneplanContract) -> None:
+        if uuid not in self.coordinators:
+            self.coordinators[uuid] = ConnectionCoordinators()
+
+        self.coordinators[uuid].contracts[contract_type] = contract
+
     def add_coordinator(
         self,
         uuid: str,
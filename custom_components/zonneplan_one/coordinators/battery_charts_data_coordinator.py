@@ -144,19 +144,22 @@ class BatteryChartsDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
 
         contract_uuid = self.contract.get("uuid")
 
-        months_this_year = await self.api.async_get_battery_chart(contract_uuid, "months", current_year_date)
+        months_this_year, months_last_year, days_this_month, days_last_month = await self._async_gather(
+            self.api.async_get_battery_chart(contract_uuid, "months", current_year_date),
+            self.api.async_get_battery_chart(contract_uuid, "months", last_year_date),
+            self.api.async_get_battery_chart(contract_uuid, "days", current_month_date),
+            self.api.async_get_battery_chart(contract_uuid, "days", last_month_date),
+        )
+
         if months_this_year and (parsed := _parse_month_chart(months_this_year, current_year_date.year)):
             charts["this_year"] = parsed
 
-        months_last_year = await self.api.async_get_battery_chart(contract_uuid, "months", last_year_date)
         if months_last_year and (parsed := _parse_month_chart(months_last_year, last_year_date.year)):
             charts["last_year"] = parsed
 
-        days_this_month = await self.api.async_get_battery_chart(contract_uuid, "days", current_month_date)
         if days_this_month and (parsed := _parse_day_chart(days_this_month, current_month_date)):
             charts["this_month"] = parsed
 
-        days_last_month = await self.api.async_get_battery_chart(contract_uuid, "days", last_month_date)
         if days_last_month and (parsed := _parse_day_chart(days_last_month, last_month_date)):
             charts["last_month"] = parsed
 
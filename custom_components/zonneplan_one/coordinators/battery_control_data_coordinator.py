@@ -51,20 +51,13 @@ class BatteryControlDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         try:
             data = self.data or {}
 
-            # On first fetch (no cached data), ignore etag to ensure we get a full 200 response
-            # instead of a 304, which would return None and leave the data empty.
-            # Subsequent fetches use etags normally for efficiency.
-            has_cached_battery_control = "battery_control_mode" in data
-            battery_control_mode = await self.api.async_get_battery_control_mode(
-                self.contract["uuid"], ignore_etag=not has_cached_battery_control
+            battery_control_mode, battery_home_optimization = await self._async_gather(
+                self.api.async_get_battery_control_mode(self.contract["uuid"]),
+                self.api.async_get_battery_home_optimization(self.contract["uuid"]),
             )
             if battery_control_mode:
                 data["battery_control_mode"] = battery_control_mode
 
-            has_cached_battery_optimization = "battery_home_optimization" in data
-            battery_home_optimization = await self.api.async_get_battery_home_optimization(
-                self.contract["uuid"], ignore_etag=not has_cached_battery_optimization
-            )
             if battery_home_optimization:
                 data["battery_home_optimization"] = battery_home_optimization
 
@@ -158,14 +151,18 @@ class BatteryControlDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         await self.async_fetch_battery_control_mode()
 
     async def async_fetch_battery_control_mode(self) -> None:
-        battery_control_mode = await self.api.async_get_battery_control_mode(self.contract["uuid"])
+        battery_control_mode, battery_home_optimization = await self._async_gather(
+            self.api.async_get_battery_control_mode(self.contract["uuid"]),
+            self.api.async_get_battery_home_optimization(self.contract["uuid"]),
+            # Processing is only cleared with a confirmed control mode
+            allow_partial=False,
+        )
         if battery_control_mode:
             self.data["battery_control_mode"] = battery_control_mode
             _LOGGER.info("battery_control_mode %s", battery_control_mode)
         else:
             self.data["battery_control_mode"]["processing"] = False
 
-        battery_home_optimization = await self.api.async_get_battery_home_optimization(self.contract["uuid"])
         if battery_home_optimization:
             self.data["battery_home_optimization"] = battery_home_optimization
 
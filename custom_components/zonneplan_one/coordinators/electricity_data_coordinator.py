@@ -9,9 +9,10 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.debounce import Debouncer
 
 from ..api import AsyncConfigEntryAuth
+from ..backfill_checkpoints import BackfillCheckpoints
 from ..const import DOMAIN
 from ..zonneplan_api.types import ZonneplanContract
-from .statistics import ElectricityStatisticsService
+from .statistics import ElectricityStatisticsService, StatisticBaselines
 from .zonneplan_data_update_coordinator import ZonneplanDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,6 +36,8 @@ class ElectricityDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         address_uuid: str,
         connection_uuid: str,
         contracts: list[ZonneplanContract],
+        backfill_checkpoints: BackfillCheckpoints | None = None,
+        statistic_baselines: StatisticBaselines | None = None,
     ) -> None:
         """Initialize."""
         super().__init__(
@@ -55,6 +58,8 @@ class ElectricityDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
             connection_uuid=self.connection_uuid,
             delivered_id=self.electricity_delivered_id,
             produced_id=self.electricity_produced_id,
+            backfill_checkpoints=backfill_checkpoints,
+            statistic_baselines=statistic_baselines,
         )
 
     async def _async_update_data(self) -> dict:
@@ -68,7 +73,8 @@ class ElectricityDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
             raise
         else:
             _LOGGER.debug("Update electricity data: %s", electricity)
-            if electricity:
+            # A 304 returns the cached payload, only process statistics for new data
+            if electricity and electricity != self.data:
                 _LOGGER.debug("Process stats for %s", [self.electricity_delivered_id, self.electricity_produced_id])
                 await self._statistics_service.process_payload(electricity)
 
@@ -85,3 +91,7 @@ class ElectricityDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
     async def async_backfill_statistics(self, start_date: datetime) -> None:
         """Backfill statistics from start_date until now."""
         await self._statistics_service.async_backfill_from(start_date)
+
+    @property
+    def statistics_service(self) -> ElectricityStatisticsService:
+        return self._statistics_service
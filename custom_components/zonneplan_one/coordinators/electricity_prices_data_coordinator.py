@@ -1,5 +1,5 @@
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, time, timedelta
 from http import HTTPStatus
 
 import homeassistant.util.dt as dt_util
@@ -10,88 +10,58 @@ from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import async_track_point_in_utc_time
 
 from ..api import AsyncConfigEntryAuth
-from ..const import DOMAIN
-from ..zonneplan_api.types import ZonneplanContract
+from ..const import DOMAIN, PRICE_RETENTION_HOURS
+from ..zonneplan_api.models import ZonneplanPriceSlot, parse_price_chart
+from ..zonneplan_api.price_analytics import SlotAnalytics, analyze_prices
+from ..zonneplan_api.price_timeline import PriceTimeline, PriceViews, build_price_view, chart_prices
+from .price_refresh_schedule import PriceRefreshSchedule
+from .price_statistics import ELECTRICITY_PRICE_STATISTICS, PriceStatisticsService
+from .value_path import ValuePath, compile_value_path
 from .zonneplan_data_update_coordinator import ZonneplanDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Day-ahead prices for tomorrow are published in the early afternoon
+ELECTRICITY_PRICES_PUBLICATION_TIME = time(13)
 
-def get_price_per_hour_by_date(prices: list[dict]) -> dict:
-    price_by_hour = {}
-    for price_info in prices:
-        price_by_hour[price_info["datetime"].strftime("%Y-%m-%d %H")] = price_info
-    return price_by_hour
-
-
-def get_price_per_quarter_hour(data: dict) -> dict:
-    price_by_quarter_hour = {}
-    price_series = get_price_series_from_chart_data(data)
-    for price_data in price_series:
-        dt = dt_util.parse_datetime(price_data["start_date"])
-        quarter_dt = dt.replace(minute=(dt.minute // 15) * 15, second=0, microsecond=0).strftime("%Y-%m-%d %H:%M")
-        price_by_quarter_hour[quarter_dt] = price_data
-    return price_by_quarter_hour
-
-
-def get_energy_price(data: dict, dt: datetime | None = None) -> int | None:
-    if dt is None:
-        dt = datetime.now(UTC)
-    price = None
-    price_series = get_price_series_from_chart_data(data)
-    for price_data in price_series:
-        start_datetime = dt_util.parse_datetime(price_data["start_date"])
-        end_datetime = dt_util.parse_datetime(price_data["end_date"])
-        if start_datetime <= dt < end_datetime:
-            price = price_data["price_tax_included"]["amount"]
-            break
-    return price
-
-
-def get_price_series_from_chart_data(data: dict) -> list[dict]:
-    return data.get("chart", {}).get("series", {}).get("prices", [])
-
-
-def prepare_prices(data: dict) -> list[dict]:
-    prices = []
-    price_series = get_price_series_from_chart_data(data)
-    for price_data in price_series:
-        start_datetime = dt_util.parse_datetime(price_data["start_date"])
-        price = price_data["price_tax_included"]["amount"]
-        price_excl_tax = price_data["price_tax_excluded"]["amount"]
-
-        price_info = {
-            "datetime": start_datetime,
-            "electricity_price": price,
-            "electricity_price_excl_tax": price_excl_tax,
+# Slots in the price view: the current hour with the 8 forecast hours and the current quarter hour
+PRICE_VIEW_SLOTS = {"hourly": 9, "quarter_hourly": 1}
+
+
+def prepare_prices(slots: list[ZonneplanPriceSlot]) -> list[dict]:
+    return [
+        {
+            "datetime": slot.start,
+            "electricity_price": slot.price_tax_included,
+            "electricity_price_excl_tax": slot.price_tax_excluded,
+            "sustainability_score": slot.sustainability_score,
+            "tariff_group": slot.tariff_group,
         }
-        sustainability_score = price_data.get("sustainability_score", {}).get("permille", 0)
-        tariff_group = price_data.get("tariff_group", "")
-        price_info["sustainability_score"] = sustainability_score
-        price_info["tariff_group"] = tariff_group
+        for slot in slots
+    ]
 
-        prices.append(price_info)
 
-    return prices
+# Views for the forecast attributes: (timeline, build from the slots)
+PRICE_VIEWS = {
+    "legacy_price_per_hour": ("hourly", prepare_prices),
+    "price_per_hour": ("hourly", chart_prices),
+    "price_per_quarter_hour": ("quarter_hourly", chart_prices),
+}
 
 
 class ElectricityPricesDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
-    """Zonneplan summary data update coordinator."""
+    """Zonneplan electricity prices data update coordinator, shared by all connections of the account."""
 
     hass: HomeAssistant
     api: AsyncConfigEntryAuth
-    contract: ZonneplanContract
-    address_uuid: str
 
     def __init__(
         self,
         hass: HomeAssistant,
         api: AsyncConfigEntryAuth,
-        address_uuid: str,
-        connection_uuid: str,
-        contract: ZonneplanContract,
+        retention: timedelta = timedelta(hours=PRICE_RETENTION_HOURS),
     ) -> None:
-        """Initialize."""
+        """Initialize, slots are kept for `retention` after they ended."""
         super().__init__(
             hass,
             _LOGGER,
@@ -101,34 +71,43 @@ class ElectricityPricesDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         )
 
         self.api: AsyncConfigEntryAuth = api
-        self.address_uuid = address_uuid
-        self.connection_uuid = connection_uuid
-        self.contract = contract
 
+        self.timelines: dict[str, PriceTimeline] = {"hourly": PriceTimeline(), "quarter_hourly": PriceTimeline()}
+        self.price_view: dict[str, list[ZonneplanPriceSlot]] = {}
+        # Analytics per timeline by slot start, computed when the timeline changed
+        self.price_analytics: dict[str, dict[datetime, SlotAnalytics]] = {}
+        self._price_views = PriceViews(self.timelines, PRICE_VIEWS)
+        self._retention = retention
+        self._statistics_service = PriceStatisticsService(hass, ELECTRICITY_PRICE_STATISTICS)
         self._unsub_quarter_hour_update = None
+        self._refresh_schedule = PriceRefreshSchedule(ELECTRICITY_PRICES_PUBLICATION_TIME, time(0))
 
     async def _async_update_data(self) -> dict:
         """Fetch the latest status."""
+        # Poll at the regular interval until a refresh succeeds
+        self.update_interval = self._custom_data_update_interval
+
         try:
-            price_data = self.data or {}
-
-            hourly = await self.api.async_get_consumer_prices("electricity-hourly") or price_data.get("hourly")
-            quarter_hourly = await self.api.async_get_consumer_prices("electricity-quarter-hourly") or price_data.get("quarter_hourly")
-
-            if hourly:
-                price_data["hourly"] = hourly
-                legacy_hourly_electricity_prices = prepare_prices(hourly)
-                price_data["legacy_price_per_hour"] = legacy_hourly_electricity_prices
-                price_data["price_per_date_and_hour"] = get_price_per_hour_by_date(legacy_hourly_electricity_prices)
-                price_data["price_per_hour"] = get_price_series_from_chart_data(hourly)
-            if quarter_hourly:
-                price_data["quarter_hourly"] = quarter_hourly
-                price_data["price_per_date_and_quarter_hour"] = get_price_per_quarter_hour(quarter_hourly)
-                price_data["price_per_quarter_hour"] = get_price_series_from_chart_data(quarter_hourly)
+            # Without a (cached) response, or when one of the charts failed, the known prices are kept
+            hourly, quarter_hourly = await self._async_gather(
+                self.api.async_get_consumer_prices("electricity-hourly"),
+                self.api.async_get_consumer_prices("electricity-quarter-hourly"),
+            )
+
+            for name, chart in (("hourly", hourly), ("quarter_hourly", quarter_hourly)):
+                if chart and self.timelines[name].merge(parse_price_chart(chart)):
+                    self.price_analytics[name] = analyze_prices(self.timelines[name].slots)
+
+            self._update_price_view()
+            await self._statistics_service.async_import(self.timelines)
+            price_data = {name: timeline.slots for name, timeline in self.timelines.items() if timeline.slots}
 
             if not self._unsub_quarter_hour_update:
                 self._schedule_quarter_hourly_listener_update()
 
+            horizons = [timeline.horizon for timeline in self.timelines.values() if timeline.horizon]
+            self.update_interval = self._refresh_schedule.next_interval(dt_util.utcnow(), min(horizons, default=None))
+
         except ClientResponseError as e:
             if e.status == HTTPStatus.UNAUTHORIZED:
                 raise ConfigEntryAuthFailed from e
@@ -145,6 +124,34 @@ class ElectricityPricesDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
             self._unsub_quarter_hour_update()
             self._unsub_quarter_hour_update = None
 
+    async def async_backfill_statistics(self, start_date: datetime) -> None:
+        """Import the known prices from start_date on as statistics."""
+        await self._statistics_service.async_backfill_from(start_date, self.timelines)
+
+    def get_data_value(self, value_path: str | ValuePath) -> dict | str | int | float | bool | None:
+        """Return a value of the data, or of the views derived from it."""
+        if isinstance(value_path, str):
+            value_path = compile_value_path(value_path)
+
+        if value_path.segments[0] in PRICE_VIEWS:
+            return value_path.get(self._price_views)
+
+        return super().get_data_value(value_path)
+
+    def _update_price_view(self) -> None:
+        """Evict expired slots and resolve the slots the sensors show for this moment, once for all sensors."""
+        now = dt_util.utcnow()
+        for name, timeline in self.timelines.items():
+            if timeline.evict(now - self._retention) and name in self.price_analytics:
+                # Drop the analytics of the evicted slots, the remaining slots keep the analytics of their full day
+                self.price_analytics[name] = {
+                    start: analytics
+                    for start, analytics in self.price_analytics[name].items()
+                    if timeline.slots and start >= timeline.slots[0].start
+                }
+
+        self.price_view = build_price_view(self.timelines, PRICE_VIEW_SLOTS, now)
+
     def _schedule_quarter_hourly_listener_update(self) -> None:
         """Schedule quarter hourly sensor (listeners) update."""
         if self._unsub_quarter_hour_update:
@@ -157,7 +164,9 @@ class ElectricityPricesDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         def _handle(_: datetime) -> None:
             _LOGGER.debug("Next hour: refresh sensor data")
 
+            self._update_price_view()
             self.async_update_listeners()
+            self.hass.async_create_task(self._statistics_service.async_import(self.timelines))
             self._schedule_quarter_hourly_listener_update()
 
         self._unsub_quarter_hour_update = async_track_point_in_utc_time(self.hass, _handle, next_hour)
@@ -8,9 +8,10 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.debounce import Debouncer
 
 from ..api import AsyncConfigEntryAuth
+from ..backfill_checkpoints import BackfillCheckpoints
 from ..const import DOMAIN
 from ..zonneplan_api.types import ZonneplanContract
-from .statistics import GasStatisticsService
+from .statistics import GasStatisticsService, StatisticBaselines
 from .zonneplan_data_update_coordinator import ZonneplanDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +34,8 @@ class GasDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         address_uuid: str,
         connection_uuid: str,
         contracts: list[ZonneplanContract],
+        backfill_checkpoints: BackfillCheckpoints | None = None,
+        statistic_baselines: StatisticBaselines | None = None,
     ) -> None:
         """Initialize."""
         super().__init__(
@@ -53,6 +56,8 @@ class GasDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
             api=self.api,
             connection_uuid=self.connection_uuid,
             gas_id=self.statistics_id,
+            backfill_checkpoints=backfill_checkpoints,
+            statistic_baselines=statistic_baselines,
         )
 
     async def _async_update_data(self) -> dict:
@@ -66,7 +71,8 @@ class GasDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
             raise
         else:
             _LOGGER.debug("Update gas data: %s", gas)
-            if gas:
+            # A 304 returns the cached payload, only process statistics for new data
+            if gas and gas != self.data:
                 await self._statistics_service.process_payload(gas)
 
             return gas or self.data
@@ -78,3 +84,7 @@ class GasDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
     async def async_backfill_statistics(self, start_date: datetime) -> None:
         """Backfill statistics from start_date until now."""
         await self._statistics_service.async_backfill_from(start_date)
+
+    @property
+    def statistics_service(self) -> GasStatisticsService:
+        return self._statistics_service
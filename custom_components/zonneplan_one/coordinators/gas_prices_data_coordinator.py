@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from http import HTTPStatus
 
 import homeassistant.util.dt as dt_util
@@ -10,45 +10,42 @@ from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import async_track_point_in_utc_time
 
 from ..api import AsyncConfigEntryAuth
-from ..const import DOMAIN
-from ..zonneplan_api.types import ZonneplanContract
+from ..const import DOMAIN, GAS_NEXT_PRICE_HOUR, PRICE_RETENTION_HOURS
+from ..zonneplan_api.models import ZonneplanPriceSlot, parse_price_chart
+from ..zonneplan_api.price_timeline import PriceTimeline, PriceViews, build_price_view, chart_prices
+from .price_refresh_schedule import PriceRefreshSchedule
+from .price_statistics import GAS_PRICE_STATISTICS, PriceStatisticsService
+from .value_path import ValuePath, compile_value_path
 from .zonneplan_data_update_coordinator import ZonneplanDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_prices_by_date_and_hour(prices: dict) -> dict:
-    zonneplan_api_time_zone = dt_util.get_time_zone("Europe/Amsterdam")
+# Gas prices for the next gas day (starting at GAS_NEXT_PRICE_HOUR) are published in the evening
+GAS_PRICES_PUBLICATION_TIME = time(18)
 
-    price_by_hour = {}
-    for price_data in get_price_series_from_chart_data(prices):
-        start_datetime = dt_util.parse_datetime(price_data["start_date"]).astimezone(zonneplan_api_time_zone)
-        if start_datetime:
-            price_by_hour[start_datetime.strftime("%Y-%m-%d %H")] = price_data
-    return price_by_hour
+# Slots in the price view: the current and the next gas day
+PRICE_VIEW_SLOTS = {"daily": 2}
 
-
-def get_price_series_from_chart_data(data: dict) -> list[dict]:
-    return data.get("chart", {}).get("series", {}).get("prices", [])
+# Views for the forecast attributes: (timeline, build from the slots)
+PRICE_VIEWS = {
+    "forecast": ("daily", chart_prices),
+}
 
 
 class GasPricesDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
-    """Zonneplan gas prices data update coordinator."""
+    """Zonneplan gas prices data update coordinator, shared by all connections of the account."""
 
     hass: HomeAssistant
     api: AsyncConfigEntryAuth
-    contract: ZonneplanContract
-    address_uuid: str
 
     def __init__(
         self,
         hass: HomeAssistant,
         api: AsyncConfigEntryAuth,
-        address_uuid: str,
-        connection_uuid: str,
-        contract: ZonneplanContract,
+        retention: timedelta = timedelta(hours=PRICE_RETENTION_HOURS),
     ) -> None:
-        """Initialize."""
+        """Initialize, slots are kept for `retention` after they ended."""
         super().__init__(
             hass,
             _LOGGER,
@@ -58,24 +55,34 @@ class GasPricesDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         )
 
         self.api: AsyncConfigEntryAuth = api
-        self.address_uuid = address_uuid
-        self.connection_uuid = connection_uuid
-        self.contract = contract
 
+        self.timelines: dict[str, PriceTimeline] = {"daily": PriceTimeline()}
+        self.price_view: dict[str, list[ZonneplanPriceSlot]] = {}
+        self._price_views = PriceViews(self.timelines, PRICE_VIEWS)
+        self._retention = retention
+        self._statistics_service = PriceStatisticsService(hass, GAS_PRICE_STATISTICS)
         self._unsub_hour_update = None
+        self._refresh_schedule = PriceRefreshSchedule(GAS_PRICES_PUBLICATION_TIME, time(GAS_NEXT_PRICE_HOUR))
 
     async def _async_update_data(self) -> dict:
         """Fetch the latest status."""
+        # Poll at the regular interval until a refresh succeeds
+        self.update_interval = self._custom_data_update_interval
+
         try:
-            data = {}
             gas_daily = await self.api.async_get_consumer_prices("gas-daily")
             if gas_daily:
-                data["gas_prices"] = get_prices_by_date_and_hour(gas_daily)
-                data["forecast"] = get_price_series_from_chart_data(gas_daily)
+                self.timelines["daily"].merge(parse_price_chart(gas_daily))
 
                 if not self._unsub_hour_update:
                     self._schedule_hourly_listener_update()
 
+            self._update_price_view()
+            await self._statistics_service.async_import(self.timelines)
+            data = {name: timeline.slots for name, timeline in self.timelines.items() if timeline.slots}
+
+            self.update_interval = self._refresh_schedule.next_interval(dt_util.utcnow(), self.timelines["daily"].horizon)
+
         except ClientResponseError as e:
             if e.status == HTTPStatus.UNAUTHORIZED:
                 raise ConfigEntryAuthFailed from e
@@ -92,6 +99,28 @@ class GasPricesDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
             self._unsub_hour_update()
             self._unsub_hour_update = None
 
+    async def async_backfill_statistics(self, start_date: datetime) -> None:
+        """Import the known prices from start_date on as statistics."""
+        await self._statistics_service.async_backfill_from(start_date, self.timelines)
+
+    def get_data_value(self, value_path: str | ValuePath) -> dict | str | int | float | bool | None:
+        """Return a value of the data, or of the views derived from it."""
+        if isinstance(value_path, str):
+            value_path = compile_value_path(value_path)
+
+        if value_path.segments[0] in PRICE_VIEWS:
+            return value_path.get(self._price_views)
+
+        return super().get_data_value(value_path)
+
+    def _update_price_view(self) -> None:
+        """Evict expired slots and resolve the slots the sensors show for this moment, once for all sensors."""
+        now = dt_util.utcnow()
+        for timeline in self.timelines.values():
+            timeline.evict(now - self._retention)
+
+        self.price_view = build_price_view(self.timelines, PRICE_VIEW_SLOTS, now)
+
     def _schedule_hourly_listener_update(self) -> None:
         """Schedule hourly sensor (listeners) update."""
         if self._unsub_hour_update:
@@ -104,7 +133,9 @@ class GasPricesDataUpdateCoordinator(ZonneplanDataUpdateCoordinator):
         def _handle(_: datetime) -> None:
             _LOGGER.debug("Next hour: refresh sensor data")
 
+            self._update_price_view()
             self.async_update_listeners()
+            self.hass.async_create_task(self._statistics_service.async_import(self.timelines))
             self._schedule_hourly_listener_update()
 
         self._unsub_hour_update = async_track_point_in_utc_time(self.hass, _handle, next_hour)
@@ -0,0 +1,65 @@
+"""Refresh schedule for day-ahead prices."""
+
+import logging
+from datetime import datetime, time, timedelta
+
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIN_RETRY_INTERVAL = timedelta(minutes=5)
+DEFAULT_MAX_RETRY_INTERVAL = timedelta(hours=1)
+DEFAULT_MAX_INTERVAL = timedelta(hours=6)
+
+
+class PriceRefreshSchedule:
+    """
+    Interval until the next price refresh.
+
+    Prices are published once a day (at `publication_time`, Europe/Amsterdam) for the
+    next delivery day, which starts at `delivery_day_start`. As long as the known prices
+    cover the last published delivery day, nothing is refreshed until the next
+    publication (or `max_interval`). When the prices of the last publication are not
+    there yet, the refresh is retried with an exponential backoff.
+    """
+
+    def __init__(
+        self,
+        publication_time: time,
+        delivery_day_start: time,
+        min_retry_interval: timedelta = DEFAULT_MIN_RETRY_INTERVAL,
+        max_retry_interval: timedelta = DEFAULT_MAX_RETRY_INTERVAL,
+        max_interval: timedelta = DEFAULT_MAX_INTERVAL,
+    ) -> None:
+        self._publication_time = publication_time
+        self._delivery_day_start = delivery_day_start
+        self._min_retry_interval = min_retry_interval
+        self._max_retry_interval = max_retry_interval
+        self._max_interval = max_interval
+        self._retries = 0
+
+    def next_interval(self, now: datetime, horizon: datetime | None) -> timedelta:
+        """Return the time until the next refresh, given the end of the known prices."""
+        time_zone = dt_util.get_time_zone("Europe/Amsterdam")
+        local_now = now.astimezone(time_zone)
+
+        last_publication = datetime.combine(local_now.date(), self._publication_time, tzinfo=time_zone)
+        if last_publication > local_now:
+            last_publication -= timedelta(days=1)
+
+        # Published on day D for the delivery day D+1, which ends on D+2
+        required_horizon = datetime.combine(last_publication.date() + timedelta(days=2), self._delivery_day_start, tzinfo=time_zone)
+
+        if horizon is not None and horizon >= required_horizon:
+            self._retries = 0
+            next_publication = last_publication + timedelta(days=1)
+            interval = min(next_publication - now, self._max_interval)
+            _LOGGER.debug("Prices known until %s, next refresh in %s", horizon, interval)
+            return interval
+
+        interval = min(self._min_retry_interval * 2**self._retries, self._max_retry_interval)
+        # Stop counting once the cap is reached, the backoff would overflow timedelta eventually
+        if interval < self._max_retry_interval:
+            self._retries += 1
+        _LOGGER.debug("Prices known until %s, expected until %s, retry in %s", horizon, required_horizon, interval)
+        return interval
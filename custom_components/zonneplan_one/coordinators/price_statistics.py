@@ -0,0 +1,171 @@
+"""Long-term external statistics of the electricity and gas prices."""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import homeassistant.util.dt as dt_util
+from homeassistant.components import persistent_notification
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import CURRENCY_EURO, UnitOfEnergy, UnitOfVolume
+from homeassistant.core import HomeAssistant
+
+from ..const import DOMAIN
+from ..zonneplan_api.models import ZonneplanPriceSlot
+from ..zonneplan_api.price_timeline import PriceTimeline
+
+_LOGGER = logging.getLogger(__name__)
+
+_HOUR = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class PriceStatisticChannelConfig:
+    timeline: str
+    statistic_id: str
+    name: str
+    unit_of_measurement: str
+    value_factor: float = 0.0000001
+
+
+ELECTRICITY_PRICE_STATISTICS = (
+    PriceStatisticChannelConfig(
+        timeline="hourly",
+        statistic_id=f"{DOMAIN}:electricity_price_hourly",
+        name="Stroomprijs per uur",
+        unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
+    ),
+    PriceStatisticChannelConfig(
+        timeline="quarter_hourly",
+        statistic_id=f"{DOMAIN}:electricity_price_quarter_hourly",
+        name="Stroomprijs per kwartier",
+        unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
+    ),
+)
+
+GAS_PRICE_STATISTICS = (
+    PriceStatisticChannelConfig(
+        timeline="daily",
+        statistic_id=f"{DOMAIN}:gas_price",
+        name="Gasprijs",
+        unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfVolume.CUBIC_METERS}",
+    ),
+)
+
+
+def hourly_price_statistics(
+    slots: list[ZonneplanPriceSlot], since: datetime | None, until: datetime, value_factor: float
+) -> list[StatisticData]:
+    """
+    Return a mean statistic (mean, min and max price) per hour covered by the slots.
+
+    Long-term statistics are hourly: quarter hour prices are averaged into their hour and a
+    daily price is repeated for every hour of its day. Only hours starting from `since` up to
+    `until` are returned.
+    """
+    hours: dict[datetime, tuple[float, float, float, float]] = {}
+    for slot in slots:
+        if slot.price_tax_included is None:
+            continue
+
+        price = slot.price_tax_included * value_factor
+        hour = dt_util.as_utc(slot.start).replace(minute=0, second=0, microsecond=0)
+        if since is not None and hour < since:
+            hour = since
+        while hour < slot.end and hour <= until:
+            seconds = (min(slot.end, hour + _HOUR) - max(slot.start, hour)).total_seconds()
+            weighted_sum, total_seconds, min_price, max_price = hours.get(hour, (0.0, 0.0, price, price))
+            hours[hour] = (weighted_sum + price * seconds, total_seconds + seconds, min(min_price, price), max(max_price, price))
+            hour += _HOUR
+
+    return [
+        StatisticData(start=hour, mean=weighted_sum / total_seconds, min=min_price, max=max_price)
+        for hour, (weighted_sum, total_seconds, min_price, max_price) in sorted(hours.items())
+        if total_seconds
+    ]
+
+
+class PriceStatisticsService:
+    """
+    Imports prices as long-term external statistics.
+
+    Hours are imported once they started, so the price history is kept in the recorder
+    after the slots left the price timelines.
+    """
+
+    def __init__(self, hass: HomeAssistant, channel_configs: tuple[PriceStatisticChannelConfig, ...]) -> None:
+        self.hass = hass
+        self.channel_configs = channel_configs
+        # Start of the next hour to import per statistic, loaded from the recorder on first use
+        self._next_hour: dict[str, datetime | None] = {}
+
+    async def async_import(self, timelines: dict[str, PriceTimeline], since: datetime | None = None) -> None:
+        """Import the hours that started since the last import, or since `since` for a backfill."""
+        now = dt_util.utcnow()
+        for config in self.channel_configs:
+            timeline = timelines.get(config.timeline)
+            if not timeline:
+                continue
+
+            start = since if since is not None else await self._async_next_hour(config)
+            statistics = hourly_price_statistics(timeline.slots, start, now, config.value_factor)
+            if not statistics:
+                continue
+
+            metadata = StatisticMetaData(
+                mean_type=StatisticMeanType.ARITHMETIC,
+                has_sum=False,
+                name=config.name,
+                source=DOMAIN,
+                statistic_id=config.statistic_id,
+                unit_class=None,
+                unit_of_measurement=config.unit_of_measurement,
+            )
+            async_add_external_statistics(self.hass, metadata, statistics)
+
+            _LOGGER.debug("Imported %d hours of %s from %s", len(statistics), config.statistic_id, statistics[0]["start"])
+            if since is None:
+                self._next_hour[config.statistic_id] = statistics[-1]["start"] + _HOUR
+
+    async def async_backfill_from(self, start_date: datetime, timelines: dict[str, PriceTimeline]) -> None:
+        """
+        Import the retained prices from start_date on.
+
+        The consumer price charts only cover about the last day and the forecast, so this
+        imports the slots still in the timelines again, older prices can not be fetched.
+        """
+        start = dt_util.as_utc(start_date).replace(minute=0, second=0, microsecond=0)
+        notification_id = ",".join([config.statistic_id for config in self.channel_configs])
+        first_known = min((timeline.slots[0].start for timeline in timelines.values() if timeline), default=None)
+
+        await self.async_import(timelines, start)
+
+        msg = f"Imported the retained prices for {notification_id}, prices are known from {first_known}"
+        _LOGGER.info(msg)
+        persistent_notification.create(self.hass, msg, "Price import complete", notification_id)
+
+    async def _async_next_hour(self, config: PriceStatisticChannelConfig) -> datetime | None:
+        if config.statistic_id in self._next_hour:
+            return self._next_hour[config.statistic_id]
+
+        last_stats = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics,
+            self.hass,
+            1,
+            config.statistic_id,
+            True,
+            {"mean"},
+        )
+        rows = last_stats.get(config.statistic_id) if last_stats else None
+        next_hour = datetime.fromtimestamp(rows[0]["start"], tz=dt_util.UTC) + _HOUR if rows else None
+        self._next_hour[config.statistic_id] = next_hour
+        return next_hour
@@ -1,8 +1,11 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, time, timedelta, tzinfo
+from time import monotonic as time_monotonic
 from typing import Any
 
 import homeassistant.util.dt as dt_util
@@ -21,15 +24,33 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.const import UnitOfEnergy, UnitOfVolume
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.unit_conversion import EnergyConverter, VolumeConverter
 
 from ..api import AsyncConfigEntryAuth, ZonneplanApiError, ZonneplanRateLimitError
+from ..backfill_checkpoints import (
+    BACKFILL_FAILED,
+    BACKFILL_PAUSED,
+    BACKFILL_RUNNING,
+    BackfillCheckpoint,
+    BackfillCheckpoints,
+    ChannelCheckpoint,
+)
 from ..const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 _BACKFILL_MAX_RETRIES = 3
+# Days fetched at the same time during a backfill, matches the connections per host of the pooled
+# client session (`_CONNECTOR_LIMIT_PER_HOST` in api.py) so no fetch queues for a connection
+_BACKFILL_MAX_CONCURRENCY = 4
+# Rate limit budget kept free for the regular updates during a backfill
+_BACKFILL_RESERVED_REQUESTS = 10
+# Seconds between checks whether the rate limit budget recovered above the reserved requests
+_BACKFILL_BUDGET_POLL_INTERVAL = 5
+# Ingested days are written to the recorder in batches, bounded by days and by rows
+_BACKFILL_FLUSH_DAYS = 30
+_BACKFILL_FLUSH_ROWS = 5000
 
 
 @dataclass(frozen=True)
@@ -57,20 +78,134 @@ class InvalidStatsError(Exception):
     """Exception when construction stats fails."""
 
 
+def _get_last_statistic_rows(hass: HomeAssistant, statistic_ids: list[str]) -> dict[str, StatisticsRow | None]:
+    """Return the last long-term statistic of every statistic id, runs in the recorder executor."""
+    rows: dict[str, StatisticsRow | None] = {}
+    for statistic_id in statistic_ids:
+        last_stats = get_last_statistics(hass, 1, statistic_id, True, {"sum", "state"})
+        rows[statistic_id] = last_stats[statistic_id][0] if last_stats and last_stats.get(statistic_id) else None
+    return rows
+
+
+class StatisticBaselines:
+    """
+    Baselines of the channels of all statistics services of a connection.
+
+    The last statistic, and the first statistic of a day, of all registered statistics are each
+    loaded from the recorder in one executor job and kept in memory after that. The statistics
+    services are the only writers of these statistics, so the baselines follow the rows they
+    write instead of being reloaded every poll.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._statistic_ids: set[str] = set()
+        self._baselines: dict[str, StatisticsRow | None] = {}
+        # First statistic at or after the start of a day, by timestamp of the day
+        self._day_starts: dict[float, dict[str, StatisticsRow | None]] = {}
+        self._load_lock = asyncio.Lock()
+
+    def register(self, statistic_ids: Iterable[str]) -> None:
+        """Register statistics to load together with the others on first use."""
+        self._statistic_ids.update(statistic_ids)
+
+    async def async_get(self, statistic_id: str) -> StatisticsRow | None:
+        """Return the last statistic of statistic_id, None when there are no statistics yet."""
+        if statistic_id not in self._baselines:
+            async with self._load_lock:
+                if statistic_id not in self._baselines:
+                    await self._async_load(statistic_id)
+
+        return self._baselines[statistic_id]
+
+    async def _async_load(self, statistic_id: str) -> None:
+        statistic_ids = sorted((self._statistic_ids | {statistic_id}) - self._baselines.keys())
+        rows = await get_instance(self.hass).async_add_executor_job(_get_last_statistic_rows, self.hass, statistic_ids)
+        _LOGGER.debug("Loaded last statistics of %s: %s", statistic_ids, rows)
+        self._baselines.update(rows)
+
+    async def async_get_day_start(self, statistic_id: str, start_of_day: datetime) -> StatisticsRow | None:
+        """Return the first statistic of statistic_id at or after start_of_day, None when there is none."""
+        day = start_of_day.timestamp()
+        if statistic_id not in self._day_starts.get(day, {}):
+            async with self._load_lock:
+                if statistic_id not in self._day_starts.get(day, {}):
+                    await self._async_load_day_start(statistic_id, start_of_day)
+
+        return self._day_starts[day][statistic_id]
+
+    async def _async_load_day_start(self, statistic_id: str, start_of_day: datetime) -> None:
+        day = start_of_day.timestamp()
+        # Only the days of the refetch of yesterday and of today are used
+        for cached_day in [cached_day for cached_day in self._day_starts if cached_day < day - 2 * 86400]:
+            del self._day_starts[cached_day]
+
+        day_starts = self._day_starts.setdefault(day, {})
+        statistic_ids = (self._statistic_ids | {statistic_id}) - day_starts.keys()
+        stats = await get_instance(self.hass).async_add_executor_job(
+            statistics_during_period,
+            self.hass,
+            start_of_day,
+            None,
+            statistic_ids,
+            "hour",
+            None,
+            {"sum", "state"},
+        )
+        _LOGGER.debug("Loaded statistics of %s since %s", statistic_ids, start_of_day)
+        day_starts.update({statistic_id: rows[0] if (rows := stats.get(statistic_id)) else None for statistic_id in statistic_ids})
+
+    @callback
+    def async_update(self, statistic_id: str, statistics: list[StatisticData]) -> None:
+        """Update the baselines with written statistics, which are sorted by start."""
+        starts = [row["start"].timestamp() for row in statistics]
+
+        # The last statistic only follows statistics that are at least as recent, when it is loaded
+        baseline = self._baselines.get(statistic_id)
+        if statistic_id in self._baselines and (baseline is None or baseline["start"] <= starts[-1]):
+            self._baselines[statistic_id] = self._row(starts[-1], statistics[-1])
+
+        for day, day_starts in self._day_starts.items():
+            if statistic_id not in day_starts:
+                continue
+            index = bisect_left(starts, day)
+            if index == len(starts):
+                continue
+
+            day_start = day_starts[statistic_id]
+            if day_start is not None and starts[index] == day_start["start"]:
+                day_starts[statistic_id] = self._row(starts[index], statistics[index])
+            elif day_start is None or starts[index] < day_start["start"]:
+                # A new first statistic of the day, reload it on next use
+                del day_starts[statistic_id]
+
+    @staticmethod
+    def _row(start: float, statistic: StatisticData) -> StatisticsRow:
+        return StatisticsRow(start=start, end=start + 3600, sum=statistic["sum"], state=statistic["state"])
+
+
 class BaseZonneplanStatisticsService(ABC):
     """Base class for statistics services, providing common utilities."""
 
     hass: HomeAssistant
+    api: AsyncConfigEntryAuth
     zonneplan_api_time_zone: tzinfo
     channel_configs: tuple[StatisticChannelConfig, ...]
 
     def __init__(
         self,
         hass: HomeAssistant,
+        backfill_checkpoints: BackfillCheckpoints | None = None,
+        statistic_baselines: StatisticBaselines | None = None,
     ) -> None:
         self.hass = hass
+        self._statistic_baselines = statistic_baselines or StatisticBaselines(hass)
         self.zonneplan_api_time_zone = dt_util.get_time_zone("Europe/Amsterdam")
         self._refetched_statistics_yesterday: datetime | None = None
+        self._backfill_checkpoints = backfill_checkpoints
+        self._backfill_task: asyncio.Task | None = None
+        # Status to keep when the running backfill is cancelled: paused, or None to remove it
+        self._backfill_stop_status: str | None = BACKFILL_RUNNING
 
     @abstractmethod
     async def _fetch_day_payload(self, day: datetime, *, ignore_etag: bool = False) -> dict[str, Any] | None:
@@ -157,27 +292,11 @@ class BaseZonneplanStatisticsService(ABC):
         return True
 
     async def _load_states_for_day(self, start_of_day: datetime) -> dict[str, StatisticChannelState]:
-        stats = await get_instance(self.hass).async_add_executor_job(
-            statistics_during_period,
-            self.hass,
-            start_of_day,
-            None,
-            {config.statistic_id for config in self.channel_configs},
-            "hour",
-            None,
-            {"sum", "state"},
-        )
-
         states: dict[str, StatisticChannelState] = {}
         for config in self.channel_configs:
-            rows = stats.get(config.statistic_id)
-            if not rows:
-                msg = "No stats found for %s on %s"
-                raise InvalidStatsError(msg, config.statistic_id, start_of_day)
-
-            baseline = rows[0]
+            baseline = await self._statistic_baselines.async_get_day_start(config.statistic_id, start_of_day)
             if baseline is None:
-                msg = "Empty baseline stat for %s on %s"
+                msg = "No stats found for %s on %s"
                 raise InvalidStatsError(msg, config.statistic_id, start_of_day)
 
             baseline_start = baseline.get("start")
@@ -211,7 +330,7 @@ class BaseZonneplanStatisticsService(ABC):
         states: dict[str, StatisticChannelState] = {}
 
         for config in self.channel_configs:
-            last_stat = await self._get_last_statistic(config.statistic_id)
+            last_stat = await self._statistic_baselines.async_get(config.statistic_id)
             if last_stat:
                 last_time = datetime.fromtimestamp(last_stat["start"], tz=dt_util.UTC).astimezone(self.zonneplan_api_time_zone)
                 total_sum = float(last_stat.get("sum", 0.0))
@@ -243,63 +362,189 @@ class BaseZonneplanStatisticsService(ABC):
         notification_id: str | None = None,
         *,
         retry_on_max_connections: bool,
+        first_day: datetime | None = None,
+        on_flushed: Callable[[datetime], None] | None = None,
     ) -> None:
-        current_day = min(state.last_time for state in states.values())
+        """
+        Fetch and ingest all days from the oldest last statistic (or `first_day`) until today.
+
+        Days are fetched concurrently, up to `_BACKFILL_MAX_CONCURRENCY` and the free rate limit
+        budget, but ingested strictly in date order so the cumulative sums stay correct.
+
+        The ingested statistics are written every `_BACKFILL_FLUSH_DAYS` days or `_BACKFILL_FLUSH_ROWS`
+        rows, and once more when the backfill stops. `on_flushed` is called with the first day
+        that is not written yet after every write.
+        """
+        current_day = first_day or min(state.last_time for state in states.values())
         _LOGGER.info(
             "Last stat for %s is outdated, fetching historical data since %s",
             [config.statistic_id for config in self.channel_configs],
             current_day,
         )
 
+        started_at = time_monotonic()
+        ingested_days = 0
+        pending_days = 0
+        next_fetch_day = current_day
+        fetches: dict[datetime, asyncio.Task[dict[str, Any] | None]] = {}
         consecutive_failures = 0
-        while current_day < start_of_today:
-            try:
-                day_payload = await self._fetch_day_payload(
-                    current_day,
-                    ignore_etag=True,
-                )
+        try:
+            while current_day < start_of_today:
+                next_fetch_day = self._schedule_fetches(fetches, next_fetch_day, start_of_today)
+                if current_day not in fetches:
+                    # The budget is down to the reserved requests, leave them to the regular updates
+                    await self._wait_for_backfill_budget(current_day)
+                    continue
 
-                if notification_id:
-                    msg = f"Fetched {self._zonneplan_api_date_param(current_day)}"
-                    persistent_notification.create(self.hass, msg, "Statistics backfill", notification_id)
+                try:
+                    day_payload = await fetches.pop(current_day)
 
-            except ZonneplanRateLimitError as err:
-                consecutive_failures += 1
-                if not retry_on_max_connections:
-                    raise
+                except ZonneplanRateLimitError as err:
+                    consecutive_failures += 1
+                    if not retry_on_max_connections:
+                        raise
 
-                if consecutive_failures >= _BACKFILL_MAX_RETRIES:
-                    msg = f"Rate limit hit {consecutive_failures} consecutive times at {current_day}, giving up backfill"
-                    _LOGGER.warning(msg)
+                    # The prefetched days were sent in the same burst and hit the same limit, drop
+                    # them and wait once instead of counting and waiting for each of them
+                    await self._cancel_fetches(fetches)
+                    await self._wait_after_rate_limit(err, current_day, consecutive_failures, notification_id)
+                    next_fetch_day = current_day
+                    continue
+
+                if not day_payload:
+                    msg = "Missing day payload"
                     if notification_id:
                         persistent_notification.create(self.hass, msg, "Statistics backfill failed", notification_id)
-                    raise
+                    raise ZonneplanApiError(msg)
 
-                wait_seconds = (err.retry_after + 20) if err.retry_after is not None else 60
-                wait_seconds *= consecutive_failures
+                consecutive_failures = 0
+                measurements = self._extract_measurements(day_payload, "backfill")
+                self._ingest_measurements(measurements, states)
+                ingested_day = current_day
+                current_day += timedelta(days=1)
+                ingested_days += 1
+                pending_days += 1
+
+                if pending_days >= _BACKFILL_FLUSH_DAYS or self._pending_rows(states) >= _BACKFILL_FLUSH_ROWS:
+                    self._flush_backfill_batch(states, current_day, on_flushed)
+                    pending_days = 0
 
-                msg = (
-                    f"Rate limited during backfill at {current_day} (attempt {consecutive_failures}/{_BACKFILL_MAX_RETRIES}), "
-                    f"saved current stats and waiting {wait_seconds} seconds before resume"
-                )
-                _LOGGER.warning(msg)
                 if notification_id:
-                    persistent_notification.create(self.hass, msg, "Statistics backfill paused", notification_id)
+                    msg = (
+                        f"Fetched {self._zonneplan_api_date_param(ingested_day)} "
+                        f"({self._days_per_minute(ingested_days, started_at):.1f} days per minute)"
+                    )
+                    persistent_notification.create(self.hass, msg, "Statistics backfill", notification_id)
 
-                await asyncio.sleep(wait_seconds)
-                continue
+        finally:
+            await self._cancel_fetches(fetches)
+
+            # Write the last batch, also when stopped, so the recorder matches the ingested days
+            if pending_days:
+                self._flush_backfill_batch(states, current_day, on_flushed)
+
+            self._log_backfill_result(ingested_days, started_at, completed=current_day >= start_of_today)
+
+    def _log_backfill_result(self, ingested_days: int, started_at: float, *, completed: bool) -> None:
+        statistic_ids = [config.statistic_id for config in self.channel_configs]
+        elapsed = time_monotonic() - started_at
+        days_per_minute = self._days_per_minute(ingested_days, started_at)
+        if completed:
+            _LOGGER.info(
+                "Backfilled %d days for %s in %.0f seconds (%.1f days per minute)",
+                ingested_days,
+                statistic_ids,
+                elapsed,
+                days_per_minute,
+            )
+        else:
+            _LOGGER.info(
+                "Backfill for %s stopped before today, ingested %d days in %.0f seconds (%.1f days per minute)",
+                statistic_ids,
+                ingested_days,
+                elapsed,
+                days_per_minute,
+            )
 
-            if not day_payload:
-                msg = "Missing day payload"
-                if notification_id:
-                    persistent_notification.create(self.hass, msg, "Statistics backfill failed", notification_id)
-                raise ZonneplanApiError(msg)
+    def _flush_backfill_batch(
+        self,
+        states: dict[str, StatisticChannelState],
+        next_day: datetime,
+        on_flushed: Callable[[datetime], None] | None,
+    ) -> None:
+        _LOGGER.debug("Writing %d backfilled rows up to %s", self._pending_rows(states), next_day)
+        self._flush_pending(states)
+        if on_flushed:
+            on_flushed(next_day)
 
-            consecutive_failures = 0
-            measurements = self._extract_measurements(day_payload, "backfill")
-            self._ingest_measurements(measurements, states)
-            self._flush_pending(states)
-            current_day += timedelta(days=1)
+    async def _wait_after_rate_limit(
+        self,
+        err: ZonneplanRateLimitError,
+        current_day: datetime,
+        consecutive_failures: int,
+        notification_id: str | None,
+    ) -> None:
+        """Wait before retrying a rate limited day, or raise the error when retried too often."""
+        if consecutive_failures >= _BACKFILL_MAX_RETRIES:
+            msg = f"Rate limit hit {consecutive_failures} consecutive times at {current_day}, giving up backfill"
+            _LOGGER.warning(msg)
+            if notification_id:
+                persistent_notification.create(self.hass, msg, "Statistics backfill failed", notification_id)
+            raise err
+
+        wait_seconds = (err.retry_after + 20) if err.retry_after is not None else 60
+        wait_seconds *= consecutive_failures
+
+        msg = (
+            f"Rate limited during backfill at {current_day} (attempt {consecutive_failures}/{_BACKFILL_MAX_RETRIES}), "
+            f"saved current stats and waiting {wait_seconds} seconds before resume"
+        )
+        _LOGGER.warning(msg)
+        if notification_id:
+            persistent_notification.create(self.hass, msg, "Statistics backfill paused", notification_id)
+
+        await asyncio.sleep(wait_seconds)
+
+    def _schedule_fetches(
+        self,
+        fetches: dict[datetime, asyncio.Task[dict[str, Any] | None]],
+        next_fetch_day: datetime,
+        start_of_today: datetime,
+    ) -> datetime:
+        """Start fetching the next days as far as the concurrency allows, return the first day that isn't fetched yet."""
+        while next_fetch_day < start_of_today and len(fetches) < self._backfill_concurrency():
+            fetches[next_fetch_day] = self._create_fetch_task(next_fetch_day)
+            next_fetch_day += timedelta(days=1)
+
+        return next_fetch_day
+
+    @staticmethod
+    async def _cancel_fetches(fetches: dict[datetime, asyncio.Task[dict[str, Any] | None]]) -> None:
+        """Cancel the fetches and retrieve their results, so failed fetches are not reported as unhandled."""
+        for fetch in fetches.values():
+            fetch.cancel()
+        await asyncio.gather(*fetches.values(), return_exceptions=True)
+        fetches.clear()
+
+    async def _wait_for_backfill_budget(self, current_day: datetime) -> None:
+        _LOGGER.debug("Rate limit budget reserved for regular updates, delaying backfill of %s", current_day)
+        await asyncio.sleep(_BACKFILL_BUDGET_POLL_INTERVAL)
+
+    def _backfill_concurrency(self) -> int:
+        """Return the number of days to fetch at the same time, leaving rate limit budget for the regular updates."""
+        budget = int(self.api.rate_limit_tokens) - _BACKFILL_RESERVED_REQUESTS
+        return max(0, min(_BACKFILL_MAX_CONCURRENCY, budget))
+
+    def _create_fetch_task(self, day: datetime) -> asyncio.Task[dict[str, Any] | None]:
+        return self.hass.async_create_task(
+            self._fetch_day_payload(day, ignore_etag=True),
+            f"{DOMAIN} statistics backfill {self._zonneplan_api_date_param(day)}",
+        )
+
+    @staticmethod
+    def _days_per_minute(days: int, started_at: float) -> float:
+        elapsed = time_monotonic() - started_at
+        return days * 60 / elapsed if elapsed > 0 else 0.0
 
     def _extract_measurements(self, payload: dict[str, Any], context: str) -> list[dict[str, Any]]:
         if not payload:
@@ -324,46 +569,88 @@ class BaseZonneplanStatisticsService(ABC):
         measurements: list[dict[str, Any]],
         states: dict[str, StatisticChannelState],
     ) -> None:
-        last_entry_time = None
-        for entry in measurements:
-            for config in self.channel_configs:
-                entry_time = dt_util.parse_datetime(entry.get(config.date_key)).replace(minute=0, second=0, microsecond=0)
-                if (last_entry_time and entry_time < last_entry_time) or entry_time > datetime.now(tz=self.zonneplan_api_time_zone):
-                    _LOGGER.debug(
-                        "Skipping %s entry for %s last_entry_time=%s => %s",
-                        config.key,
-                        entry_time.astimezone(self.zonneplan_api_time_zone).strftime("%Y-%m-%d %H:%M"),
-                        last_entry_time.astimezone(self.zonneplan_api_time_zone).strftime("%Y-%m-%d %H:%M") if last_entry_time else "None",
-                        entry,
-                    )
+        """Add the measurements after the last statistic of every channel to its pending statistics."""
+        columns = self._measurement_columns(measurements)
+        for config in self.channel_configs:
+            hours, starts, values = columns[config.key]
+            state = states[config.key]
+            last_time = state.last_time
+            last_hour = last_time.timestamp()
+            last_state_value = state.last_state_value
+            total_sum = state.total_sum
+            pending = state.pending
+            for hour, start, value in zip(hours, starts, values, strict=True):
+                if value is None:
+                    continue
+                if hour > last_hour:
+                    total_sum += value
+                    last_hour = hour
+                    last_time = start
+                elif hour == last_hour and last_state_value is not None:
+                    total_sum += value - last_state_value
+                else:
                     continue
-                last_entry_time = entry_time
+                last_state_value = value
+                pending.append(StatisticData(start=start, state=value, sum=total_sum))
+
+            state.last_time = last_time
+            state.total_sum = total_sum
+            state.last_state_value = last_state_value
 
-                if config.value_key:
-                    raw_value = entry.get("values").get(config.value_key)
-                    if not isinstance(raw_value, (float, int)):
-                        _LOGGER.warning("Skipping %s value for entry %s", config.value_key, entry)
-                        continue
+    def _measurement_columns(self, measurements: list[dict[str, Any]]) -> dict[str, tuple[list[float], list[datetime], list[float | None]]]:
+        """
+        Parse the measurements once into hour columns and a value column per channel.
+
+        The hour columns hold the start of the hour of every measurement, as timestamp and as
+        datetime, and are shared by the channels with the same date key. Measurements in the
+        future or before an earlier measurement are dropped, values that aren't numbers are None.
+        """
+        now = dt_util.utcnow().timestamp()
+        rows_by_date_key: dict[str, tuple[list[float], list[datetime], list[dict[str, Any]]]] = {}
+        for date_key in {config.date_key for config in self.channel_configs}:
+            hours: list[float] = []
+            starts: list[datetime] = []
+            entries: list[dict[str, Any]] = []
+            last_hour = None
+            for entry in measurements:
+                date = entry.get(date_key)
+                entry_time = dt_util.parse_datetime(date) if isinstance(date, str) else None
+                if entry_time is None:
+                    _LOGGER.warning("Skipping entry without valid %s: %s", date_key, entry)
+                    continue
+
+                start = entry_time.replace(minute=0, second=0, microsecond=0)
+                hour = start.timestamp()
+                if hour > now or (last_hour is not None and hour < last_hour):
+                    continue
+
+                last_hour = hour
+                hours.append(hour)
+                starts.append(start)
+                entries.append(entry)
+
+            if len(entries) < len(measurements):
+                _LOGGER.debug("Skipped %d of %d measurements by %s", len(measurements) - len(entries), len(measurements), date_key)
+            rows_by_date_key[date_key] = (hours, starts, entries)
+
+        columns: dict[str, tuple[list[float], list[datetime], list[float | None]]] = {}
+        for config in self.channel_configs:
+            hours, starts, entries = rows_by_date_key[config.date_key]
+            values: list[float | None] = []
+            for entry in entries:
+                raw_value = (entry.get("values") or {}).get(config.value_key) if config.value_key else entry.get("value")
+                if isinstance(raw_value, (float, int)):
+                    values.append(float(raw_value) * config.value_factor)
                 else:
-                    raw_value = entry.get("value")
-                    if not isinstance(raw_value, (float, int)):
-                        _LOGGER.warning("Skipping value for entry %s", entry)
-                        continue
-
-                value = float(raw_value) * config.value_factor
-                state = states[config.key]
-
-                _LOGGER.debug("Process for %s value %s from %s", config.key, value, entry)
-
-                if entry_time > state.last_time:
-                    state.total_sum += value
-                    state.pending.append(StatisticData(start=entry_time, state=value, sum=state.total_sum))
-                    state.last_time = entry_time
-                    state.last_state_value = value
-                elif entry_time == state.last_time and state.last_state_value is not None:
-                    state.total_sum += value - state.last_state_value
-                    state.pending.append(StatisticData(start=entry_time, state=value, sum=state.total_sum))
-                    state.last_state_value = value
+                    _LOGGER.warning("Skipping %s value for entry %s", config.key, entry)
+                    values.append(None)
+            columns[config.key] = (hours, starts, values)
+
+        return columns
+
+    @staticmethod
+    def _pending_rows(states: dict[str, StatisticChannelState]) -> int:
+        return sum(len(state.pending) for state in states.values())
 
     def _flush_pending(self, states: dict[str, StatisticChannelState]) -> None:
         for state in states.values():
@@ -380,6 +667,7 @@ class BaseZonneplanStatisticsService(ABC):
                 unit_of_measurement=state.config.unit_of_measurement,
             )
             async_add_external_statistics(self.hass, metadata, state.pending)
+            self._statistic_baselines.async_update(state.config.statistic_id, state.pending)
             state.pending = []
 
         _LOGGER.info(
@@ -394,18 +682,10 @@ class BaseZonneplanStatisticsService(ABC):
             },
         )
 
-    async def _get_last_statistic(self, statistic_id: str) -> StatisticsRow | None:
-        last_stats = await get_instance(self.hass).async_add_executor_job(
-            get_last_statistics,
-            self.hass,
-            1,
-            statistic_id,
-            True,
-            {"sum", "state"},
-        )
-        if last_stats and statistic_id in last_stats and last_stats[statistic_id]:
-            return last_stats[statistic_id][0]
-        return None
+    @property
+    def backfill_id(self) -> str:
+        """Return the id of the backfill of these statistics, also used for its notifications."""
+        return ",".join([config.statistic_id for config in self.channel_configs])
 
     async def async_backfill_from(self, start_date: datetime) -> None:
         """
@@ -413,12 +693,25 @@ class BaseZonneplanStatisticsService(ABC):
 
         Queries the recorder for the cumulative sum baseline just before start_date,
         then re-fetches and re-ingests all hourly data from start_date until now.
+        Progress is checkpointed after every batch of days written, see `async_resume_backfill`.
         """
+        if self._backfill_task is not None:
+            _LOGGER.warning("Backfill for %s is already running", self.backfill_id)
+            return
+
+        # Claim the backfill before the first await, so overlapping calls and a resume don't start a second one
+        self._backfill_task = asyncio.current_task()
+        try:
+            await self._async_start_backfill_from(start_date)
+        finally:
+            self._backfill_task = None
+
+    async def _async_start_backfill_from(self, start_date: datetime) -> None:
         # Normalize to midnight of the requested date in the API timezone
         start_of_day = start_date.astimezone(self.zonneplan_api_time_zone).replace(hour=0, minute=0, second=0, microsecond=0)
         start_of_today = dt_util.now(self.zonneplan_api_time_zone).replace(hour=0, minute=0, second=0, microsecond=0)
 
-        notification_id = ",".join([config.statistic_id for config in self.channel_configs])
+        notification_id = self.backfill_id
         msg = f"Starting manual backfill for {notification_id} from {start_of_day} to {start_of_today}"
 
         _LOGGER.info(msg)
@@ -463,13 +756,150 @@ class BaseZonneplanStatisticsService(ABC):
                 last_state_value=last_state_value,
             )
 
-        await self._backfill_history(states, start_of_today, notification_id, retry_on_max_connections=True)
+        checkpoint = BackfillCheckpoint(start_date=start_of_day, next_day=min(state.last_time for state in states.values()))
+        await self._async_run_backfill(checkpoint, states)
 
-        today_payload = await self._fetch_day_payload(start_of_today, ignore_etag=True)
-        if today_payload:
-            measurements = self._extract_measurements(today_payload, "backfill-today")
-            self._ingest_measurements(measurements, states)
-            self._flush_pending(states)
+    async def async_resume_backfill(self, *, include_paused: bool = True) -> bool:
+        """
+        Continue an interrupted backfill from its checkpoint.
+
+        Returns False when there is no backfill to resume, or it is still running.
+        """
+        checkpoint = self._backfill_checkpoints.get(self.backfill_id) if self._backfill_checkpoints else None
+        if checkpoint is None or self._backfill_task is not None:
+            return False
+
+        if checkpoint.status == BACKFILL_PAUSED and not include_paused:
+            _LOGGER.info("Backfill for %s is paused at %s", self.backfill_id, checkpoint.next_day)
+            return False
+
+        if any(config.key not in checkpoint.channels for config in self.channel_configs):
+            _LOGGER.warning("Backfill checkpoint for %s doesn't match the statistics, removing it", self.backfill_id)
+            self._backfill_checkpoints.async_delete(self.backfill_id)
+            return False
+
+        states = {
+            config.key: StatisticChannelState(
+                config=config,
+                last_time=checkpoint.channels[config.key].last_time.astimezone(self.zonneplan_api_time_zone),
+                total_sum=checkpoint.channels[config.key].total_sum,
+                last_state_value=checkpoint.channels[config.key].last_state_value,
+            )
+            for config in self.channel_configs
+        }
+        # Parsed checkpoint dates have a fixed offset, days are counted in the API time zone
+        checkpoint.next_day = checkpoint.next_day.astimezone(self.zonneplan_api_time_zone)
+
+        msg = f"Resuming backfill for {self.backfill_id} from {self._zonneplan_api_date_param(checkpoint.next_day)}"
+        _LOGGER.info(msg)
+        persistent_notification.create(self.hass, msg, "Statistics backfill resumed", self.backfill_id)
+
+        await self._async_run_backfill(checkpoint, states)
+        return True
+
+    async def async_pause_backfill(self) -> bool:
+        """Stop the running backfill, keeping its checkpoint to resume later."""
+        if self._backfill_task is None:
+            return False
+
+        await self._async_stop_backfill(BACKFILL_PAUSED)
+        return True
+
+    async def async_cancel_backfill(self) -> bool:
+        """Stop the running backfill and remove its checkpoint."""
+        if self._backfill_task is not None:
+            await self._async_stop_backfill(None)
+            return True
+
+        if self._backfill_checkpoints and self._backfill_checkpoints.get(self.backfill_id):
+            self._backfill_checkpoints.async_delete(self.backfill_id)
+            return True
+
+        return False
+
+    async def async_interrupt_backfill(self) -> None:
+        """Stop the running backfill as on a restart, it is resumed from its checkpoint on the next setup."""
+        if self._backfill_task is not None:
+            await self._async_stop_backfill(BACKFILL_RUNNING)
+
+    async def _async_stop_backfill(self, status: str | None) -> None:
+        task = self._backfill_task
+        self._backfill_stop_status = status
+        task.cancel()
+        # Wait until the backfill stored (or removed) its checkpoint
+        await asyncio.wait({task})
+
+    def backfill_status(self) -> dict[str, Any] | None:
+        """Return the state of the running or interrupted backfill."""
+        checkpoint = self._backfill_checkpoints.get(self.backfill_id) if self._backfill_checkpoints else None
+        if checkpoint is None:
+            return None
+
+        return {
+            "statistic_ids": [config.statistic_id for config in self.channel_configs],
+            "status": BACKFILL_RUNNING if self._backfill_task is not None else checkpoint.status,
+            "start_date": self._zonneplan_api_date_param(checkpoint.start_date),
+            "next_day": self._zonneplan_api_date_param(checkpoint.next_day),
+        }
+
+    async def _async_run_backfill(self, checkpoint: BackfillCheckpoint, states: dict[str, StatisticChannelState]) -> None:
+        notification_id = self.backfill_id
+        start_of_today = dt_util.now(self.zonneplan_api_time_zone).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        @callback
+        def save_checkpoint(next_day: datetime, status: str = BACKFILL_RUNNING) -> None:
+            if self._backfill_checkpoints is None:
+                return
+
+            checkpoint.next_day = next_day
+            checkpoint.status = status
+            checkpoint.channels = {
+                key: ChannelCheckpoint(last_time=state.last_time, total_sum=state.total_sum, last_state_value=state.last_state_value)
+                for key, state in states.items()
+            }
+            self._backfill_checkpoints.async_set(notification_id, checkpoint)
+
+        self._backfill_task = asyncio.current_task()
+        # A restart cancels the backfill as well, it is resumed from the checkpoint on the next start
+        self._backfill_stop_status = BACKFILL_RUNNING
+        save_checkpoint(checkpoint.next_day)
+        try:
+            await self._backfill_history(
+                states,
+                start_of_today,
+                notification_id,
+                retry_on_max_connections=True,
+                first_day=checkpoint.next_day,
+                on_flushed=save_checkpoint,
+            )
+
+            today_payload = await self._fetch_day_payload(start_of_today, ignore_etag=True)
+            if today_payload:
+                measurements = self._extract_measurements(today_payload, "backfill-today")
+                self._ingest_measurements(measurements, states)
+                self._flush_pending(states)
+
+        except asyncio.CancelledError:
+            if self._backfill_stop_status is None:
+                if self._backfill_checkpoints:
+                    self._backfill_checkpoints.async_delete(notification_id)
+                msg = f"Manual backfill cancelled for {notification_id}"
+                persistent_notification.create(self.hass, msg, "Statistics backfill cancelled", notification_id)
+            elif self._backfill_stop_status == BACKFILL_PAUSED:
+                save_checkpoint(checkpoint.next_day, BACKFILL_PAUSED)
+                msg = f"Manual backfill paused for {notification_id} at {self._zonneplan_api_date_param(checkpoint.next_day)}"
+                persistent_notification.create(self.hass, msg, "Statistics backfill paused", notification_id)
+            raise
+
+        except Exception:
+            save_checkpoint(checkpoint.next_day, BACKFILL_FAILED)
+            raise
+
+        finally:
+            self._backfill_task = None
+
+        if self._backfill_checkpoints:
+            self._backfill_checkpoints.async_delete(notification_id)
 
         msg = f"Manual backfill completed for {notification_id}"
         _LOGGER.info(msg)
@@ -490,9 +920,13 @@ class ElectricityStatisticsService(BaseZonneplanStatisticsService):
         connection_uuid: str,
         delivered_id: str,
         produced_id: str,
+        backfill_checkpoints: BackfillCheckpoints | None = None,
+        statistic_baselines: StatisticBaselines | None = None,
     ) -> None:
         super().__init__(
             hass=hass,
+            backfill_checkpoints=backfill_checkpoints,
+            statistic_baselines=statistic_baselines,
         )
 
         self.api = api
@@ -519,6 +953,7 @@ class ElectricityStatisticsService(BaseZonneplanStatisticsService):
                 unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
             ),
         )
+        self._statistic_baselines.register(config.statistic_id for config in self.channel_configs)
 
     async def _fetch_day_payload(self, day: datetime, *, ignore_etag: bool = False) -> dict[str, Any] | None:
         date_str = self._zonneplan_api_date_param(day)
@@ -538,9 +973,13 @@ class GasStatisticsService(BaseZonneplanStatisticsService):
         api: AsyncConfigEntryAuth,
         connection_uuid: str,
         gas_id: str,
+        backfill_checkpoints: BackfillCheckpoints | None = None,
+        statistic_baselines: StatisticBaselines | None = None,
     ) -> None:
         super().__init__(
             hass=hass,
+            backfill_checkpoints=backfill_checkpoints,
+            statistic_baselines=statistic_baselines,
         )
 
         self.api = api
@@ -557,6 +996,7 @@ class GasStatisticsService(BaseZonneplanStatisticsService):
                 unit_of_measurement=UnitOfVolume.CUBIC_METERS,
             ),
         )
+        self._statistic_baselines.register(config.statistic_id for config in self.channel_configs)
 
     async def _fetch_day_payload(self, day: datetime, *, ignore_etag: bool = False) -> dict[str, Any] | None:
         date_str = self._zonneplan_api_date_param(day)
@@ -0,0 +1,74 @@
+"""Pre-parsed value paths into coordinator data."""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ValuePath:
+    """
+    Dotted path like `contracts.0.meta.state_of_charge` parsed into its segments.
+
+    Numeric segments (including negative ones) are list indexes, all other segments are dict keys.
+    """
+
+    __slots__ = ("path", "segments")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.segments: tuple[int | str, ...] = tuple(int(key) if key.lstrip("-").isdigit() else key for key in path.split("."))
+
+    def get(self, data: Any) -> dict | str | int | float | bool | None:
+        return self._walk(data, self.segments, log=True)
+
+    def lookup(self, data: Any) -> Any:
+        """Return the value like `get`, without logging missing parts."""
+        return self._walk(data, self.segments, log=False)
+
+    def set(self, data: Any, value: Any) -> None:
+        rv = self._walk(data, self.segments[:-1], log=False)
+        if rv is None:
+            return
+
+        last_key = self.segments[-1]
+        if type(last_key) is int:
+            if type(rv) is list and -len(rv) <= last_key < len(rv):
+                rv[last_key] = value
+        else:
+            rv[last_key] = value
+
+    def _walk(self, data: Any, segments: tuple[int | str, ...], *, log: bool) -> Any:
+        """Follow the segments into the data, return None when a part is missing."""
+        rv = data
+        for key in segments:
+            if rv is None:
+                if log:
+                    _LOGGER.info("No value for %s part (%s)", self.path, key)
+                return None
+
+            if type(key) is int:
+                if type(rv) is not list or not -len(rv) <= key < len(rv):
+                    if log:
+                        _LOGGER.info("Could not find %d of %s", key, self.path)
+                        _LOGGER.debug(" in %s %s", rv, type(rv))
+                    return None
+
+            elif key not in rv:
+                if log:
+                    _LOGGER.info("Could not find %s of %s", key, self.path)
+                    _LOGGER.debug("in %s", rv)
+                return None
+
+            rv = rv[key]
+
+        return rv
+
+
+@lru_cache(maxsize=1024)
+def compile_value_path(path: str) -> ValuePath:
+    """Return the (cached) parsed value path."""
+    return ValuePath(path)
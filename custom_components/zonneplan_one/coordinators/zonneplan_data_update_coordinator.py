@@ -1,21 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
+from aiohttp.client_exceptions import ClientResponseError
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .value_path import ValuePath, compile_value_path
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
     from datetime import timedelta
 
     from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+# Errors that fail the whole update, a partial update would hide them
+_FATAL_STATUSES = frozenset({HTTPStatus.UNAUTHORIZED, HTTPStatus.TOO_MANY_REQUESTS})
+
 
 class ZonneplanDataUpdateCoordinator(DataUpdateCoordinator):
     _custom_data_update_interval: timedelta | None
+    _listener_data: Any = None
+    _refreshing: bool = False
 
     def __init__(
         self,
@@ -26,8 +37,15 @@ class ZonneplanDataUpdateCoordinator(DataUpdateCoordinator):
     ) -> None:
         super().__init__(hass, logger, update_interval=None, **kwargs)
         self._custom_data_update_interval = update_interval
+        self._value_path_listeners: dict[ValuePath, set[CALLBACK_TYPE]] = {}
 
     def async_add_listener(self, update_callback: CALLBACK_TYPE, context: Any = None) -> Callable[[], None]:
+        """
+        Listen for data updates.
+
+        A listener that passes the value paths it reads as context (a frozenset of
+        ValuePath) is only updated after a refresh when one of those values changed.
+        """
         # Initiate interval after first item registration
         if len(self._listeners) == 0:
             _LOGGER.info(
@@ -39,58 +57,104 @@ class ZonneplanDataUpdateCoordinator(DataUpdateCoordinator):
             self.update_interval = self._custom_data_update_interval
             self.hass.async_create_task(self._async_refresh())
 
-        return super().async_add_listener(update_callback, context)
-
-    def get_data_value(self, value_path: str) -> dict | str | int | float | bool | None:
-        keys = value_path.split(".")
-        rv = self.data
-        for key in keys:
-            if rv is None:
-                _LOGGER.info("No value for %s part (%s)", value_path, key)
-                return None
-
-            _key = key
-            if _key.lstrip("-").isdigit():
-                _key = int(key)
-                if type(rv) is not list or (_key >= 0 and len(rv) <= _key) or (_key < 0 and -len(rv) > _key):
-                    _LOGGER.info(
-                        "Could not find %d of %s",
-                        _key,
-                        value_path,
-                    )
-                    _LOGGER.debug(" in %s %s", rv, type(rv))
-                    return None
-
-            elif _key not in rv:
-                _LOGGER.info("Could not find %s of %s", key, value_path)
-                _LOGGER.debug("in %s", rv)
-                return None
-            rv = rv[_key]
-
-        return rv
-
-    def set_data_value(self, value_path: str, value: str | int) -> None:
-        keys = value_path.split(".")
-        rv = self.data
-        for key in keys[:-1]:
-            if rv is None:
-                return
-
-            _key = key
-            if _key.lstrip("-").isdigit():
-                _key = int(_key)
-                if type(rv) is not list or (_key >= 0 and len(rv) <= _key) or (_key < 0 and -len(rv) > _key):
-                    return
-
-            elif _key not in rv:
-                return
-
-            rv = rv[_key]
-
-        last_key = keys[-1]
-        if last_key.isdigit():
-            last_key = int(last_key)
-            if type(rv) is list and len(rv) > last_key:
-                rv[last_key] = value
-        else:
-            rv[last_key] = value
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not isinstance(context, frozenset):
+            return remove_listener
+
+        for value_path in context:
+            self._value_path_listeners.setdefault(value_path, set()).add(update_callback)
+
+        @callback
+        def remove_value_path_listener() -> None:
+            remove_listener()
+            for value_path in context:
+                listeners = self._value_path_listeners[value_path]
+                listeners.discard(update_callback)
+                if not listeners:
+                    del self._value_path_listeners[value_path]
+
+        return remove_value_path_listener
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        self._refreshing = True
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            self._refreshing = False
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update all registered listeners.
+
+        After a refresh the listeners are skipped when the fetched data equals the data
+        the listeners were last updated with, and listeners with value path dependencies
+        are only updated when one of their values changed. Updates outside a refresh (time
+        based updates or local changes to the data), the first refresh after a failed one,
+        and data changed in place (the same object as before) always reach all listeners.
+
+        The data is compared with `==`, which stops at the first difference and doesn't
+        serialize the data like a hash of its JSON would. An unchanged payload is still
+        walked completely, once per refresh.
+        """
+        previous_data = self._listener_data
+        self._listener_data = self.data if self._refreshing and self.last_update_success else None
+
+        if self._listener_data is None or previous_data is None or previous_data is self.data:
+            super().async_update_listeners()
+            return
+
+        if previous_data == self.data:
+            _LOGGER.debug("Data of %s unchanged, skip listener update", self.name)
+            return
+
+        changed_listeners: set[CALLBACK_TYPE] = set()
+        changed_paths = 0
+        for value_path, listeners in self._value_path_listeners.items():
+            if value_path.lookup(previous_data) != value_path.lookup(self.data):
+                changed_listeners.update(listeners)
+                changed_paths += 1
+
+        _LOGGER.debug("Data of %s changed, %d of %d value paths changed", self.name, changed_paths, len(self._value_path_listeners))
+
+        for update_callback, context in list(self._listeners.values()):
+            if not isinstance(context, frozenset) or update_callback in changed_listeners:
+                update_callback()
+
+    async def _async_gather(self, *requests: Awaitable[Any], allow_partial: bool = True) -> list[Any]:
+        """
+        Run independent requests concurrently.
+
+        A failed request results in None, so the caller keeps its previous data for it.
+        When every request failed, one was unauthorized or rate limited, or the caller needs
+        all results (allow_partial=False), the first error is raised.
+        """
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if not errors:
+            return results
+
+        for error in errors:
+            if not isinstance(error, Exception) or (isinstance(error, ClientResponseError) and error.status in _FATAL_STATUSES):
+                raise error
+
+        if not allow_partial or len(errors) == len(results):
+            raise errors[0]
+
+        for error in errors:
+            self.logger.warning("Partial update of %s failed, keeping previous data: %s", self.name, error)
+
+        return [None if isinstance(result, BaseException) else result for result in results]
+
+    def get_data_value(self, value_path: str | ValuePath) -> dict | str | int | float | bool | None:
+        if isinstance(value_path, str):
+            value_path = compile_value_path(value_path)
+
+        return value_path.get(self.data)
+
+    def set_data_value(self, value_path: str | ValuePath, value: str | int) -> None:
+        if isinstance(value_path, str):
+            value_path = compile_value_path(value_path)
+
+        value_path.set(self.data, value)
+        self._listener_data = None
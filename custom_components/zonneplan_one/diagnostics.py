@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
 
+from .coordinators.zonneplan_data_update_coordinator import ZonneplanDataUpdateCoordinator
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
@@ -41,11 +43,11 @@ async def async_get_config_entry_diagnostics(
             key = field.name
             coordinator = getattr(connection, field.name)
 
-            if coordinator:
+            if isinstance(coordinator, ZonneplanDataUpdateCoordinator):
                 coordinator_data[uuid][key] = coordinator.data
 
     return {
         "account_data": async_redact_data(entry.runtime_data.data, TO_REDACT),
-        "last_api_responses": async_redact_data(entry.runtime_data.api.diagnostics, TO_REDACT),
+        "last_api_responses": async_redact_data(entry.runtime_data.api.diagnostics.as_dict(), TO_REDACT),
         "coordinator_data": async_redact_data(coordinator_data, TO_REDACT),
     }
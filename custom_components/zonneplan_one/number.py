@@ -16,6 +16,7 @@ from .const import (
 from .coordinators.account_data_coordinator import ZonneplanConfigEntry
 from .coordinators.battery_control_data_coordinator import BatteryControlDataUpdateCoordinator
 from .coordinators.battery_data_coordinator import BatteryDataUpdateCoordinator
+from .coordinators.value_path import compile_value_path
 from .entity import BatteryEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -83,6 +84,13 @@ class ZonneplanBatteryControlNumber(BatteryEntity, CoordinatorEntity, NumberEnti
         self._key = _key
         self.entity_description = description
 
+        key = description.key.format(install_index=install_index)
+        self._value_path = compile_value_path(key)
+        self._min_value_path = compile_value_path(key.replace("_watts", "_limits.min_watts"))
+        self._max_value_path = compile_value_path(key.replace("_watts", "_limits.max_watts"))
+        self._control_mode_path = compile_value_path("battery_control_mode.control_mode")
+        self.coordinator_context = frozenset((self._value_path, self._min_value_path, self._max_value_path, self._control_mode_path))
+
     @property
     def unique_id(self) -> str | None:
         """Return a unique ID."""
@@ -94,39 +102,24 @@ class ZonneplanBatteryControlNumber(BatteryEntity, CoordinatorEntity, NumberEnti
         if not self.coordinator.data or not self.coordinator.last_update_success:
             return False
 
-        control_mode = self.coordinator.get_data_value("battery_control_mode.control_mode")
+        control_mode = self.coordinator.get_data_value(self._control_mode_path)
 
         return control_mode == "home_optimization"
 
     @property
     def native_min_value(self) -> float:
-        return (
-            self.coordinator.get_data_value(
-                self.entity_description.key.format(install_index=self._install_index).replace("_watts", "_limits.min_watts"),
-            )
-            or 0
-        )
+        return self.coordinator.get_data_value(self._min_value_path) or 0
 
     @property
     def native_max_value(self) -> float:
-        return (
-            self.coordinator.get_data_value(
-                self.entity_description.key.format(install_index=self._install_index).replace("_watts", "_limits.max_watts"),
-            )
-            or 2000
-        )
+        return self.coordinator.get_data_value(self._max_value_path) or 2000
 
     @property
     def native_value(self) -> float:
-        return self.coordinator.get_data_value(
-            self.entity_description.key.format(install_index=self._install_index),
-        )
+        return self.coordinator.get_data_value(self._value_path)
 
     async def async_set_native_value(self, value: float) -> None:
-        self.coordinator.set_data_value(
-            self.entity_description.key.format(install_index=self._install_index),
-            int(value),
-        )
+        self.coordinator.set_data_value(self._value_path, int(value))
 
         await self.coordinator.async_enable_home_optimization()
 
@@ -153,6 +146,11 @@ class ZonneplanReserveDischargeNumber(BatteryEntity, CoordinatorEntity, NumberEn
         self._key = _key
         self.entity_description = description
 
+        self._value_path = compile_value_path(description.key.format(install_index=install_index))
+        self._backup_power_capable_path = compile_value_path(f"contracts.{install_index}.meta.backup_power_capable")
+        self._usable_capacity_path = compile_value_path(f"contracts.{install_index}.meta.backup_power_usable_capacity_wh")
+        self.coordinator_context = frozenset((self._value_path, self._backup_power_capable_path, self._usable_capacity_path))
+
     @property
     def unique_id(self) -> str | None:
         """Return a unique ID."""
@@ -164,9 +162,7 @@ class ZonneplanReserveDischargeNumber(BatteryEntity, CoordinatorEntity, NumberEn
         if not self.coordinator.data or not self.coordinator.last_update_success:
             return False
 
-        backup_power_capable_key = "contracts.{install_index}.meta.backup_power_capable"
-
-        return bool(self.coordinator.get_data_value(backup_power_capable_key.format(install_index=self._install_index)))
+        return bool(self.coordinator.get_data_value(self._backup_power_capable_path))
 
     @property
     def native_min_value(self) -> float:
@@ -174,23 +170,13 @@ class ZonneplanReserveDischargeNumber(BatteryEntity, CoordinatorEntity, NumberEn
 
     @property
     def native_max_value(self) -> float:
-        return float(
-            self.coordinator.get_data_value(
-                f"contracts.{self._install_index}.meta.backup_power_usable_capacity_wh",
-            )
-            or 3000
-        )
+        return float(self.coordinator.get_data_value(self._usable_capacity_path) or 3000)
 
     @property
     def native_value(self) -> float:
-        return self.coordinator.get_data_value(
-            self.entity_description.key.format(install_index=self._install_index),
-        )
+        return self.coordinator.get_data_value(self._value_path)
 
     async def async_set_native_value(self, value: float) -> None:
-        self.coordinator.set_data_value(
-            self.entity_description.key.format(install_index=self._install_index),
-            int(value),
-        )
+        self.coordinator.set_data_value(self._value_path, int(value))
 
         await self.coordinator.async_set_reserve_discharge(int(value))
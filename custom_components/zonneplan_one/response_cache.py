@@ -0,0 +1,127 @@
+"""Persistent ETag and response cache for the Zonneplan API."""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+_SAVE_DELAY = 30
+_MAX_AGE = timedelta(days=7)
+# Dated urls (charts, statistics backfills) add a response per day, keep the most recently used ones
+_MAX_RESPONSES = 200
+
+
+@dataclass
+class CachedResponse:
+    etag: str
+    body: str
+    last_used: datetime
+
+    def data(self) -> Any:
+        """Return a fresh copy of the cached response data."""
+        return json_loads(self.body)
+
+
+class ResponseCache:
+    """
+    ETags and matching response data per url, persisted between restarts.
+
+    Bodies are kept serialized, every hit decodes a new copy so callers can
+    safely mutate the data they get back.
+
+    A changed body is written with a delay, the usage times are only updated in
+    memory and written by `async_save` when the config entry unloads or Home
+    Assistant stops, so revalidated responses don't rewrite the file.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, dict[str, str]]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.response_cache")
+        self._responses: dict[str, CachedResponse] = {}
+        self._unsaved = False
+
+    async def async_load(self) -> None:
+        """Load cached responses, dropping the ones that weren't used recently."""
+        stored = await self._store.async_load() or {}
+        expire_before = dt_util.utcnow() - _MAX_AGE
+
+        for url, item in stored.items():
+            last_used = dt_util.parse_datetime(item.get("last_used", ""))
+            if not last_used or last_used < expire_before or not item.get("etag"):
+                continue
+            self._responses[url] = CachedResponse(etag=item["etag"], body=item["body"], last_used=last_used)
+
+        self._evict()
+        _LOGGER.debug("Loaded %s cached responses", len(self._responses))
+
+    async def async_save(self, _event: Event | None = None) -> None:
+        """Write the cached responses and their usage times, when anything changed since the last write."""
+        if self._unsaved:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the persisted cache."""
+        self._responses.clear()
+        await self._store.async_remove()
+
+    def get(self, url: str) -> CachedResponse | None:
+        return self._responses.get(url)
+
+    @callback
+    def async_touch(self, url: str) -> None:
+        """Mark the cached response as still valid."""
+        if cached := self._responses.get(url):
+            cached.last_used = dt_util.utcnow()
+            self._unsaved = True
+
+    @callback
+    def async_set(self, url: str, etag: str | None, data: Any) -> None:
+        """Store the response data for the given url, the cache is only written when the body changed."""
+        if not etag:
+            if self._responses.pop(url, None) is not None:
+                self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+            return
+
+        body = json_dumps(data)
+        cached = self._responses.get(url)
+        if cached is not None and cached.body == body:
+            cached.etag = etag
+            cached.last_used = dt_util.utcnow()
+            self._unsaved = True
+            return
+
+        self._responses[url] = CachedResponse(etag=etag, body=body, last_used=dt_util.utcnow())
+        self._evict()
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    def _evict(self) -> None:
+        """Drop the responses that weren't used recently, and the least recently used ones above the maximum."""
+        expire_before = dt_util.utcnow() - _MAX_AGE
+        for url in [url for url, cached in self._responses.items() if cached.last_used < expire_before]:
+            del self._responses[url]
+
+        if (excess := len(self._responses) - _MAX_RESPONSES) > 0:
+            for url in sorted(self._responses, key=lambda url: self._responses[url].last_used)[:excess]:
+                del self._responses[url]
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, str]]:
+        self._unsaved = False
+        return {
+            url: {
+                "etag": cached.etag,
+                "body": cached.body,
+                "last_used": cached.last_used.isoformat(),
+            }
+            for url, cached in self._responses.items()
+        }
@@ -0,0 +1,77 @@
+"""Bounded store of the last API responses for diagnostics."""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.util.json import json_loads
+
+DEFAULT_MAX_RESPONSES_PER_ENDPOINT = 3
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+
+class ResponseDiagnostics:
+    """
+    Last responses per path, kept as serialized bytes.
+
+    Paths are grouped per endpoint (the path without query), every endpoint keeps
+    its most recent responses and the oldest responses are dropped as soon as the
+    total size exceeds the byte budget. `endpoint_limits` overrides the number of
+    responses for the endpoints ending with one of its keys.
+    """
+
+    def __init__(
+        self,
+        max_responses_per_endpoint: int = DEFAULT_MAX_RESPONSES_PER_ENDPOINT,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        endpoint_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        self._max_responses_per_endpoint = max_responses_per_endpoint
+        self._max_bytes = max_bytes
+        self._endpoint_limits = dict(endpoint_limits or {})
+        self._responses: OrderedDict[str, bytes] = OrderedDict()
+        self._endpoints: dict[str, OrderedDict[str, None]] = {}
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the stored responses in bytes."""
+        return self._size
+
+    def add(self, path: str, body: bytes) -> None:
+        """Store the raw response body of a path."""
+        self._remove(path)
+
+        endpoint = path.split("?", 1)[0]
+        paths = self._endpoints.setdefault(endpoint, OrderedDict())
+        paths[path] = None
+        self._responses[path] = body
+        self._size += len(body)
+
+        while len(paths) > self._endpoint_limit(endpoint):
+            self._remove(next(iter(paths)))
+
+        while self._size > self._max_bytes and len(self._responses) > 1:
+            self._remove(next(iter(self._responses)))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the decoded responses per path."""
+        return {path: json_loads(body) for path, body in self._responses.items()}
+
+    def _endpoint_limit(self, endpoint: str) -> int:
+        for suffix, limit in self._endpoint_limits.items():
+            if endpoint.endswith(suffix):
+                return limit
+        return self._max_responses_per_endpoint
+
+    def _remove(self, path: str) -> None:
+        body = self._responses.pop(path, None)
+        if body is None:
+            return
+
+        self._size -= len(body)
+        endpoint = path.split("?", 1)[0]
+        paths = self._endpoints[endpoint]
+        del paths[path]
+        if not paths:
+            del self._endpoints[endpoint]
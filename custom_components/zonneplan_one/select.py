@@ -16,6 +16,7 @@ from .coordinators.account_data_coordinator import ZonneplanConfigEntry
 from .coordinators.battery_control_data_coordinator import (
     BatteryControlDataUpdateCoordinator,
 )
+from .coordinators.value_path import compile_value_path
 from .entity import BatteryEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -69,6 +70,10 @@ class ZonneplanBatteryControlModeSelect(BatteryEntity, CoordinatorEntity, Select
         self._key = _key
         self.entity_description = description
 
+        self._value_path = compile_value_path(description.key)
+        self._modes_path = compile_value_path("battery_control_mode.modes")
+        self.coordinator_context = frozenset((self._value_path, self._modes_path))
+
     @property
     def unique_id(self) -> str | None:
         """Return a unique ID."""
@@ -84,12 +89,12 @@ class ZonneplanBatteryControlModeSelect(BatteryEntity, CoordinatorEntity, Select
         if not self.available:
             return []
 
-        modes = self.coordinator.get_data_value("battery_control_mode.modes") or {}
+        modes = self.coordinator.get_data_value(self._modes_path) or {}
         return [key for key, value in modes.items() if value.get("available")]
 
     @property
     def current_option(self) -> str:
-        return self.coordinator.get_data_value(self.entity_description.key)
+        return self.coordinator.get_data_value(self._value_path)
 
     async def async_select_option(self, option: str) -> None:
         if option == "self_consumption":
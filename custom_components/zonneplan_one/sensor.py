@@ -3,6 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
+from dataclasses import fields, replace
 from datetime import datetime
 from typing import Any
 
@@ -26,10 +27,12 @@ from .const import (
     BATTERY_CHARTS,
     BATTERY_CONTROL,
     CHARGE_POINT,
+    CONF_FORECAST_ATTRIBUTES,
     DOMAIN,
     ELECTRICITY,
     ELECTRICITY_HOME_CONSUMPTION,
     ELECTRICITY_PRICES,
+    GAS,
     GAS_PRICES,
     NONE_IS_ZERO,
     NONE_USE_PREVIOUS,
@@ -60,6 +63,7 @@ from .coordinators.gas_data_coordinator import GasDataUpdateCoordinator
 from .coordinators.gas_prices_data_coordinator import GasPricesDataUpdateCoordinator
 from .coordinators.pv_data_coordinator import PvDataUpdateCoordinator
 from .coordinators.summary_data_coordinator import SummaryDataUpdateCoordinator
+from .coordinators.value_path import compile_value_path
 from .coordinators.zonneplan_data_update_coordinator import (
     ZonneplanDataUpdateCoordinator,
 )
@@ -70,6 +74,9 @@ from .entity import (
     PvEntity,
     base_device_info,
 )
+from .zonneplan_api.models import ZonneplanPriceSlot
+from .zonneplan_api.price_analytics import PRICE_FIELDS, SlotAnalytics
+from .zonneplan_api.types import ZonneplanContract
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +91,7 @@ async def async_setup_entry(
     entities = []
 
     connection_uuids: list[str] = list(entry.runtime_data.coordinators.keys())
+    forecast_attributes: bool = entry.options.get(CONF_FORECAST_ATTRIBUTES, True)
 
     for uuid, connection in entry.runtime_data.coordinators.items():
         _LOGGER.debug("Setup sensors for connection %s", uuid)
@@ -92,9 +100,9 @@ async def async_setup_entry(
         other_connection_uuids = [u for u in connection_uuids if u != uuid]
         _LOGGER.debug("Other connections: %s", other_connection_uuids)
 
-        await add_electricity_sensors(entities, connection, uuid, hass, other_connection_uuids)
+        await add_electricity_sensors(entities, connection, uuid, hass, other_connection_uuids, forecast_attributes=forecast_attributes)
 
-        await add_gas_sensors(entities, connection, uuid, hass, other_connection_uuids)
+        await add_gas_sensors(entities, connection, uuid, hass, other_connection_uuids, forecast_attributes=forecast_attributes)
 
         await add_pv_installation_sensors(entities, connection, uuid)
 
@@ -166,7 +174,13 @@ async def async_setup_entry(
 
 
 async def add_electricity_sensors(
-    entities: list[Any], connection: ConnectionCoordinators, uuid: str, hass: HomeAssistant, other_connection_uuids: list[str]
+    entities: list[Any],
+    connection: ConnectionCoordinators,
+    uuid: str,
+    hass: HomeAssistant,
+    other_connection_uuids: list[str],
+    *,
+    forecast_attributes: bool = True,
 ) -> None:
     if not connection.electricity or not connection.electricity_prices:
         return
@@ -178,6 +192,7 @@ async def add_electricity_sensors(
             connection.electricity,
             -1,
             SENSOR_TYPES[ELECTRICITY][sensor_key],
+            connection.contracts[ELECTRICITY],
         )
         for sensor_key in SENSOR_TYPES[ELECTRICITY]
     )
@@ -188,7 +203,8 @@ async def add_electricity_sensors(
             sensor_key,
             connection.electricity_prices,
             -1,
-            SENSOR_TYPES[ELECTRICITY_PRICES][sensor_key],
+            _price_sensor_description(SENSOR_TYPES[ELECTRICITY_PRICES][sensor_key], forecast_attributes=forecast_attributes),
+            connection.contracts[ELECTRICITY],
         )
         for sensor_key in SENSOR_TYPES[ELECTRICITY_PRICES]
     )
@@ -208,7 +224,13 @@ async def add_electricity_sensors(
 
 
 async def add_gas_sensors(
-    entities: list[Any], connection: ConnectionCoordinators, uuid: str, hass: HomeAssistant, other_connection_uuids: list[str]
+    entities: list[Any],
+    connection: ConnectionCoordinators,
+    uuid: str,
+    hass: HomeAssistant,
+    other_connection_uuids: list[str],
+    *,
+    forecast_attributes: bool = True,
 ) -> None:
     if not connection.gas_prices:
         return
@@ -219,7 +241,8 @@ async def add_gas_sensors(
             sensor_key,
             connection.gas_prices,
             -1,
-            SENSOR_TYPES[GAS_PRICES][sensor_key],
+            _price_sensor_description(SENSOR_TYPES[GAS_PRICES][sensor_key], forecast_attributes=forecast_attributes),
+            connection.contracts[GAS],
         )
         for sensor_key in SENSOR_TYPES[GAS_PRICES]
     )
@@ -230,6 +253,16 @@ async def add_gas_sensors(
             _migrate_to_new_unique_id(hass, f"{uuid}_{sensor_key}", f"{other_connection_uud}_{sensor_key}")
 
 
+def _price_sensor_description(
+    description: ZonneplanSensorEntityDescription, *, forecast_attributes: bool
+) -> ZonneplanSensorEntityDescription:
+    """Drop the forecast attribute when disabled, the forecast is available through the get_price_forecast service."""
+    if forecast_attributes or not description.attributes:
+        return description
+
+    return replace(description, attributes=[attribute for attribute in description.attributes if attribute.label != "forecast"] or None)
+
+
 async def add_p1_gas_sensors(entities: list[Any], connection: ConnectionCoordinators, uuid: str) -> None:
     if not connection.p1_gas:
         return
@@ -363,6 +396,23 @@ class ZonneplanSensor(CoordinatorEntity, RestoreSensor, ABC):
         self._install_index = install_index
         self.entity_description = description
 
+        self._value_path = None
+        if not description.timeline:
+            self._value_path = compile_value_path(description.key.format(install_index=install_index))
+        self._attribute_paths = [
+            (attribute.label, compile_value_path(attribute.key.format(install_index=install_index)))
+            for attribute in description.attributes or []
+        ]
+        self._last_reset_path = (
+            compile_value_path(description.last_reset_key.format(install_index=install_index)) if description.last_reset_key else None
+        )
+
+        # Sensors with a timeline read a different value every slot, those are always updated
+        if self._value_path:
+            self.coordinator_context = frozenset(
+                filter(None, (self._value_path, self._last_reset_path, *(value_path for _, value_path in self._attribute_paths)))
+            )
+
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
@@ -381,12 +431,10 @@ class ZonneplanSensor(CoordinatorEntity, RestoreSensor, ABC):
 
     @property
     def last_reset(self) -> datetime | None:
-        if not self.entity_description.last_reset_key:
+        if not self._last_reset_path:
             return None
 
-        value = self.coordinator.get_data_value(
-            self.entity_description.last_reset_key.format(install_index=self._install_index),
-        )
+        value = self.coordinator.get_data_value(self._last_reset_path)
 
         if value:
             value = dt_util.parse_datetime(value)
@@ -409,27 +457,26 @@ class ZonneplanSensor(CoordinatorEntity, RestoreSensor, ABC):
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        if not self.entity_description.attributes:
+        if not self._attribute_paths and not self.entity_description.analytics_attributes:
             return None
 
         attrs = {}
-        for attribute in self.entity_description.attributes:
-            value = self.coordinator.get_data_value(
-                attribute.key.format(install_index=self._install_index),
-            )
-            _LOGGER.debug("Update %s.attribute[%s]: %s", self.unique_id, attribute.label, value)
-            attrs[attribute.label] = value
+        for label, value_path in self._attribute_paths:
+            value = self.coordinator.get_data_value(value_path)
+            _LOGGER.debug("Update %s.attribute[%s]: %s", self.unique_id, label, value)
+            attrs[label] = value
+
+        if self.entity_description.analytics_attributes:
+            attrs.update(self._analytics_attributes())
 
         return attrs
 
     def _value_from_coordinator(self) -> datetime | str | float | int | None:
-        key = (
-            self.entity_description.key_lambda()
-            if self.entity_description.key_lambda
-            else self.entity_description.key.format(install_index=self._install_index)
-        )
-        _LOGGER.debug("Key %s: %s", self.unique_id, key)
-        raw_value = value = self.coordinator.get_data_value(key)
+        if self.entity_description.timeline:
+            raw_value = value = self._value_from_timeline()
+        else:
+            _LOGGER.debug("Key %s: %s", self.unique_id, self._value_path)
+            raw_value = value = self.coordinator.get_data_value(self._value_path)
 
         if value is None and self.entity_description.none_value_behaviour == NONE_IS_ZERO:
             value = 0
@@ -451,10 +498,42 @@ class ZonneplanSensor(CoordinatorEntity, RestoreSensor, ABC):
 
         return value
 
+    def _value_from_timeline(self) -> str | int | float | None:
+        slot = self._timeline_slot()
+        _LOGGER.debug("Slot %s: %s", self.unique_id, slot)
+
+        if slot and self.entity_description.timeline_analytics:
+            slot = self._slot_analytics(slot)
+
+        return getattr(slot, self.entity_description.key) if slot else None
+
+    def _timeline_slot(self) -> ZonneplanPriceSlot | None:
+        # The price view is resolved once per slot boundary, so all sensors agree on the current slot
+        slots = self.coordinator.price_view.get(self.entity_description.timeline) or []
+        offset = self.entity_description.timeline_offset
+        return slots[offset] if offset < len(slots) else None
+
+    def _slot_analytics(self, slot: ZonneplanPriceSlot) -> SlotAnalytics | None:
+        # Analytics are computed by the coordinator once per price refresh
+        return self.coordinator.price_analytics.get(self.entity_description.timeline, {}).get(slot.start)
+
+    def _analytics_attributes(self) -> dict[str, Any]:
+        slot = self._timeline_slot()
+        analytics = self._slot_analytics(slot) if slot else None
+        if analytics is None:
+            return {}
+
+        value_factor = self.entity_description.value_factor or 1
+        return {
+            name: value * value_factor if name in PRICE_FIELDS else value
+            for name, value in ((field.name, getattr(analytics, field.name)) for field in fields(analytics))
+        }
+
 
 class ZonneplanElectricitySensor(ZonneplanSensor):
     coordinator: SummaryDataUpdateCoordinator | ElectricityPricesDataUpdateCoordinator
-    _unrecorded_attributes = frozenset({"forecast"})
+    # The analytics change with every price refresh, like the forecast they aren't worth recording
+    _unrecorded_attributes = frozenset({"forecast", *(field.name for field in fields(SlotAnalytics))})
 
     def __init__(
         self,
@@ -463,9 +542,11 @@ class ZonneplanElectricitySensor(ZonneplanSensor):
         coordinator: ZonneplanDataUpdateCoordinator | ElectricityPricesDataUpdateCoordinator,
         install_index: int,
         description: ZonneplanSensorEntityDescription,
+        contract: ZonneplanContract,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(connection_uuid, sensor_key, coordinator, install_index, description)
+        self._contract = contract
 
         self.entity_id = f"sensor.zonneplan_{sensor_key}"
 
@@ -478,9 +559,9 @@ class ZonneplanElectricitySensor(ZonneplanSensor):
     def device_info(self) -> DeviceInfo:
         """Return the device information."""
         return {
-            "identifiers": {(DOMAIN, self.coordinator.contract["uuid"])},
+            "identifiers": {(DOMAIN, self._contract["uuid"])},
             "manufacturer": "Zonneplan",
-            "name": self.coordinator.contract["label"],
+            "name": self._contract["label"],
         }
 
 
@@ -495,9 +576,11 @@ class ZonneplanGasSensor(ZonneplanSensor):
         coordinator: ZonneplanDataUpdateCoordinator,
         install_index: int,
         description: ZonneplanSensorEntityDescription,
+        contract: ZonneplanContract,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(connection_uuid, sensor_key, coordinator, install_index, description)
+        self._contract = contract
 
         self.entity_id = f"sensor.zonneplan_{sensor_key}"
 
@@ -510,9 +593,9 @@ class ZonneplanGasSensor(ZonneplanSensor):
     def device_info(self) -> DeviceInfo:
         """Return the device information."""
         return {
-            "identifiers": {(DOMAIN, self.coordinator.contract["uuid"])},
+            "identifiers": {(DOMAIN, self._contract["uuid"])},
             "manufacturer": "Zonneplan",
-            "name": self.coordinator.contract["label"],
+            "name": self._contract["label"],
         }
 
 
@@ -1,11 +1,13 @@
 """Zonneplan integration services."""
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import UnitOfEnergy, UnitOfVolume
 from homeassistant.core import (
     HomeAssistant,
     ServiceCall,
@@ -18,8 +20,13 @@ from homeassistant.exceptions import ServiceValidationError
 from .const import (
     DOMAIN,
     ELECTRICITY,
+    ELECTRICITY_PRICES,
     GAS,
+    GAS_PRICES,
 )
+from .coordinators.electricity_prices_data_coordinator import ElectricityPricesDataUpdateCoordinator
+from .coordinators.gas_prices_data_coordinator import GasPricesDataUpdateCoordinator
+from .zonneplan_api.price_windows import find_price_windows
 
 SERVICE_FETCH_STATISTICS = "fetch_statistics"
 _ATTR_ENDPOINT = "endpoint"
@@ -29,12 +36,61 @@ _DATE_FORMATS = ("%Y%m%d", "%Y-%m-%d")
 
 SERVICE_FETCH_STATISTICS_SCHEMA = vol.Schema(
     {
-        vol.Required(_ATTR_ENDPOINT): vol.In([ELECTRICITY, GAS]),
+        vol.Required(_ATTR_ENDPOINT): vol.In([ELECTRICITY, GAS, ELECTRICITY_PRICES, GAS_PRICES]),
         vol.Required(_ATTR_START_DATE): str,
         vol.Optional(_ATTR_CONNECTION_UUID): str,
     }
 )
 
+SERVICE_MANAGE_STATISTICS_BACKFILL = "manage_statistics_backfill"
+_ATTR_ACTION = "action"
+_BACKFILL_ACTIONS = ("status", "pause", "resume", "cancel")
+
+SERVICE_MANAGE_STATISTICS_BACKFILL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(_ATTR_ACTION, default="status"): vol.In(_BACKFILL_ACTIONS),
+        vol.Optional(_ATTR_ENDPOINT): vol.In([ELECTRICITY, GAS]),
+        vol.Optional(_ATTR_CONNECTION_UUID): str,
+    }
+)
+
+SERVICE_FIND_PRICE_WINDOWS = "find_price_windows"
+_ATTR_DURATION = "duration"
+_ATTR_RESOLUTION = "resolution"
+_ATTR_COUNT = "count"
+_ATTR_MODE = "mode"
+_ATTR_DEADLINE = "deadline"
+_SLOT_DURATIONS = {
+    "hourly": timedelta(hours=1),
+    "quarter_hourly": timedelta(minutes=15),
+}
+_PRICE_FACTOR = 0.0000001
+
+SERVICE_FIND_PRICE_WINDOWS_SCHEMA = vol.Schema(
+    {
+        vol.Required(_ATTR_DURATION): cv.time_period,
+        vol.Optional(_ATTR_RESOLUTION, default="hourly"): vol.In(list(_SLOT_DURATIONS)),
+        vol.Optional(_ATTR_COUNT, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=24)),
+        vol.Optional(_ATTR_MODE, default="cheapest"): vol.In(["cheapest", "most_expensive"]),
+        vol.Optional(_ATTR_DEADLINE): cv.datetime,
+    }
+)
+
+SERVICE_GET_PRICE_FORECAST = "get_price_forecast"
+_ATTR_PRICES = "prices"
+# Price series: (coordinator attribute of the connection, timeline, unit)
+_PRICE_SERIES = {
+    "electricity_hourly": ("electricity_prices", "hourly", f"EUR/{UnitOfEnergy.KILO_WATT_HOUR}"),
+    "electricity_quarter_hourly": ("electricity_prices", "quarter_hourly", f"EUR/{UnitOfEnergy.KILO_WATT_HOUR}"),
+    "gas_daily": ("gas_prices", "daily", f"EUR/{UnitOfVolume.CUBIC_METERS}"),
+}
+
+SERVICE_GET_PRICE_FORECAST_SCHEMA = vol.Schema(
+    {
+        vol.Optional(_ATTR_PRICES, default="electricity_hourly"): vol.In(list(_PRICE_SERIES)),
+    }
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -73,6 +129,7 @@ def async_setup_fetch_statistics_service(hass: HomeAssistant) -> None:
             connection_uuid_filter,
         )
 
+        price_coordinators: list[ElectricityPricesDataUpdateCoordinator | GasPricesDataUpdateCoordinator] = []
         for loaded_entry in hass.config_entries.async_entries(DOMAIN):
             if loaded_entry.state is not ConfigEntryState.LOADED:
                 continue
@@ -80,10 +137,29 @@ def async_setup_fetch_statistics_service(hass: HomeAssistant) -> None:
             for uuid, conn_coordinators in account_coordinator.coordinators.items():
                 if connection_uuid_filter and uuid != connection_uuid_filter:
                     continue
+                # Backfills run as tasks of their entry, so they are cancelled when it unloads
                 if endpoint == ELECTRICITY and conn_coordinators.p1_electricity is not None:
-                    hass.async_create_task(conn_coordinators.p1_electricity.async_backfill_statistics(start_date))
+                    loaded_entry.async_create_background_task(
+                        hass,
+                        conn_coordinators.p1_electricity.async_backfill_statistics(start_date),
+                        f"{DOMAIN} electricity statistics backfill {uuid}",
+                    )
                 elif endpoint == GAS and conn_coordinators.p1_gas is not None:
-                    hass.async_create_task(conn_coordinators.p1_gas.async_backfill_statistics(start_date))
+                    loaded_entry.async_create_background_task(
+                        hass,
+                        conn_coordinators.p1_gas.async_backfill_statistics(start_date),
+                        f"{DOMAIN} gas statistics backfill {uuid}",
+                    )
+                elif endpoint in (ELECTRICITY_PRICES, GAS_PRICES):
+                    # The price coordinators are shared by the connections of an account
+                    prices_coordinator = getattr(conn_coordinators, endpoint)
+                    if prices_coordinator is not None and prices_coordinator not in price_coordinators:
+                        price_coordinators.append(prices_coordinator)
+                        loaded_entry.async_create_background_task(
+                            hass,
+                            prices_coordinator.async_backfill_statistics(start_date),
+                            f"{DOMAIN} {endpoint} statistics backfill",
+                        )
 
         return {"result": "Check notifications for progress."}
 
@@ -94,3 +170,159 @@ def async_setup_fetch_statistics_service(hass: HomeAssistant) -> None:
         schema=SERVICE_FETCH_STATISTICS_SCHEMA,
         supports_response=SupportsResponse.OPTIONAL,
     )
+
+
+@callback
+def async_setup_manage_statistics_backfill_service(hass: HomeAssistant) -> None:
+    """Register the manage_statistics_backfill service if not already registered."""
+    if hass.services.has_service(DOMAIN, SERVICE_MANAGE_STATISTICS_BACKFILL):
+        return
+
+    async def handle_manage_statistics_backfill(call: ServiceCall) -> ServiceResponse:
+        """Handle the manage_statistics_backfill service call."""
+        action: str = call.data[_ATTR_ACTION]
+        endpoint: str | None = call.data.get(_ATTR_ENDPOINT)
+        connection_uuid_filter: str | None = call.data.get(_ATTR_CONNECTION_UUID)
+        if connection_uuid_filter:
+            connection_uuid_filter = connection_uuid_filter.replace("_", "-")
+
+        backfills = []
+        for loaded_entry in hass.config_entries.async_entries(DOMAIN):
+            if loaded_entry.state is not ConfigEntryState.LOADED:
+                continue
+            for uuid, conn_coordinators in loaded_entry.runtime_data.coordinators.items():
+                if connection_uuid_filter and uuid != connection_uuid_filter:
+                    continue
+                for coordinator_endpoint, coordinator in ((ELECTRICITY, conn_coordinators.p1_electricity), (GAS, conn_coordinators.p1_gas)):
+                    if coordinator is None or (endpoint and endpoint != coordinator_endpoint):
+                        continue
+
+                    statistics_service = coordinator.statistics_service
+                    if action == "pause":
+                        await statistics_service.async_pause_backfill()
+                    elif action == "cancel":
+                        await statistics_service.async_cancel_backfill()
+                    elif action == "resume" and statistics_service.backfill_status():
+                        loaded_entry.async_create_background_task(
+                            hass,
+                            statistics_service.async_resume_backfill(),
+                            f"{DOMAIN} resume {coordinator_endpoint} statistics backfill {uuid}",
+                        )
+
+                    if status := statistics_service.backfill_status():
+                        backfills.append({"connection_uuid": uuid, "endpoint": coordinator_endpoint, **status})
+
+        return {"backfills": backfills}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MANAGE_STATISTICS_BACKFILL,
+        handle_manage_statistics_backfill,
+        schema=SERVICE_MANAGE_STATISTICS_BACKFILL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def async_setup_find_price_windows_service(hass: HomeAssistant) -> None:
+    """Register the find_price_windows service if not already registered."""
+    if hass.services.has_service(DOMAIN, SERVICE_FIND_PRICE_WINDOWS):
+        return
+
+    async def handle_find_price_windows(call: ServiceCall) -> ServiceResponse:
+        """Handle the find_price_windows service call."""
+        resolution: str = call.data[_ATTR_RESOLUTION]
+        duration: timedelta = call.data[_ATTR_DURATION]
+        deadline: datetime | None = call.data.get(_ATTR_DEADLINE)
+
+        length, remainder = divmod(duration, _SLOT_DURATIONS[resolution])
+        if length < 1 or remainder:
+            msg = f"Duration {duration} is not a multiple of the {resolution} slot duration."
+            raise ServiceValidationError(msg)
+
+        if deadline is not None and deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=dt_util.get_default_time_zone())
+
+        coordinator = _get_prices_coordinator(hass, "electricity_prices")
+        timeline = coordinator.timelines.get(resolution) if coordinator else None
+        if not timeline:
+            msg = "No electricity prices available."
+            raise ServiceValidationError(msg)
+
+        windows = find_price_windows(
+            timeline,
+            length,
+            call.data[_ATTR_COUNT],
+            most_expensive=call.data[_ATTR_MODE] == "most_expensive",
+            start=dt_util.utcnow(),
+            deadline=deadline,
+        )
+
+        return {
+            "windows": [
+                {
+                    "start": window.start.isoformat(),
+                    "end": window.end.isoformat(),
+                    "average_price": window.average_price * _PRICE_FACTOR,
+                    "min_price": window.min_price * _PRICE_FACTOR,
+                    "max_price": window.max_price * _PRICE_FACTOR,
+                }
+                for window in windows
+            ]
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_PRICE_WINDOWS,
+        handle_find_price_windows,
+        schema=SERVICE_FIND_PRICE_WINDOWS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def async_setup_get_price_forecast_service(hass: HomeAssistant) -> None:
+    """Register the get_price_forecast service if not already registered."""
+    if hass.services.has_service(DOMAIN, SERVICE_GET_PRICE_FORECAST):
+        return
+
+    async def handle_get_price_forecast(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_price_forecast service call, the prices from the current slot on as columns."""
+        coordinator_name, timeline_name, unit = _PRICE_SERIES[call.data[_ATTR_PRICES]]
+
+        coordinator = _get_prices_coordinator(hass, coordinator_name)
+        timeline = coordinator.timelines.get(timeline_name) if coordinator else None
+        if not timeline:
+            msg = f"No {call.data[_ATTR_PRICES]} prices available."
+            raise ServiceValidationError(msg)
+
+        slots = timeline.upcoming(dt_util.utcnow())
+
+        return {
+            "unit": unit,
+            # Unix timestamps in seconds, compact and directly usable in templates and charts
+            "start": [int(slot.start.timestamp()) for slot in slots],
+            "price": [slot.price_tax_included * _PRICE_FACTOR if slot.price_tax_included is not None else None for slot in slots],
+            "price_excl_tax": [slot.price_tax_excluded * _PRICE_FACTOR if slot.price_tax_excluded is not None else None for slot in slots],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PRICE_FORECAST,
+        handle_get_price_forecast,
+        schema=SERVICE_GET_PRICE_FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _get_prices_coordinator(
+    hass: HomeAssistant, coordinator_name: str
+) -> ElectricityPricesDataUpdateCoordinator | GasPricesDataUpdateCoordinator | None:
+    for loaded_entry in hass.config_entries.async_entries(DOMAIN):
+        if loaded_entry.state is not ConfigEntryState.LOADED:
+            continue
+        for conn_coordinators in loaded_entry.runtime_data.coordinators.values():
+            coordinator = getattr(conn_coordinators, coordinator_name)
+            if coordinator is not None:
+                return coordinator
+    return None
@@ -25,15 +25,12 @@ class ZonneplanApi:
 
     async def async_request_temp_pass(self, email: str) -> str | None:
         try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with (
-                aiohttp.ClientSession(timeout=timeout) as session,
-                session.post(
-                    LOGIN_REQUEST_URI,
-                    json={"email": email},
-                    headers=dict(self._request_headers),
-                ) as response,
-            ):
+            async with self._session.post(
+                LOGIN_REQUEST_URI,
+                json={"email": email},
+                headers=dict(self._request_headers),
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
                 response.raise_for_status()
                 _LOGGER.debug(
                     "ZonneplanAPI validated status: %s (%s)",
@@ -70,11 +67,11 @@ class ZonneplanApi:
 
     async def async_get_temp_pass(self, email: str, uuid: str) -> dict | None:
         try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with (
-                aiohttp.ClientSession(timeout=timeout) as session,
-                session.get(LOGIN_REQUEST_URI + "/" + uuid, headers=dict(self._request_headers)) as response,
-            ):
+            async with self._session.get(
+                LOGIN_REQUEST_URI + "/" + uuid,
+                headers=dict(self._request_headers),
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
                 response.raise_for_status()
                 _LOGGER.debug(
                     "Temporary password validated status: %s (%s)",
@@ -131,16 +128,13 @@ class ZonneplanApi:
     async def _async_request_new_token(self, grant_params: dict[str, str]) -> dict:
         _LOGGER.debug("Requesting new OAuth token using grant type %s", grant_params.get("grant_type"))
 
-        timeout = aiohttp.ClientTimeout(total=30)
-        async with (
-            aiohttp.ClientSession(timeout=timeout) as session,
-            session.post(
-                OAUTH2_TOKEN_URI,
-                headers=dict(self._request_headers),
-                json=grant_params,
-                allow_redirects=True,
-            ) as response,
-        ):
+        async with self._session.post(
+            OAUTH2_TOKEN_URI,
+            headers=dict(self._request_headers),
+            json=grant_params,
+            allow_redirects=True,
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
             _LOGGER.debug("ZonneplanAPI oAuth Token response header: %s", response.headers)
             _LOGGER.debug("ZonneplanAPI oAuth Token response status: %s", response.status)
 
@@ -0,0 +1,57 @@
+"""Typed models for Zonneplan API payloads."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+
+
+@dataclass(frozen=True, slots=True)
+class ZonneplanPriceSlot:
+    """One slot of a consumer price chart, amounts are in 1/10,000,000 euro."""
+
+    start: datetime
+    end: datetime
+    price_tax_included: int | None
+    price_tax_excluded: int | None
+    sustainability_score: int
+    tariff_group: str
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ZonneplanPriceSlot":
+        start = dt_util.parse_datetime(data.get("start_date") or "")
+        end = dt_util.parse_datetime(data.get("end_date") or "")
+        if start is None or end is None:
+            msg = f"Invalid price slot {data.get('start_date')} - {data.get('end_date')}"
+            raise ValueError(msg)
+
+        return cls(
+            start=start,
+            end=end,
+            price_tax_included=(data.get("price_tax_included") or {}).get("amount"),
+            price_tax_excluded=(data.get("price_tax_excluded") or {}).get("amount"),
+            sustainability_score=(data.get("sustainability_score") or {}).get("permille", 0),
+            tariff_group=data.get("tariff_group", ""),
+        )
+
+    def as_chart_dict(self) -> dict[str, Any]:
+        """Return the slot in the format of the consumer price chart series."""
+        return {
+            "start_date": dt_util.as_utc(self.start).isoformat(),
+            "end_date": dt_util.as_utc(self.end).isoformat(),
+            "price_tax_included": {"amount": self.price_tax_included},
+            "price_tax_excluded": {"amount": self.price_tax_excluded},
+            "sustainability_score": {"permille": self.sustainability_score},
+            "tariff_group": self.tariff_group,
+        }
+
+
+def get_price_series_from_chart_data(data: Mapping[str, Any]) -> list[dict]:
+    return data.get("chart", {}).get("series", {}).get("prices", [])
+
+
+def parse_price_chart(data: Mapping[str, Any]) -> list[ZonneplanPriceSlot]:
+    """Parse the price series of a consumer price chart, in the same order as the series."""
+    return [ZonneplanPriceSlot.from_dict(price_data) for price_data in get_price_series_from_chart_data(data)]
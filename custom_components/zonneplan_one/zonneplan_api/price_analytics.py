@@ -0,0 +1,72 @@
+"""Analytics of price slots within their day."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import groupby
+from statistics import fmean, pstdev
+
+import homeassistant.util.dt as dt_util
+
+from .models import ZonneplanPriceSlot
+
+# Fields of SlotAnalytics that are amounts, in the same unit as the slot prices
+PRICE_FIELDS = frozenset({"deviation", "day_min_price", "day_max_price", "day_average_price"})
+
+
+@dataclass(frozen=True, slots=True)
+class SlotAnalytics:
+    """The price (tax included) of a slot compared to the other slots of its day."""
+
+    # 1 is the cheapest slot of the day, equal prices share a rank
+    rank: int
+    # Percentage of the other slots of the day that are cheaper, 0 is the cheapest and 100 the most expensive
+    percentile: float
+    # Price minus the average price of the day
+    deviation: float
+    # Deviation in standard deviations of the day, None when all prices of the day are equal
+    z_score: float | None
+    day_min_price: int
+    day_max_price: int
+    day_average_price: float
+    day_slots: int
+
+
+def analyze_prices(slots: list[ZonneplanPriceSlot]) -> dict[datetime, SlotAnalytics]:
+    """
+    Return the analytics of every slot with a price, by slot start.
+
+    Slots are grouped by their day in Europe/Amsterdam, slots are expected sorted by start.
+    """
+    time_zone = dt_util.get_time_zone("Europe/Amsterdam")
+
+    def local_day(slot: ZonneplanPriceSlot) -> date:
+        return slot.start.astimezone(time_zone).date()
+
+    analytics: dict[datetime, SlotAnalytics] = {}
+    priced_slots = [slot for slot in slots if slot.price_tax_included is not None]
+    for _, day_slots in groupby(priced_slots, key=local_day):
+        day = list(day_slots)
+        prices = sorted(slot.price_tax_included for slot in day)
+        average = fmean(prices)
+        deviation = pstdev(prices, average)
+
+        # Rank of a price is one more than the number of cheaper slots
+        ranks: dict[int, int] = {}
+        for index, price in enumerate(prices):
+            ranks.setdefault(price, index + 1)
+
+        for slot in day:
+            price = slot.price_tax_included
+            rank = ranks[price]
+            analytics[slot.start] = SlotAnalytics(
+                rank=rank,
+                percentile=100 * (rank - 1) / (len(prices) - 1) if len(prices) > 1 else 0.0,
+                deviation=price - average,
+                z_score=(price - average) / deviation if deviation else None,
+                day_min_price=prices[0],
+                day_max_price=prices[-1],
+                day_average_price=average,
+                day_slots=len(prices),
+            )
+
+    return analytics
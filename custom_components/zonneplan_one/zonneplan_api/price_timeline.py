@@ -0,0 +1,130 @@
+"""Sorted timeline of price slots."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Mapping
+from datetime import datetime
+
+import homeassistant.util.dt as dt_util
+
+from .models import ZonneplanPriceSlot
+
+
+class PriceTimeline:
+    """
+    Price slots ordered by start, for lookups by time.
+
+    Start and end times are kept as epoch seconds in arrays parallel to the slots,
+    so finding the slot of a moment is a bisect instead of a scan.
+    """
+
+    __slots__ = ("ends", "slots", "starts")
+
+    def __init__(self, slots: list[ZonneplanPriceSlot] | None = None) -> None:
+        self.slots = sorted(slots or [], key=lambda slot: slot.start)
+        self.starts = [int(slot.start.timestamp()) for slot in self.slots]
+        self.ends = [int(slot.end.timestamp()) for slot in self.slots]
+
+    def __len__(self) -> int:
+        """Return the number of slots."""
+        return len(self.slots)
+
+    @property
+    def horizon(self) -> datetime | None:
+        """Return the end of the last slot."""
+        return self.slots[-1].end if self.slots else None
+
+    def merge(self, slots: list[ZonneplanPriceSlot]) -> bool:
+        """
+        Merge fetched slots into the timeline, return whether the timeline changed.
+
+        The fetched slots replace the known slots in the range they cover, known slots
+        before and after that range are kept. The slots are updated in place.
+        """
+        if not slots:
+            return False
+
+        slots = sorted(slots, key=lambda slot: slot.start)
+        first = bisect_left(self.starts, slots[0].start.timestamp())
+        last = bisect_left(self.starts, slots[-1].end.timestamp())
+        if self.slots[first:last] == slots:
+            return False
+
+        self.slots[first:last] = slots
+        self.starts[first:last] = [int(slot.start.timestamp()) for slot in slots]
+        self.ends[first:last] = [int(slot.end.timestamp()) for slot in slots]
+        return True
+
+    def evict(self, before: datetime) -> bool:
+        """Remove the slots that ended before the moment, return whether any slot was removed."""
+        count = bisect_right(self.ends, before.timestamp())
+        if not count:
+            return False
+
+        del self.slots[:count]
+        del self.starts[:count]
+        del self.ends[:count]
+        return True
+
+    def index_at(self, moment: datetime) -> int | None:
+        """Return the index of the slot containing the moment."""
+        timestamp = moment.timestamp()
+        index = bisect_right(self.starts, timestamp) - 1
+        if index < 0 or timestamp >= self.ends[index]:
+            return None
+        return index
+
+    def slots_from(self, moment: datetime, count: int) -> list[ZonneplanPriceSlot]:
+        """Return the slot containing the moment followed by the next slots, up to `count` slots."""
+        index = self.index_at(moment)
+        if index is None:
+            return []
+        return self.slots[index : index + count]
+
+    def upcoming(self, moment: datetime) -> list[ZonneplanPriceSlot]:
+        """Return the slots that did not end before the moment, from the slot containing it or else the next slot."""
+        return self.slots[bisect_right(self.ends, moment.timestamp()) :]
+
+
+def build_price_view(timelines: dict[str, PriceTimeline], sizes: dict[str, int], moment: datetime) -> dict[str, list[ZonneplanPriceSlot]]:
+    """Return per timeline the slot containing the moment followed by the next slots, all for the same moment."""
+    return {name: timeline.slots_from(moment, sizes.get(name, 1)) for name, timeline in timelines.items()}
+
+
+class PriceViews(Mapping[str, list]):
+    """
+    Views derived from price timelines, like the forecast attributes of the price sensors.
+
+    A view is built when it is read, from the current slot on. The timeline also keeps
+    the slots that ended during the retention, those are only for the statistics and
+    analytics and are left out of the views. An unused view is never built.
+    """
+
+    def __init__(
+        self,
+        timelines: dict[str, PriceTimeline],
+        views: dict[str, tuple[str, Callable[[list[ZonneplanPriceSlot]], list]]],
+    ) -> None:
+        self._timelines = timelines
+        self._views = views
+
+    def __getitem__(self, name: str) -> list:
+        """Return the view, built from the current and upcoming slots of its timeline."""
+        timeline_name, build = self._views[name]
+        timeline = self._timelines.get(timeline_name)
+        if timeline is None:
+            raise KeyError(name)
+
+        return build(timeline.upcoming(dt_util.utcnow()))
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the view names."""
+        return iter(self._views)
+
+    def __len__(self) -> int:
+        """Return the number of views."""
+        return len(self._views)
+
+
+def chart_prices(slots: list[ZonneplanPriceSlot]) -> list[dict]:
+    """Return the slots in the format of the consumer price chart series."""
+    return [slot.as_chart_dict() for slot in slots]
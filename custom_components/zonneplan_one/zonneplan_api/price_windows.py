@@ -0,0 +1,123 @@
+"""Cheapest and most expensive price windows."""
+
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+
+from .price_timeline import PriceTimeline
+
+
+@dataclass(frozen=True, slots=True)
+class PriceWindow:
+    """Contiguous slots of a price timeline, prices are in 1/10,000,000 euro."""
+
+    start: datetime
+    end: datetime
+    average_price: float
+    min_price: int
+    max_price: int
+
+
+def find_price_windows(
+    timeline: PriceTimeline,
+    length: int,
+    count: int = 1,
+    *,
+    most_expensive: bool = False,
+    start: datetime | None = None,
+    deadline: datetime | None = None,
+) -> list[PriceWindow]:
+    """
+    Return the `count` cheapest (or most expensive) non overlapping windows of `length` slots.
+
+    Windows start in or after the slot containing `start` and end before `deadline`. Slots
+    without a price and gaps between slots break a window.
+    """
+    if length < 1 or count < 1 or not timeline.slots:
+        return []
+
+    first = 0
+    if start is not None:
+        first = timeline.index_at(start)
+        if first is None:
+            first = bisect_left(timeline.starts, start.timestamp())
+
+    candidates = _window_candidates(timeline, length, first, deadline.timestamp() if deadline is not None else None)
+    candidates.sort(key=lambda candidate: (-candidate[0] if most_expensive else candidate[0], candidate[1]))
+
+    windows: list[PriceWindow] = []
+    taken: list[int] = []
+    for price_sum, window_start, min_price, max_price in candidates:
+        if any(abs(window_start - other) < length for other in taken):
+            continue
+
+        taken.append(window_start)
+        windows.append(
+            PriceWindow(
+                start=timeline.slots[window_start].start,
+                end=timeline.slots[window_start + length - 1].end,
+                average_price=price_sum / length,
+                min_price=min_price,
+                max_price=max_price,
+            )
+        )
+        if len(windows) == count:
+            break
+
+    return windows
+
+
+def _window_candidates(
+    timeline: PriceTimeline,
+    length: int,
+    first: int,
+    deadline_timestamp: float | None,
+) -> list[tuple[int, int, int, int]]:
+    """
+    Return (price sum, first slot index, min price, max price) of every complete window.
+
+    Computed in a single pass with a running sum and monotonic deques for the minimum and maximum.
+    """
+    candidates: list[tuple[int, int, int, int]] = []
+    running_sum = 0
+    run_start = first
+    min_indexes: deque[int] = deque()
+    max_indexes: deque[int] = deque()
+    prices = [slot.price_tax_included for slot in timeline.slots]
+
+    for index in range(first, len(prices)):
+        if deadline_timestamp is not None and timeline.ends[index] > deadline_timestamp:
+            break
+
+        price = prices[index]
+        if price is None or (index > run_start and timeline.starts[index] != timeline.ends[index - 1]):
+            running_sum = 0
+            min_indexes.clear()
+            max_indexes.clear()
+            run_start = index + 1 if price is None else index
+            if price is None:
+                continue
+
+        running_sum += price
+        while min_indexes and prices[min_indexes[-1]] >= price:
+            min_indexes.pop()
+        min_indexes.append(index)
+        while max_indexes and prices[max_indexes[-1]] <= price:
+            max_indexes.pop()
+        max_indexes.append(index)
+
+        window_start = index - length + 1
+        if window_start < run_start:
+            continue
+
+        if window_start > run_start:
+            running_sum -= prices[window_start - 1]
+        if min_indexes[0] < window_start:
+            min_indexes.popleft()
+        if max_indexes[0] < window_start:
+            max_indexes.popleft()
+
+        candidates.append((running_sum, window_start, prices[min_indexes[0]], prices[max_indexes[0]]))
+
+    return candidates
@@ -0,0 +1,99 @@
+"""Client side pacing of Zonneplan API requests."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from http import HTTPStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMIT = 60
+DEFAULT_RATE_LIMIT_WINDOW = 60.0
+DEFAULT_RETRY_AFTER = 60
+
+
+def parse_int_header(value: str | None) -> int | None:
+    """Parse an integer header value, like Retry-After seconds or the x-ratelimit-* counts."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all requests of one account.
+
+    The bucket refills at `limit / window` tokens per second and is corrected with
+    the `x-ratelimit-*` and `Retry-After` headers of every response, so requests
+    wait locally instead of being answered with HTTP 429.
+    """
+
+    def __init__(self, limit: int = DEFAULT_RATE_LIMIT, window: float = DEFAULT_RATE_LIMIT_WINDOW) -> None:
+        self._capacity = float(limit)
+        self._window = window
+        self._tokens = float(limit)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    @property
+    def tokens(self) -> float:
+        """Return the number of requests that can be made right away."""
+        self._refill(time.monotonic())
+        return self._tokens
+
+    async def acquire(self) -> None:
+        """
+        Wait until a request may be sent and take a token for it.
+
+        Checking and taking a token doesn't await, so no lock is held while waiting
+        and other callers can check the budget in the meantime.
+        """
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+
+            if self._blocked_until > now:
+                delay = self._blocked_until - now
+            elif self._tokens >= 1:
+                self._tokens -= 1
+                return
+            else:
+                delay = (1 - self._tokens) * self._window / self._capacity
+
+            _LOGGER.debug("Rate limit budget exhausted, delaying request %.1f seconds", delay)
+            await asyncio.sleep(delay)
+
+    def update(self, status: int, headers: Mapping[str, str]) -> None:
+        """Correct the bucket with the rate limit state reported by the API."""
+        now = time.monotonic()
+        self._refill(now)
+
+        limit = parse_int_header(headers.get("x-ratelimit-limit"))
+        if limit:
+            self._capacity = float(limit)
+
+        remaining = parse_int_header(headers.get("x-ratelimit-remaining"))
+        if remaining is not None:
+            # Requests still in flight already took their token, the reported budget doesn't include them yet
+            self._tokens = min(self._tokens, float(remaining), self._capacity)
+
+        if status == HTTPStatus.TOO_MANY_REQUESTS or remaining == 0:
+            retry_after = parse_int_header(headers.get("Retry-After"))
+            if retry_after is None and (reset := parse_int_header(headers.get("x-ratelimit-reset"))) is not None:
+                # Epoch seconds at which the window resets
+                retry_after = max(0, reset - int(time.time()))
+            if retry_after is None:
+                retry_after = DEFAULT_RETRY_AFTER
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            _LOGGER.info("Rate limit reached, pausing requests for %s seconds", retry_after)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._capacity / self._window)
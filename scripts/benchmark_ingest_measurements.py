@@ -0,0 +1,127 @@
+"""
+Compare ingesting hourly P1 measurements per entry and channel against the columnar ingestion.
+
+Usage: python scripts/benchmark_ingest_measurements.py
+
+A synthetic year of hourly electricity measurements, shaped like the
+`/electricity-delivered/charts/hours` payload, is ingested into empty channel states.
+Both implementations must produce the same statistics. Requires Home Assistant to be
+installed, like the integration itself.
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+from homeassistant.components.recorder.models import StatisticData
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.zonneplan_one.coordinators.statistics import (
+    ElectricityStatisticsService,
+    StatisticChannelState,
+)
+
+REPEAT = 5
+
+
+def entry_ingest_measurements(
+    service: ElectricityStatisticsService,
+    measurements: list[dict[str, Any]],
+    states: dict[str, StatisticChannelState],
+) -> None:
+    """Ingestion as it was done before measurements were parsed into columns, without logging."""
+    last_entry_time = None
+    for entry in measurements:
+        for config in service.channel_configs:
+            entry_time = dt_util.parse_datetime(entry.get(config.date_key)).replace(minute=0, second=0, microsecond=0)
+            if (last_entry_time and entry_time < last_entry_time) or entry_time > datetime.now(tz=service.zonneplan_api_time_zone):
+                continue
+            last_entry_time = entry_time
+
+            raw_value = entry.get("values").get(config.value_key)
+            if not isinstance(raw_value, (float, int)):
+                continue
+
+            value = float(raw_value) * config.value_factor
+            state = states[config.key]
+            if entry_time > state.last_time:
+                state.total_sum += value
+                state.pending.append(StatisticData(start=entry_time, state=value, sum=state.total_sum))
+                state.last_time = entry_time
+                state.last_state_value = value
+            elif entry_time == state.last_time and state.last_state_value is not None:
+                state.total_sum += value - state.last_state_value
+                state.pending.append(StatisticData(start=entry_time, state=value, sum=state.total_sum))
+                state.last_state_value = value
+
+
+def build_measurements(time_zone: Any) -> list[dict[str, Any]]:
+    """Create a year of hourly measurements ending at the start of today."""
+    end = dt_util.now(time_zone).replace(hour=0, minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=365)
+    measurements = []
+    hour = dt_util.as_utc(start)
+    while hour < end:
+        index = len(measurements)
+        measurements.append(
+            {
+                "date": hour.astimezone(time_zone).isoformat(),
+                "values": {"d": 150 + index % 24 * 40, "p": index % 24 * 25},
+            }
+        )
+        hour += timedelta(hours=1)
+    return measurements
+
+
+def empty_states(service: ElectricityStatisticsService, first_hour: datetime) -> dict[str, StatisticChannelState]:
+    return {
+        config.key: StatisticChannelState(config=config, last_time=first_hour - timedelta(hours=1), total_sum=0.0, last_state_value=None)
+        for config in service.channel_configs
+    }
+
+
+def main() -> None:
+    service = ElectricityStatisticsService(
+        hass=None,
+        api=None,
+        connection_uuid="benchmark",
+        delivered_id="zonneplan_one:electricity_delivered_benchmark",
+        produced_id="zonneplan_one:electricity_produced_benchmark",
+    )
+    measurements = build_measurements(service.zonneplan_api_time_zone)
+    first_hour = dt_util.parse_datetime(measurements[0]["date"])
+
+    expected = empty_states(service, first_hour)
+    entry_ingest_measurements(service, measurements, expected)
+    actual = empty_states(service, first_hour)
+    service._ingest_measurements(measurements, actual)  # noqa: SLF001
+    for key, state in expected.items():
+        # Starts are compared as timestamps, times in the DST fold never equal ones of another time zone
+        rows = [(row["start"].timestamp(), row["state"], round(row["sum"], 6)) for row in state.pending]
+        if rows != [(row["start"].timestamp(), row["state"], round(row["sum"], 6)) for row in actual[key].pending]:
+            msg = f"Ingested {key} statistics differ"
+            raise AssertionError(msg)
+
+    def per_entry() -> None:
+        entry_ingest_measurements(service, measurements, empty_states(service, first_hour))
+
+    def columnar() -> None:
+        service._ingest_measurements(measurements, empty_states(service, first_hour))  # noqa: SLF001
+
+    print(f"{len(measurements)} hourly measurements, {len(service.channel_configs)} channels, best of {REPEAT} runs")
+    baseline = None
+    for name, func in (("per entry", per_entry), ("columnar", columnar)):
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        # The fastest run is the least disturbed by other work on the machine
+        per_call = min(timer.repeat(REPEAT, number)) / number * 1000
+        baseline = baseline or per_call
+        print(f"  {name:<10} {per_call:9.1f} ms  ({baseline / per_call:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Compare JSON decode times of Zonneplan API payloads.
+
+Usage: python scripts/benchmark_json_decode.py [diagnostics.json]
+
+Without arguments payloads shaped like the quarter hourly price chart and the
+`/electricity-delivered` response are generated. When a downloaded diagnostics
+file is given, the recorded `last_api_responses` are used instead.
+"""
+
+import json
+import sys
+import timeit
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+DECODERS: dict[str, Any] = {"json": json.loads}
+
+try:
+    import orjson
+
+    DECODERS["orjson"] = orjson.loads
+except ImportError:
+    pass
+
+try:
+    import msgspec
+
+    DECODERS["msgspec"] = msgspec.json.decode
+except ImportError:
+    pass
+
+
+def price_chart_payload(slots: int = 192, minutes: int = 15) -> dict[str, Any]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    prices = []
+    for index in range(slots):
+        slot_start = start + timedelta(minutes=index * minutes)
+        prices.append(
+            {
+                "start_date": slot_start.isoformat().replace("+00:00", ".000000Z"),
+                "end_date": (slot_start + timedelta(minutes=minutes)).isoformat().replace("+00:00", ".000000Z"),
+                "price_tax_included": {"amount": 2_000_000 + index * 1000, "currency": "EUR"},
+                "price_tax_excluded": {"amount": 1_600_000 + index * 800, "currency": "EUR"},
+                "sustainability_score": {"permille": index % 1000},
+                "tariff_group": ("low", "normal", "high")[index % 3],
+            }
+        )
+    return {"data": {"chart": {"type": "prices", "series": {"prices": prices}}}}
+
+
+def electricity_delivered_payload(days: int = 31) -> dict[str, Any]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    hours = [
+        {
+            "date": (start + timedelta(hours=index)).isoformat(),
+            "value": index * 10,
+            "values": {"d": index * 7, "p": -index * 3},
+        }
+        for index in range(24)
+    ]
+    day_list = [
+        {
+            "date": (start + timedelta(days=index)).isoformat(),
+            "value": index * 100,
+            "values": {"d": index * 70, "p": -index * 30},
+        }
+        for index in range(days)
+    ]
+    return {
+        "data": {
+            "measurement_groups": [
+                {"type": "hours", "measurements": hours},
+                {"type": "days", "measurements": day_list},
+            ],
+            "contracts": [{"uuid": "00000000-0000-0000-0000-000000000000", "meta": {"electricity_last_measured_average_value": 300}}],
+        }
+    }
+
+
+def load_payloads(argv: list[str]) -> dict[str, bytes]:
+    if len(argv) > 1:
+        diagnostics = json.loads(Path(argv[1]).read_text(encoding="utf-8"))
+        responses = diagnostics.get("data", diagnostics).get("last_api_responses", {})
+        return {path: json.dumps(response).encode() for path, response in responses.items()}
+
+    return {
+        "consumer-prices/charts/electricity-quarter-hourly": json.dumps(price_chart_payload()).encode(),
+        "consumer-prices/charts/electricity-hourly": json.dumps(price_chart_payload(48, 60)).encode(),
+        "connections/<uuid>/electricity-delivered": json.dumps(electricity_delivered_payload()).encode(),
+    }
+
+
+def main(argv: list[str]) -> None:
+    for path, body in load_payloads(argv).items():
+        print(f"{path} ({len(body) / 1024:.1f} KiB)")
+        baseline = None
+        for name, decode in DECODERS.items():
+            runs, total = timeit.Timer(lambda decode=decode, body=body: decode(body)).autorange()
+            per_call = total / runs * 1_000_000
+            baseline = baseline or per_call
+            print(f"  {name:<8} {per_call:9.1f} µs  ({baseline / per_call:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
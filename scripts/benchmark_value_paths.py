@@ -0,0 +1,99 @@
+"""
+Compare resolving sensor value paths by splitting on every read against compiled value paths.
+
+Usage: python scripts/benchmark_value_paths.py
+
+All keys, attribute keys and last reset keys of SENSOR_TYPES are resolved against
+synthetic coordinator data containing every path. Requires Home Assistant to be
+installed, like the integration itself.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.zonneplan_one.const import SENSOR_TYPES
+from custom_components.zonneplan_one.coordinators.value_path import compile_value_path
+
+
+def split_get_data_value(data: Any, value_path: str) -> Any:
+    """Path lookup as it was done before value paths were compiled."""
+    keys = value_path.split(".")
+    rv = data
+    for key in keys:
+        if rv is None:
+            return None
+
+        _key = key
+        if _key.lstrip("-").isdigit():
+            _key = int(key)
+            if type(rv) is not list or (_key >= 0 and len(rv) <= _key) or (_key < 0 and -len(rv) > _key):
+                return None
+
+        elif _key not in rv:
+            return None
+        rv = rv[_key]
+
+    return rv
+
+
+def collect_paths() -> list[str]:
+    paths = []
+    for descriptions in SENSOR_TYPES.values():
+        for description in descriptions.values():
+            keys = [] if description.timeline else [description.key_lambda() if description.key_lambda else description.key]
+            keys.extend(attribute.key for attribute in description.attributes or [])
+            if description.last_reset_key:
+                keys.append(description.last_reset_key)
+            paths.extend(key.format(install_index=0) for key in keys)
+    return paths
+
+
+def build_data(paths: list[str]) -> dict[str, Any]:
+    """Create nested data in which every path resolves, list indexes get a single item list."""
+    data: dict[str, Any] = {}
+    for path in paths:
+        parent: Any = data
+        segments = [int(key) if key.lstrip("-").isdigit() else key for key in path.split(".")]
+        for key, next_key in zip(segments, [*segments[1:], None], strict=True):
+            child = 1 if next_key is None else [{}] if type(next_key) is int else {}
+            if type(key) is int:
+                if not isinstance(parent[key], type(child)):
+                    parent[key] = child
+            else:
+                parent.setdefault(key, child)
+            parent = parent[key]
+    return data
+
+
+def main() -> None:
+    paths = collect_paths()
+    data = build_data(paths)
+    compiled = [compile_value_path(path) for path in paths]
+
+    def split() -> None:
+        for path in paths:
+            split_get_data_value(data, path)
+
+    def precompiled() -> None:
+        for value_path in compiled:
+            value_path.get(data)
+
+    def cached() -> None:
+        for path in paths:
+            compile_value_path(path).get(data)
+
+    print(f"{len(paths)} value paths")
+    baseline = None
+    for name, func in (("split", split), ("compiled", precompiled), ("lru cache", cached)):
+        runs, total = timeit.Timer(func).autorange()
+        per_call = total / runs * 1_000_000
+        baseline = baseline or per_call
+        print(f"  {name:<10} {per_call:9.1f} µs  ({baseline / per_call:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
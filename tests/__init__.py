@@ -0,0 +1 @@
+"""Tests for the Zonneplan ONE integration."""
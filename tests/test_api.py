@@ -0,0 +1,93 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import MagicMock
+
+from custom_components.zonneplan_one.api import AsyncConfigEntryAuth
+
+
+class FakeResponse:
+    def __init__(self, body: bytes) -> None:
+        self.status = 200
+        self.headers: dict[str, str] = {}
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakeSession:
+    """Client session that answers every request once `release` is set."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.release = asyncio.Event()
+
+    def request(self, method: str, url: str, headers: dict[str, str], **_kwargs: Any) -> Any:
+        self.requests.append((method, url, headers))
+
+        @asynccontextmanager
+        async def _response() -> AsyncIterator[FakeResponse]:
+            await self.release.wait()
+            yield FakeResponse(b'{"data": {"value": 1}}')
+
+        return _response()
+
+
+def make_api() -> tuple[AsyncConfigEntryAuth, FakeSession]:
+    oauth_session = MagicMock(valid_token=True, token={"access_token": "token"})
+    session = FakeSession()
+    return AsyncConfigEntryAuth(session, oauth_session), session
+
+
+def test_concurrent_calls_share_one_request() -> None:
+    async def _run() -> list[dict | None]:
+        api, session = make_api()
+        calls = [asyncio.create_task(api.async_get("connection", "/summary")) for _ in range(3)]
+        await asyncio.sleep(0)
+        session.release.set()
+        results = await asyncio.gather(*calls)
+        assert len(session.requests) == 1
+        assert session.requests[0][2]["authorization"] == "Bearer token"
+        return results
+
+    results = asyncio.run(_run())
+
+    assert results == [{"value": 1}] * 3
+    # Every caller gets its own copy of the data
+    assert results[0] is not results[1]
+
+
+def test_call_bypassing_the_cache_does_not_join() -> None:
+    async def _run() -> None:
+        api, session = make_api()
+        calls = [
+            asyncio.create_task(api.async_get("connection", "/summary")),
+            asyncio.create_task(api.async_get("connection", "/summary", ignore_etag=True)),
+        ]
+        await asyncio.sleep(0)
+        session.release.set()
+        await asyncio.gather(*calls)
+        assert len(session.requests) == 2
+
+    asyncio.run(_run())
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_request() -> None:
+    async def _run() -> dict | None:
+        api, session = make_api()
+        first = asyncio.create_task(api.async_get("connection", "/summary"))
+        second = asyncio.create_task(api.async_get("connection", "/summary"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await first
+        session.release.set()
+        return await second
+
+    assert asyncio.run(_run()) == {"value": 1}
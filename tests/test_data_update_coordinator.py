@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.zonneplan_one.coordinators.value_path import compile_value_path
+from custom_components.zonneplan_one.coordinators.zonneplan_data_update_coordinator import ZonneplanDataUpdateCoordinator
+
+
+class FakeHass:
+    is_stopping = False
+
+    def async_create_task(self, target: Coroutine[Any, Any, Any], *_args: Any, **_kwargs: Any) -> None:
+        # The refresh on the first listener is run by the test
+        target.close()
+
+
+class Listeners:
+    """Listeners of a coordinator, each counting its updates."""
+
+    def __init__(self, coordinator: ZonneplanDataUpdateCoordinator) -> None:
+        self.coordinator = coordinator
+        self.updates: dict[str, int] = {}
+
+    def add(self, name: str, *paths: str) -> None:
+        self.updates[name] = 0
+
+        def _update() -> None:
+            self.updates[name] += 1
+
+        context = frozenset(compile_value_path(path) for path in paths) if paths else None
+        self.coordinator.async_add_listener(_update, context)
+
+    def reset(self) -> None:
+        self.updates = dict.fromkeys(self.updates, 0)
+
+
+def run_refreshes(results: list[Any], check: Any) -> None:
+    """Refresh the coordinator once per result, `check` is called with the listeners after every refresh."""
+
+    async def _update() -> Any:
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def _run() -> None:
+        coordinator = ZonneplanDataUpdateCoordinator(
+            FakeHass(), logging.getLogger(__name__), name="test", config_entry=None, update_method=_update
+        )
+        listeners = Listeners(coordinator)
+        listeners.add("state", "summary.state")
+        listeners.add("power", "summary.power")
+        listeners.add("any")
+        while results:
+            listeners.reset()
+            await coordinator.async_refresh()
+            check(coordinator, listeners.updates)
+
+    asyncio.run(_run())
+
+
+def test_unchanged_data_skips_the_listeners() -> None:
+    updates: list[dict[str, int]] = []
+
+    run_refreshes(
+        [{"summary": {"state": "on", "power": 1}}, {"summary": {"state": "on", "power": 1}}],
+        lambda _coordinator, listener_updates: updates.append(listener_updates),
+    )
+
+    assert updates == [{"state": 1, "power": 1, "any": 1}, {"state": 0, "power": 0, "any": 0}]
+
+
+def test_changed_value_path_updates_its_listeners_only() -> None:
+    updates: list[dict[str, int]] = []
+
+    run_refreshes(
+        [{"summary": {"state": "on", "power": 1}}, {"summary": {"state": "on", "power": 2}}],
+        lambda _coordinator, listener_updates: updates.append(listener_updates),
+    )
+
+    # Listeners without value paths can read anything, they are updated for every change
+    assert updates[1] == {"state": 0, "power": 1, "any": 1}
+
+
+def test_all_listeners_are_updated_after_a_failed_refresh() -> None:
+    updates: list[dict[str, int]] = []
+    data = {"summary": {"state": "on", "power": 1}}
+
+    run_refreshes(
+        [data, UpdateFailed("unavailable"), dict(data)],
+        lambda coordinator, listener_updates: updates.append({**listener_updates, "success": coordinator.last_update_success}),
+    )
+
+    assert updates[1] == {"state": 1, "power": 1, "any": 1, "success": False}
+    # The entities were unavailable, the same data makes them available again
+    assert updates[2] == {"state": 1, "power": 1, "any": 1, "success": True}
+
+
+def test_data_changed_in_place_updates_all_listeners() -> None:
+    updates: list[dict[str, int]] = []
+    data = {"summary": {"state": "on", "power": 1}}
+
+    def _check(_coordinator: ZonneplanDataUpdateCoordinator, listener_updates: dict[str, int]) -> None:
+        updates.append(listener_updates)
+        data["summary"]["power"] += 1
+
+    run_refreshes([data, data], _check)
+
+    assert updates[1] == {"state": 1, "power": 1, "any": 1}
+
+
+def test_set_data_value_makes_the_next_refresh_update_all_listeners() -> None:
+    updates: list[dict[str, int]] = []
+
+    def _check(coordinator: ZonneplanDataUpdateCoordinator, listener_updates: dict[str, int]) -> None:
+        updates.append(listener_updates)
+        coordinator.set_data_value("summary.state", "off")
+
+    run_refreshes([{"summary": {"state": "on", "power": 1}}, {"summary": {"state": "on", "power": 1}}], _check)
+
+    assert updates[1] == {"state": 1, "power": 1, "any": 1}
@@ -0,0 +1,51 @@
+from datetime import datetime, time, timedelta
+
+import homeassistant.util.dt as dt_util
+
+from custom_components.zonneplan_one.coordinators.price_refresh_schedule import PriceRefreshSchedule
+
+AMSTERDAM = dt_util.get_time_zone("Europe/Amsterdam")
+
+
+def make_schedule() -> PriceRefreshSchedule:
+    return PriceRefreshSchedule(publication_time=time(13), delivery_day_start=time(0))
+
+
+def test_known_prices_wait_for_next_publication() -> None:
+    schedule = make_schedule()
+    now = datetime(2026, 3, 10, 15, tzinfo=AMSTERDAM)
+
+    interval = schedule.next_interval(now, datetime(2026, 3, 12, tzinfo=AMSTERDAM))
+
+    assert interval == timedelta(hours=6)
+
+
+def test_missing_prices_back_off_until_the_cap() -> None:
+    schedule = make_schedule()
+    now = datetime(2026, 3, 10, 15, tzinfo=AMSTERDAM)
+    horizon = datetime(2026, 3, 11, tzinfo=AMSTERDAM)
+
+    intervals = [schedule.next_interval(now, horizon) for _ in range(6)]
+
+    assert intervals == [timedelta(minutes=minutes) for minutes in (5, 10, 20, 40, 60, 60)]
+
+
+def test_long_run_of_retries_stays_at_the_cap() -> None:
+    schedule = make_schedule()
+    now = datetime(2026, 3, 10, 15, tzinfo=AMSTERDAM)
+
+    for _ in range(1000):
+        interval = schedule.next_interval(now, None)
+
+    assert interval == timedelta(hours=1)
+
+
+def test_retries_reset_once_prices_arrive() -> None:
+    schedule = make_schedule()
+    now = datetime(2026, 3, 10, 15, tzinfo=AMSTERDAM)
+    for _ in range(10):
+        schedule.next_interval(now, None)
+
+    schedule.next_interval(now, datetime(2026, 3, 12, tzinfo=AMSTERDAM))
+
+    assert schedule.next_interval(now, None) == timedelta(minutes=5)
@@ -0,0 +1,114 @@
+from datetime import UTC, datetime, timedelta
+
+import homeassistant.util.dt as dt_util
+import pytest
+
+from custom_components.zonneplan_one.zonneplan_api.models import ZonneplanPriceSlot
+from custom_components.zonneplan_one.zonneplan_api.price_timeline import PriceTimeline, PriceViews
+
+START = datetime(2026, 3, 10, tzinfo=UTC)
+
+
+def make_slots(first_hour: int, prices: list[int | None]) -> list[ZonneplanPriceSlot]:
+    return [
+        ZonneplanPriceSlot(
+            start=START + timedelta(hours=first_hour + index),
+            end=START + timedelta(hours=first_hour + index + 1),
+            price_tax_included=price,
+            price_tax_excluded=price,
+            sustainability_score=0,
+            tariff_group="normal",
+        )
+        for index, price in enumerate(prices)
+    ]
+
+
+def prices(timeline: PriceTimeline) -> list[int | None]:
+    return prices_of(timeline.slots)
+
+
+def prices_of(slots: list[ZonneplanPriceSlot]) -> list[int | None]:
+    return [slot.price_tax_included for slot in slots]
+
+
+def test_slots_are_sorted_by_start() -> None:
+    timeline = PriceTimeline(list(reversed(make_slots(0, [1, 2, 3]))))
+
+    assert prices(timeline) == [1, 2, 3]
+    assert timeline.starts == sorted(timeline.starts)
+    assert timeline.horizon == START + timedelta(hours=3)
+
+
+def test_merge_replaces_the_covered_range_and_keeps_the_rest() -> None:
+    timeline = PriceTimeline(make_slots(0, [1, 2, 3, 4]))
+
+    changed = timeline.merge(make_slots(1, [20, 30]))
+
+    assert changed
+    assert prices(timeline) == [1, 20, 30, 4]
+    assert timeline.starts == [int(slot.start.timestamp()) for slot in timeline.slots]
+    assert timeline.ends == [int(slot.end.timestamp()) for slot in timeline.slots]
+
+
+def test_merge_extends_the_horizon() -> None:
+    timeline = PriceTimeline(make_slots(0, [1, 2]))
+
+    assert timeline.merge(make_slots(1, [2, 3, 4]))
+
+    assert prices(timeline) == [1, 2, 3, 4]
+    assert timeline.horizon == START + timedelta(hours=4)
+
+
+def test_merge_of_known_slots_is_not_a_change() -> None:
+    timeline = PriceTimeline(make_slots(0, [1, 2, 3]))
+
+    assert not timeline.merge(make_slots(0, [1, 2]))
+    assert not timeline.merge([])
+    assert prices(timeline) == [1, 2, 3]
+
+
+def test_evict_removes_the_slots_that_ended() -> None:
+    timeline = PriceTimeline(make_slots(0, [1, 2, 3, 4]))
+
+    assert timeline.evict(START + timedelta(hours=2, minutes=30))
+
+    assert prices(timeline) == [3, 4]
+    assert len(timeline.starts) == len(timeline.ends) == len(timeline)
+
+
+def test_evict_keeps_the_slot_that_is_still_running() -> None:
+    timeline = PriceTimeline(make_slots(0, [1, 2]))
+
+    assert not timeline.evict(START + timedelta(minutes=59))
+    assert prices(timeline) == [1, 2]
+
+
+def test_index_at_and_slots_from() -> None:
+    timeline = PriceTimeline(make_slots(0, [1, 2, 3]))
+    moment = START + timedelta(hours=1, minutes=15)
+
+    assert timeline.index_at(moment) == 1
+    assert timeline.index_at(START - timedelta(minutes=1)) is None
+    assert timeline.index_at(START + timedelta(hours=3)) is None
+    assert [slot.price_tax_included for slot in timeline.slots_from(moment, 5)] == [2, 3]
+
+
+def test_upcoming_starts_at_the_current_or_next_slot() -> None:
+    timeline = PriceTimeline(make_slots(0, [1, 2]) + make_slots(3, [4]))
+
+    assert [slot.price_tax_included for slot in timeline.upcoming(START + timedelta(hours=1, minutes=15))] == [2, 4]
+    assert [slot.price_tax_included for slot in timeline.upcoming(START + timedelta(hours=2, minutes=30))] == [4]
+    assert timeline.upcoming(START + timedelta(hours=4)) == []
+
+
+def test_views_leave_out_the_retained_past_slots(monkeypatch: pytest.MonkeyPatch) -> None:
+    timelines = {"hourly": PriceTimeline(make_slots(0, [1, 2, 3, 4]))}
+    views = PriceViews(timelines, {"forecast": ("hourly", prices_of)})
+    monkeypatch.setattr(dt_util, "utcnow", lambda: START + timedelta(hours=2, minutes=10))
+
+    assert views["forecast"] == [3, 4]
+    # The past slots are kept for the statistics and analytics
+    assert prices(timelines["hourly"]) == [1, 2, 3, 4]
+
+    timelines["hourly"].merge(make_slots(4, [5]))
+    assert views["forecast"] == [3, 4, 5]
@@ -0,0 +1,83 @@
+from datetime import UTC, datetime, timedelta
+
+from custom_components.zonneplan_one.zonneplan_api.models import ZonneplanPriceSlot
+from custom_components.zonneplan_one.zonneplan_api.price_timeline import PriceTimeline
+from custom_components.zonneplan_one.zonneplan_api.price_windows import find_price_windows
+
+START = datetime(2026, 3, 10, tzinfo=UTC)
+
+
+def make_timeline(prices: list[int | None], *, skip_hours: tuple[int, ...] = ()) -> PriceTimeline:
+    return PriceTimeline(
+        [
+            ZonneplanPriceSlot(
+                start=START + timedelta(hours=hour),
+                end=START + timedelta(hours=hour + 1),
+                price_tax_included=price,
+                price_tax_excluded=price,
+                sustainability_score=0,
+                tariff_group="normal",
+            )
+            for hour, price in enumerate(prices)
+            if hour not in skip_hours
+        ]
+    )
+
+
+def window_hours(windows: list) -> list[tuple[int, int]]:
+    return [(int((window.start - START) / timedelta(hours=1)), int((window.end - START) / timedelta(hours=1))) for window in windows]
+
+
+def test_cheapest_window() -> None:
+    timeline = make_timeline([5, 4, 1, 2, 8, 9])
+
+    windows = find_price_windows(timeline, 2)
+
+    assert window_hours(windows) == [(2, 4)]
+    assert windows[0].average_price == 1.5
+    assert windows[0].min_price == 1
+    assert windows[0].max_price == 2
+
+
+def test_most_expensive_window() -> None:
+    timeline = make_timeline([5, 4, 1, 2, 8, 9])
+
+    windows = find_price_windows(timeline, 2, most_expensive=True)
+
+    assert window_hours(windows) == [(4, 6)]
+    assert windows[0].min_price == 8
+    assert windows[0].max_price == 9
+
+
+def test_windows_do_not_overlap() -> None:
+    timeline = make_timeline([1, 1, 1, 9, 9, 2, 2])
+
+    windows = find_price_windows(timeline, 2, 3)
+
+    assert window_hours(windows) == [(0, 2), (5, 7), (2, 4)]
+
+
+def test_missing_prices_and_gaps_break_windows() -> None:
+    timeline = make_timeline([1, None, 1, 9, 9, 1, 1], skip_hours=(5,))
+
+    windows = find_price_windows(timeline, 2)
+
+    assert window_hours(windows) == [(2, 4)]
+
+
+def test_start_and_deadline_limit_the_windows() -> None:
+    timeline = make_timeline([1, 1, 5, 6, 7, 1, 1])
+
+    windows = find_price_windows(
+        timeline,
+        2,
+        start=START + timedelta(hours=1, minutes=30),
+        deadline=START + timedelta(hours=5),
+    )
+
+    assert window_hours(windows) == [(1, 3)]
+
+
+def test_no_windows_when_too_few_slots() -> None:
+    assert find_price_windows(make_timeline([1, 2]), 3) == []
+    assert find_price_windows(make_timeline([]), 1) == []
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from custom_components.zonneplan_one.zonneplan_api import rate_limiter
+from custom_components.zonneplan_one.zonneplan_api.rate_limiter import DEFAULT_RETRY_AFTER, RateLimiter
+
+
+class FakeClock:
+    """Monotonic and wall clock that only move when a request waits."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000 + self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "time", clock.time)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def acquire(limiter: RateLimiter, count: int = 1) -> None:
+    async def _acquire() -> None:
+        for _ in range(count):
+            await limiter.acquire()
+
+    asyncio.run(_acquire())
+
+
+def test_tokens_refill_over_the_window(clock: FakeClock) -> None:
+    limiter = RateLimiter(limit=60, window=60)
+    acquire(limiter, 60)
+    assert limiter.tokens == 0
+
+    clock.now += 30
+
+    assert limiter.tokens == 30
+
+
+def test_acquire_waits_for_a_token_when_the_budget_is_spent(clock: FakeClock) -> None:
+    limiter = RateLimiter(limit=60, window=60)
+    acquire(limiter, 61)
+
+    assert clock.sleeps == [1]
+
+
+@pytest.mark.usefixtures("clock")
+def test_remaining_header_only_lowers_the_budget() -> None:
+    limiter = RateLimiter(limit=60, window=60)
+    acquire(limiter, 10)
+
+    limiter.update(200, {"x-ratelimit-remaining": "55"})
+    assert limiter.tokens == 50
+
+    limiter.update(200, {"x-ratelimit-remaining": "20"})
+    assert limiter.tokens == 20
+
+
+def test_limit_header_sets_the_capacity(clock: FakeClock) -> None:
+    limiter = RateLimiter(limit=60, window=60)
+
+    limiter.update(200, {"x-ratelimit-limit": "30", "x-ratelimit-remaining": "30"})
+    acquire(limiter, 30)
+    clock.now += 60
+
+    assert limiter.tokens == 30
+
+
+def test_too_many_requests_blocks_for_retry_after(clock: FakeClock) -> None:
+    limiter = RateLimiter()
+
+    limiter.update(429, {"Retry-After": "15"})
+    acquire(limiter)
+
+    assert clock.sleeps[0] == 15
+
+
+def test_spent_budget_blocks_until_the_reset(clock: FakeClock) -> None:
+    limiter = RateLimiter()
+
+    limiter.update(200, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(int(clock.time()) + 25)})
+    acquire(limiter)
+
+    assert clock.sleeps[0] == 25
+
+
+def test_too_many_requests_without_headers_uses_the_default(clock: FakeClock) -> None:
+    limiter = RateLimiter()
+
+    limiter.update(429, {})
+    acquire(limiter)
+
+    assert clock.sleeps[0] == DEFAULT_RETRY_AFTER
+
+
+def test_waiting_requests_do_not_block_each_other(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    limiter = RateLimiter()
+    limiter.update(429, {"Retry-After": "60"})
+    sleeping: list[float] = []
+    both_waiting = asyncio.Event()
+    released = asyncio.Event()
+
+    async def _sleep(delay: float) -> None:
+        sleeping.append(delay)
+        if len(sleeping) == 2:
+            both_waiting.set()
+        await released.wait()
+        clock.now += delay
+
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", _sleep)
+
+    async def _run() -> None:
+        waiters = [asyncio.create_task(limiter.acquire()) for _ in range(2)]
+        await asyncio.wait_for(both_waiting.wait(), 1)
+        # Both requests wait at the same time and the budget can still be checked
+        assert limiter.tokens == 0
+        released.set()
+        await asyncio.gather(*waiters)
+
+    asyncio.run(_run())
+
+    assert sleeping == [60, 60]
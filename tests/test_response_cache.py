@@ -0,0 +1,119 @@
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+import pytest
+
+from custom_components.zonneplan_one import response_cache
+from custom_components.zonneplan_one.response_cache import ResponseCache
+
+NOW = datetime(2026, 3, 10, 12, tzinfo=UTC)
+
+
+class FakeStore:
+    """Store that keeps the data in memory and counts the writes."""
+
+    def __init__(self, *_args: Any) -> None:
+        self.data: dict[str, Any] | None = None
+        self.delayed_saves = 0
+        self.saves = 0
+
+    async def async_load(self) -> dict[str, Any] | None:
+        return self.data
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        self.saves += 1
+        self.data = data
+
+    def async_delay_save(self, data_func: Callable[[], dict[str, Any]], _delay: float) -> None:
+        self.delayed_saves += 1
+        self.data = data_func()
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(response_cache, "Store", FakeStore)
+    monkeypatch.setattr(dt_util, "utcnow", clock)
+    return clock
+
+
+def make_cache() -> tuple[ResponseCache, FakeStore]:
+    cache = ResponseCache(None, "entry")
+    return cache, cache._store
+
+
+def test_expired_responses_are_not_loaded(clock: Clock) -> None:
+    cache, store = make_cache()
+    store.data = {
+        "recent": {"etag": "a", "body": "{}", "last_used": (clock.now - timedelta(days=1)).isoformat()},
+        "expired": {"etag": "b", "body": "{}", "last_used": (clock.now - timedelta(days=8)).isoformat()},
+    }
+
+    asyncio.run(cache.async_load())
+
+    assert cache.get("recent") is not None
+    assert cache.get("expired") is None
+
+
+def test_expired_responses_are_evicted_when_storing(clock: Clock) -> None:
+    cache, _ = make_cache()
+    cache.async_set("old", "a", {"value": 1})
+
+    clock.now += timedelta(days=8)
+    cache.async_set("new", "b", {"value": 2})
+
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+
+
+def test_least_recently_used_responses_are_evicted_above_the_maximum(clock: Clock, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(response_cache, "_MAX_RESPONSES", 3)
+    cache, _ = make_cache()
+    for index in range(3):
+        cache.async_set(f"url{index}", "etag", {"value": index})
+        clock.now += timedelta(minutes=1)
+
+    cache.async_touch("url0")
+    cache.async_set("url3", "etag", {"value": 3})
+
+    assert [url for url in ("url0", "url1", "url2", "url3") if cache.get(url)] == ["url0", "url2", "url3"]
+
+
+def test_usage_is_only_written_on_save(clock: Clock) -> None:
+    cache, store = make_cache()
+    cache.async_set("url", "a", {"value": 1})
+    assert store.delayed_saves == 1
+
+    clock.now += timedelta(minutes=5)
+    cache.async_touch("url")
+    cache.async_set("url", "b", {"value": 1})
+
+    assert store.delayed_saves == 1
+    asyncio.run(cache.async_save())
+    assert store.saves == 1
+    assert store.data["url"] == {"etag": "b", "body": '{"value":1}', "last_used": clock.now.isoformat()}
+
+    asyncio.run(cache.async_save())
+    assert store.saves == 1
+
+
+def test_changed_body_is_written(clock: Clock) -> None:
+    cache, store = make_cache()
+    cache.async_set("url", "a", {"value": 1})
+
+    clock.now += timedelta(minutes=5)
+    cache.async_set("url", "b", {"value": 2})
+
+    assert store.delayed_saves == 2
+    assert cache.get("url").data() == {"value": 2}
@@ -0,0 +1,50 @@
+from custom_components.zonneplan_one.response_diagnostics import DEFAULT_MAX_BYTES, ResponseDiagnostics
+
+
+def test_endpoint_keeps_its_most_recent_responses() -> None:
+    diagnostics = ResponseDiagnostics(max_responses_per_endpoint=2)
+    for day in (1, 2, 3):
+        diagnostics.add(f"charts?date={day}", b"{}")
+    diagnostics.add("summary", b"{}")
+
+    assert list(diagnostics.as_dict()) == ["charts?date=2", "charts?date=3", "summary"]
+
+
+def test_repeated_path_is_stored_once() -> None:
+    diagnostics = ResponseDiagnostics()
+    diagnostics.add("summary", b'{"value": 1}')
+    diagnostics.add("summary", b'{"value": 2}')
+
+    assert diagnostics.as_dict() == {"summary": {"value": 2}}
+    assert diagnostics.size == len(b'{"value": 2}')
+
+
+def test_endpoint_limits_override_the_default() -> None:
+    diagnostics = ResponseDiagnostics(max_responses_per_endpoint=3, endpoint_limits={"/gas/charts/hours": 1})
+    for day in (1, 2):
+        diagnostics.add(f"connections/a/gas/charts/hours?date={day}", b"{}")
+        diagnostics.add(f"connections/a/summary?date={day}", b"{}")
+
+    assert list(diagnostics.as_dict()) == [
+        "connections/a/summary?date=1",
+        "connections/a/gas/charts/hours?date=2",
+        "connections/a/summary?date=2",
+    ]
+
+
+def test_oldest_responses_are_dropped_above_the_byte_budget() -> None:
+    diagnostics = ResponseDiagnostics()
+    # Four of these fill the budget exactly
+    body = b'"' + b"x" * (DEFAULT_MAX_BYTES // 4 - 2) + b'"'
+    for endpoint in ("a", "b", "c", "d", "e"):
+        diagnostics.add(endpoint, body)
+
+    assert list(diagnostics.as_dict()) == ["b", "c", "d", "e"]
+    assert diagnostics.size == DEFAULT_MAX_BYTES
+
+
+def test_single_response_above_the_byte_budget_is_kept() -> None:
+    diagnostics = ResponseDiagnostics(max_bytes=10)
+    diagnostics.add("a", b'"' + b"x" * 20 + b'"')
+
+    assert list(diagnostics.as_dict()) == ["a"]
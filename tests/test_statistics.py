@@ -0,0 +1,384 @@
+import asyncio
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import homeassistant.util.dt as dt_util
+import pytest
+from homeassistant.components.recorder.models import StatisticData
+
+from custom_components.zonneplan_one import backfill_checkpoints
+from custom_components.zonneplan_one.api import ZonneplanApiError, ZonneplanRateLimitError
+from custom_components.zonneplan_one.backfill_checkpoints import (
+    BACKFILL_FAILED,
+    BACKFILL_PAUSED,
+    BackfillCheckpoint,
+    BackfillCheckpoints,
+    ChannelCheckpoint,
+)
+from custom_components.zonneplan_one.coordinators import statistics
+from custom_components.zonneplan_one.coordinators.statistics import (
+    ElectricityStatisticsService,
+    GasStatisticsService,
+    StatisticBaselines,
+    StatisticChannelState,
+)
+
+TIME_ZONE = dt_util.get_time_zone("Europe/Amsterdam")
+FIRST_DAY = datetime(2025, 3, 1, tzinfo=TIME_ZONE)
+
+
+class FakeHass:
+    def async_create_task(self, target: Coroutine[Any, Any, Any], name: str) -> asyncio.Task:
+        return asyncio.create_task(target, name=name)
+
+
+class FakeStore:
+    def __init__(self, *_args: Any) -> None:
+        self.data: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        return self.data
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+    def async_delay_save(self, data_func: Callable[[], dict[str, Any]], _delay: float) -> None:
+        self.data = data_func()
+
+
+class FakeApi:
+    """
+    API that answers every day with one measurement.
+
+    The requests are rate limited while `limited`, days in `missing` have no payload,
+    and the requests wait for `release` when it is set.
+    """
+
+    def __init__(self) -> None:
+        self.rate_limit_tokens = 100.0
+        self.limited = False
+        self.missing: set[str] = set()
+        self.release: asyncio.Event | None = None
+        self.requests: list[str] = []
+
+    async def async_get(self, _connection_uuid: str, path: str, *, ignore_etag: bool = False) -> dict[str, Any] | None:
+        assert ignore_etag
+        date = path.rsplit("=", 1)[1]
+        self.requests.append(date)
+        if self.release:
+            await self.release.wait()
+        if self.limited:
+            raise ZonneplanRateLimitError(MagicMock(), (), status=429, retry_after=10)
+        if date in self.missing:
+            return None
+
+        return {"measurement_groups": [{"type": "hours", "measurements": [{"measured_at": f"{date}T12:00:00+01:00", "value": 1000}]}]}
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    sleeps: list[float] = []
+    sleep = asyncio.sleep
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(statistics.asyncio, "sleep", _sleep)
+    return sleeps
+
+
+@pytest.fixture
+def checkpoints(monkeypatch: pytest.MonkeyPatch) -> BackfillCheckpoints:
+    """Checkpoints kept in memory, for backfills that run until today, four days after the first day."""
+    monkeypatch.setattr(backfill_checkpoints, "Store", FakeStore)
+    monkeypatch.setattr(statistics.persistent_notification, "create", lambda *_args: None)
+    monkeypatch.setattr(statistics.dt_util, "now", lambda _time_zone: FIRST_DAY + timedelta(days=4, hours=15))
+    return BackfillCheckpoints(None, "entry")
+
+
+def make_service(
+    monkeypatch: pytest.MonkeyPatch, checkpoints: BackfillCheckpoints | None = None
+) -> tuple[GasStatisticsService, FakeApi, list[int]]:
+    api = FakeApi()
+    service = GasStatisticsService(FakeHass(), api, "connection", "zonneplan_one:gas", backfill_checkpoints=checkpoints)
+    flushed: list[int] = []
+
+    def _flush_pending(states: dict[str, StatisticChannelState]) -> None:
+        flushed.append(len(states["gas"].pending))
+        states["gas"].pending = []
+
+    monkeypatch.setattr(service, "_flush_pending", _flush_pending)
+    return service, api, flushed
+
+
+def make_states(service: GasStatisticsService) -> dict[str, StatisticChannelState]:
+    return {
+        config.key: StatisticChannelState(config=config, last_time=FIRST_DAY - timedelta(hours=1), total_sum=0, last_state_value=None)
+        for config in service.channel_configs
+    }
+
+
+def test_backfill_ingests_the_days_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, _, flushed = make_service(monkeypatch)
+    states = make_states(service)
+
+    asyncio.run(service._backfill_history(states, FIRST_DAY + timedelta(days=6), retry_on_max_connections=True, first_day=FIRST_DAY))
+
+    assert flushed == [6]
+    assert states["gas"].total_sum == 6
+    assert states["gas"].last_time == FIRST_DAY + timedelta(days=5, hours=12)
+
+
+def test_rate_limited_burst_waits_once_and_refetches_the_prefetched_days(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, api, flushed = make_service(monkeypatch)
+    states = make_states(service)
+    api.limited = True
+    sleeps: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+        api.limited = False
+
+    monkeypatch.setattr(statistics.asyncio, "sleep", _sleep)
+
+    asyncio.run(service._backfill_history(states, FIRST_DAY + timedelta(days=6), retry_on_max_connections=True, first_day=FIRST_DAY))
+
+    # The four prefetched days hit the limit together, that is one wait and not a failure per day
+    assert sleeps == [30]
+    assert api.requests[:4] == ["2025-03-01", "2025-03-02", "2025-03-03", "2025-03-04"]
+    assert sorted(api.requests[4:]) == [f"2025-03-0{day}" for day in range(1, 7)]
+    assert flushed == [6]
+    assert states["gas"].total_sum == 6
+
+
+@pytest.mark.usefixtures("sleeps")
+def test_backfill_gives_up_after_the_maximum_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, api, flushed = make_service(monkeypatch)
+    states = make_states(service)
+    api.limited = True
+
+    with pytest.raises(ZonneplanRateLimitError):
+        asyncio.run(service._backfill_history(states, FIRST_DAY + timedelta(days=6), retry_on_max_connections=True, first_day=FIRST_DAY))
+
+    # Every attempt sends one burst of the concurrent days
+    assert len(api.requests) == 3 * 4
+    assert flushed == []
+
+
+def test_measurements_without_values_are_skipped_per_channel() -> None:
+    service = ElectricityStatisticsService(FakeHass(), FakeApi(), "connection", "zonneplan_one:delivered", "zonneplan_one:produced")
+    measurements = [
+        {"date": "2025-03-01T10:00:00+01:00", "values": {"d": 100, "p": 200}},
+        {"date": "2025-03-01T11:00:00+01:00", "values": None},
+        {"date": "2025-03-01T12:00:00+01:00", "values": {"d": None, "p": 300}},
+        {"date": "2025-03-01T13:00:00+01:00"},
+    ]
+
+    columns = service._measurement_columns(measurements)
+
+    assert columns["delivered"][2] == [0.1, None, None, None]
+    assert columns["produced"][2] == [-0.2, None, -0.3, None]
+    assert len(columns["delivered"][0]) == 4
+
+
+def make_checkpoint(checkpoints: BackfillCheckpoints, service: GasStatisticsService) -> None:
+    checkpoints.async_set(
+        service.backfill_id,
+        BackfillCheckpoint(
+            start_date=FIRST_DAY,
+            next_day=FIRST_DAY,
+            channels={"gas": ChannelCheckpoint(last_time=FIRST_DAY - timedelta(hours=1), total_sum=10, last_state_value=None)},
+        ),
+    )
+
+
+def test_failed_backfill_keeps_its_progress_and_resumes(monkeypatch: pytest.MonkeyPatch, checkpoints: BackfillCheckpoints) -> None:
+    service, api, flushed = make_service(monkeypatch, checkpoints)
+    make_checkpoint(checkpoints, service)
+    api.missing = {"2025-03-03"}
+
+    async def _run() -> None:
+        with pytest.raises(ZonneplanApiError):
+            await service.async_resume_backfill()
+
+        checkpoint = checkpoints.get(service.backfill_id)
+        assert checkpoint.status == BACKFILL_FAILED
+        assert checkpoint.next_day == FIRST_DAY + timedelta(days=2)
+        assert checkpoint.channels["gas"].total_sum == 12
+
+        # A failed backfill is resumed on the next start, from the first day that wasn't written
+        api.missing.clear()
+        api.requests.clear()
+        assert await service.async_resume_backfill(include_paused=False)
+
+    asyncio.run(_run())
+
+    assert api.requests == ["2025-03-03", "2025-03-04", "2025-03-05"]
+    assert flushed == [2, 2, 1]
+    assert checkpoints.get(service.backfill_id) is None
+
+
+def test_paused_backfill_is_only_resumed_on_request(monkeypatch: pytest.MonkeyPatch, checkpoints: BackfillCheckpoints) -> None:
+    service, api, flushed = make_service(monkeypatch, checkpoints)
+    make_checkpoint(checkpoints, service)
+    api.release = asyncio.Event()
+
+    async def _run() -> None:
+        backfill = asyncio.create_task(service.async_resume_backfill())
+        await asyncio.sleep(0)
+        assert await service.async_pause_backfill()
+        assert backfill.cancelled()
+
+        checkpoint = checkpoints.get(service.backfill_id)
+        assert checkpoint.status == BACKFILL_PAUSED
+        assert checkpoint.next_day == FIRST_DAY
+
+        assert not await service.async_resume_backfill(include_paused=False)
+        api.release.set()
+        assert await service.async_resume_backfill()
+
+    asyncio.run(_run())
+
+    assert flushed == [4, 1]
+    assert checkpoints.get(service.backfill_id) is None
+
+
+def test_checkpoints_are_stored_between_restarts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(backfill_checkpoints, "Store", FakeStore)
+    checkpoints = BackfillCheckpoints(None, "entry")
+    checkpoints.async_set(
+        "zonneplan_one:gas",
+        BackfillCheckpoint(
+            start_date=FIRST_DAY,
+            next_day=FIRST_DAY + timedelta(days=2),
+            status=BACKFILL_PAUSED,
+            channels={"gas": ChannelCheckpoint(last_time=FIRST_DAY + timedelta(days=1, hours=23), total_sum=2.5, last_state_value=0.5)},
+        ),
+    )
+    restarted = BackfillCheckpoints(None, "entry")
+    restarted._store.data = {**checkpoints._store.data, "invalid": {"start_date": FIRST_DAY.isoformat()}}
+
+    asyncio.run(restarted.async_load())
+
+    assert restarted.get("zonneplan_one:gas") == checkpoints.get("zonneplan_one:gas")
+    assert restarted.get("invalid") is None
+
+
+def backfill_five_days(service: GasStatisticsService, on_flushed: Callable[[datetime], None] | None = None) -> None:
+    states = make_states(service)
+    asyncio.run(
+        service._backfill_history(
+            states, FIRST_DAY + timedelta(days=5), first_day=FIRST_DAY, retry_on_max_connections=True, on_flushed=on_flushed
+        )
+    )
+
+
+def test_backfill_writes_batches_of_days(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(statistics, "_BACKFILL_FLUSH_DAYS", 2)
+    service, _, flushed = make_service(monkeypatch)
+    written: list[datetime] = []
+
+    backfill_five_days(service, written.append)
+
+    # Every batch reports the first day that isn't written yet, the last batch is written when the backfill stops
+    assert flushed == [2, 2, 1]
+    assert written == [FIRST_DAY + timedelta(days=2), FIRST_DAY + timedelta(days=4), FIRST_DAY + timedelta(days=5)]
+
+
+def test_backfill_writes_batches_of_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(statistics, "_BACKFILL_FLUSH_ROWS", 3)
+    service, _, flushed = make_service(monkeypatch)
+
+    backfill_five_days(service)
+
+    assert flushed == [3, 2]
+
+
+class FakeRecorder:
+    """Recorder with one statistic per id an hour before the first day, and one two hours into every day."""
+
+    def __init__(self) -> None:
+        self.jobs: list[tuple[str, ...]] = []
+
+    async def async_add_executor_job(self, target: Callable[..., Any], *args: Any) -> Any:
+        if target is statistics._get_last_statistic_rows:
+            statistic_ids = args[1]
+            self.jobs.append(("last", *statistic_ids))
+            start = (FIRST_DAY - timedelta(hours=1)).timestamp()
+            return {statistic_id: {"start": start, "end": start + 3600, "sum": 10.0, "state": 1.0} for statistic_id in statistic_ids}
+
+        start_of_day, statistic_ids = args[1], args[3]
+        self.jobs.append(("day", *sorted(statistic_ids)))
+        start = start_of_day.timestamp() + 7200
+        return {statistic_id: [{"start": start, "end": start + 3600, "sum": 20.0, "state": 2.0}] for statistic_id in statistic_ids}
+
+
+@pytest.fixture
+def recorder(monkeypatch: pytest.MonkeyPatch) -> FakeRecorder:
+    recorder = FakeRecorder()
+    monkeypatch.setattr(statistics, "get_instance", lambda _hass: recorder)
+    return recorder
+
+
+def written_rows(*hours: int, total_sum: float = 30.0) -> list[StatisticData]:
+    return [StatisticData(start=FIRST_DAY + timedelta(hours=hour), state=3.0, sum=total_sum + hour) for hour in hours]
+
+
+def test_baselines_are_loaded_once_for_all_statistics(recorder: FakeRecorder) -> None:
+    baselines = StatisticBaselines(None)
+    baselines.register(["zonneplan_one:delivered", "zonneplan_one:produced"])
+
+    async def _run() -> None:
+        assert (await baselines.async_get("zonneplan_one:delivered"))["sum"] == 10.0
+        assert (await baselines.async_get("zonneplan_one:produced"))["sum"] == 10.0
+
+    asyncio.run(_run())
+
+    assert recorder.jobs == [("last", "zonneplan_one:delivered", "zonneplan_one:produced")]
+
+
+def test_baselines_follow_the_written_statistics(recorder: FakeRecorder) -> None:
+    baselines = StatisticBaselines(None)
+    baselines.register(["zonneplan_one:gas"])
+
+    async def _run() -> None:
+        await baselines.async_get("zonneplan_one:gas")
+        baselines.async_update("zonneplan_one:gas", written_rows(0, 1))
+        assert (await baselines.async_get("zonneplan_one:gas"))["sum"] == 31.0
+
+        baselines.async_update("zonneplan_one:gas", written_rows(2, 3))
+        last = await baselines.async_get("zonneplan_one:gas")
+        assert last["sum"] == 33.0
+        assert last["start"] == (FIRST_DAY + timedelta(hours=3)).timestamp()
+
+        # Rewritten older statistics don't replace a more recent baseline
+        baselines.async_update("zonneplan_one:gas", written_rows(1, total_sum=0))
+        assert (await baselines.async_get("zonneplan_one:gas"))["sum"] == 33.0
+
+    asyncio.run(_run())
+
+    assert recorder.jobs == [("last", "zonneplan_one:gas")]
+
+
+def test_day_starts_are_cached_until_an_earlier_statistic_is_written(recorder: FakeRecorder) -> None:
+    baselines = StatisticBaselines(None)
+    baselines.register(["zonneplan_one:gas"])
+    start_of_day = FIRST_DAY + timedelta(hours=1)
+
+    async def _run() -> None:
+        assert (await baselines.async_get_day_start("zonneplan_one:gas", start_of_day))["sum"] == 20.0
+
+        # A rewrite of the first statistic of the day updates it in place, statistics before the day are ignored
+        baselines.async_update("zonneplan_one:gas", written_rows(0, 3, 4))
+        assert (await baselines.async_get_day_start("zonneplan_one:gas", start_of_day))["sum"] == 33.0
+        assert len(recorder.jobs) == 1
+
+        # A new statistic before the known first statistic of the day makes it reload
+        baselines.async_update("zonneplan_one:gas", written_rows(2))
+        await baselines.async_get_day_start("zonneplan_one:gas", start_of_day)
+        assert len(recorder.jobs) == 2
+
+    asyncio.run(_run())
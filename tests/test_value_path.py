@@ -0,0 +1,27 @@
+from custom_components.zonneplan_one.coordinators.value_path import ValuePath
+
+
+def test_get_follows_dict_keys_and_list_indexes() -> None:
+    data = {"contracts": [{"meta": {"state": 1}}, {"meta": {"state": 2}}]}
+
+    assert ValuePath("contracts.0.meta.state").get(data) == 1
+    assert ValuePath("contracts.-1.meta.state").get(data) == 2
+
+
+def test_missing_parts_return_none() -> None:
+    data = {"contracts": [{"meta": None}]}
+
+    for path in ("contracts.1.meta", "contracts.0.meta.state", "summary.state", "contracts.key"):
+        assert ValuePath(path).get(data) is None
+        assert ValuePath(path).lookup(data) is None
+
+
+def test_set_replaces_existing_parents_only() -> None:
+    data = {"contracts": [{"meta": {"state": 1}}]}
+
+    ValuePath("contracts.0.meta.state").set(data, 5)
+    ValuePath("contracts.1.meta.state").set(data, 6)
+    ValuePath("contracts.0.missing.state").set(data, 7)
+    ValuePath("contracts.3").set(data, 8)
+
+    assert data == {"contracts": [{"meta": {"state": 5}}]}